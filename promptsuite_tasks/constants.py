@@ -14,6 +14,43 @@ LM_DEFAULT_PLATFORM = "OpenAI"
 LM_DEFAULT_MODEL_NAME = "gpt-4o-mini"
 LM_DEFAULT_TEMPERATURE = 0.0
 LM_DEFAULT_PARALLEL_WORKERS = 6  # Number of parallel workers for model calls (1 = sequential)
+LM_ENGINES = ["thread", "async", "batch"]  # Execution engines for model calls
+LM_DEFAULT_ENGINE = "thread"
+LM_DEFAULT_ASYNC_CONCURRENCY = 256  # Maximum in-flight requests for the async engine
+LM_DEFAULT_MAX_RETRIES = 6  # Retries for rate-limited requests
+LM_DEFAULT_RETRY_SLEEP = 60  # Maximum backoff in seconds between retries (retry-after hints are always honored)
+
+# Rate limiting (see execution/rate_limiter.py)
+LM_RATE_LIMIT_BASE_BACKOFF = 1.0  # Seconds; doubled on every retry (with full jitter)
+LM_RATE_LIMIT_MIN_CONCURRENCY = 1  # Floor of the adaptive concurrency limit
+LM_RATE_LIMIT_MAX_CONCURRENCY = 1024  # Ceiling of the adaptive concurrency limit
+LM_RATE_LIMIT_CHARS_PER_TOKEN = 4  # Used to estimate prompt tokens for tokens-per-minute quotas
+
+# Response cache for deterministic (temperature 0) runs (see execution/response_cache.py)
+LM_RESPONSE_CACHE_FILENAME = "model_responses.sqlite3"
+LM_RESPONSE_CACHE_MAX_SIZE_BYTES = 2 * 1024 * 1024 * 1024  # Least recently used entries are evicted above this size
+
+# Provider Batch API mode (--engine batch, see execution/batch_api.py)
+LM_BATCH_API_PLATFORMS = ["OpenAI"]  # Platforms with a supported Batch API
+LM_BATCH_API_ENDPOINT = "/v1/chat/completions"
+LM_BATCH_API_COMPLETION_WINDOW = "24h"
+LM_BATCH_API_MAX_REQUESTS = 50000  # Requests per submitted batch (provider limit)
+LM_BATCH_API_POLL_INTERVAL = 30  # Seconds between batch status checks
+
+# Deferred metric computation (--metric_workers, see execution/metric_stage.py)
+LM_DEFAULT_METRIC_WORKERS = 0  # Scoring processes (0 = score each response on the worker that requested it)
+LM_METRIC_BATCH_SIZE = 64  # Responses sent to a metric worker at a time
+
+# Code execution sandbox for HumanEval evaluation (see execution/code_sandbox.py)
+CODE_EXEC_DEFAULT_WORKERS = 8  # Completions executing at the same time
+CODE_EXEC_TIMEOUT = 3.0  # Seconds per completion (human_eval default) before its process is killed
+CODE_EXEC_MEMORY_LIMIT_MB = 4096  # Address space limit per completion (0 = unlimited)
+CODE_EXEC_CACHE_FILENAME = "code_execution_results.sqlite3"  # Results by (task_id, completion), see execution/execution_cache.py
+CODE_EXEC_CACHE_MAX_SIZE_BYTES = 256 * 1024 * 1024  # Least recently used entries are evicted above this size
+
+# Evaluation metrics (see execution/shared_metrics.py)
+METRICS_DIR_ENV_VAR = "PROMPTSUITE_METRICS_DIR"  # Local copies of `evaluate` metric scripts (<dir>/<metric name>)
+METRIC_LOAD_RETRY_INTERVAL = 30.0  # Seconds a failed metric load is reported without retrying
 
 # Platform options
 PLATFORMS = {
@@ -14,7 +14,7 @@ import sys
 current_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(current_dir))
 
-from .shared_metrics import calculate_bertscore_metrics
+from .shared_metrics import calculate_bertscore_metrics, calculate_text_generation_metrics_batch
 
 
 def add_bertscore_to_csv(csv_path: Path, prediction_col: str = 'model_response', 
@@ -51,6 +51,46 @@ def add_bertscore_to_csv(csv_path: Path, prediction_col: str = 'model_response',
     print("Done!")
 
 
+def add_text_generation_metrics_to_csv(csv_path: Path, prediction_col: str = 'model_response',
+                                       reference_col: str = 'gold_answer') -> None:
+    """
+    Add (or rescore) BLEU, ROUGE, and SacreBLEU columns of an existing CSV file.
+
+    All rows are scored in one batched call, and the corpus-level scores are printed.
+
+    Args:
+        csv_path: Path to the CSV file
+        prediction_col: Column name containing model predictions
+        reference_col: Column name containing reference texts
+    """
+    print(f"Loading: {csv_path}")
+    df = pd.read_csv(csv_path)
+
+    # Check required columns
+    if prediction_col not in df.columns or reference_col not in df.columns:
+        raise ValueError(f"CSV must contain '{prediction_col}' and '{reference_col}' columns")
+
+    # Handle empty values
+    predictions = df[prediction_col].fillna("").astype(str).tolist()
+    references = df[reference_col].fillna("").astype(str).tolist()
+
+    print(f"Calculating BLEU, ROUGE, and SacreBLEU for {len(df)} rows...")
+    row_scores, corpus_scores = calculate_text_generation_metrics_batch(predictions, references)
+
+    # Add the metric columns
+    for metric_name, scores in row_scores.items():
+        df[metric_name] = scores
+
+    print("Corpus scores:")
+    for metric_name, score in corpus_scores.items():
+        print(f"  {metric_name}: {score:.4f}")
+
+    # Overwrite the original CSV
+    print(f"Updating original file with {', '.join(row_scores)} columns: {csv_path}")
+    df.to_csv(csv_path, index=False)
+    print("Done!")
+
+
 def add_metric_to_csv(csv_path: Path, metric_function: Callable, metric_name: str, 
                      prediction_col: str = 'model_response', reference_col: str = 'gold_answer',
                      **kwargs) -> None:
@@ -93,8 +133,8 @@ def main():
     parser = argparse.ArgumentParser(description="Add metrics to existing CSV result files")
     csv_path = Path("results/gpt_4o_mini/summarization_cnn_dailymail_variations.csv")
     parser.add_argument("csv_path", help="Path to the CSV file", default=csv_path, type=str)
-    parser.add_argument("--metric", choices=["bertscore"], default="bertscore",
-                       help="Metric to add (default: bertscore)")
+    parser.add_argument("--metric", choices=["bertscore", "text_generation"], default="bertscore",
+                       help="Metric to add: 'bertscore' or 'text_generation' (BLEU, ROUGE, SacreBLEU) (default: bertscore)")
     parser.add_argument("--prediction_col", default="model_response",
                        help="Column name containing model predictions (default: model_response)")
     parser.add_argument("--reference_col", default="gold_answer",
@@ -116,6 +156,12 @@ def main():
             reference_col=args.reference_col,
             lang=args.lang
         )
+    elif args.metric == "text_generation":
+        add_text_generation_metrics_to_csv(
+            csv_path=csv_path,
+            prediction_col=args.prediction_col,
+            reference_col=args.reference_col
+        )
     else:
         print(f"Error: Unsupported metric: {args.metric}")
 
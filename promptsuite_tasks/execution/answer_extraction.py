@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Answer extraction for multiple-choice (GPQA) and numeric (GSM8K-style math) responses.
+
+All patterns are compiled once at import time, and choice labels are normalized through lookup
+tables (letter -> number, roman numeral -> number), so scoring a response does no per-call
+imports, pattern compilation or helper definitions.
+"""
+
+import re
+from typing import Optional
+
+# Numeric answers
+_GSM8K_ANSWER_PATTERN = re.compile(r"#### (\-?[0-9\.\,]+)")
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+# Last run of digits, dots and minus signs that contains a digit. Numbers never span two runs, so the
+# last number of a text is the last number of this run: the text is scanned once from the end
+# instead of collecting every number with findall.
+_LAST_NUMBER_RUN_PATTERN = re.compile(r'.*(?<![\d.-])([\d.-]*\d[\d.-]*)', re.DOTALL)
+
+# Final answer lines ("Answer: B", or "Answer:" followed by the answer on the next line)
+_ANSWER_LINE_PATTERN = re.compile(r'^(Final answer|Answer|Choice)[:.\s-]+(.+)$', re.IGNORECASE)
+_ANSWER_PREFIX_LINE_PATTERN = re.compile(r'^(Final answer|Answer|Choice)[:.\s-]*$', re.IGNORECASE)
+
+# Emphasized answers (bold, underline, inline code), tried in this order; the marker is a cheap
+# substring check before running the pattern
+_EMPHASIS_PATTERNS = (
+    ('**', re.compile(r'\*\*([^*]+)\*\*')),
+    ('__', re.compile(r'__([^_]+)__')),
+    ('`', re.compile(r'`([^`]+)`')),
+)
+_EMPHASIZED_ANSWER_PATTERN = re.compile(r'^(Answer|Choice)[:.\s-]*([a-dA-D1-4IVXivx]+[.:]?\s*.+)', re.IGNORECASE)
+_EMPHASIZED_PREFIX_PATTERN = re.compile(r'^(Answer|Choice)[:.\s-]*$', re.IGNORECASE)
+_EMPHASIS_MAX_LENGTH = 100
+# Emphasized chemistry terms in GPQA explanations that are not the answer
+_EMPHASIS_SKIP_WORDS = ('dimethyl', 'sulfane', 'methane', 'reagent', 'chlorochromate')
+
+# Lines starting with a choice label (letter, number or roman numeral)
+_CHOICE_LINE_PATTERN = re.compile(r'^([a-dA-D1-4IVXivx]+)[.:]\s*(.+)')
+_BARE_CHOICE_LINE_PATTERN = re.compile(r'^([a-dA-D1-4IVXivx]+)[.]?\s*$')
+_BARE_CHOICE_MAX_LENGTH = 5
+
+# Normalized choice labels: a roman numeral or a letter, optionally followed by digits
+_CHOICE_LABEL_PATTERN = re.compile(r'^(?:([ivx]+)(\d*)|([a-d])([0-9]*))$')
+_ROMAN_VALUES = {'i': 1, 'v': 5, 'x': 10}
+_LETTER_NUMBERS = {'a': '1', 'b': '2', 'c': '3', 'd': '4'}
+
+
+def extract_gsm8k_answer(text: str) -> Optional[float]:
+    """Number of the first '#### <number>' in text (None if missing or not a number)."""
+    match = _GSM8K_ANSWER_PATTERN.search(text)
+    if match:
+        try:
+            return float(match.group(1).replace(',', ''))
+        except ValueError:
+            pass
+    return None
+
+
+def extract_numeric_answer(response: str) -> Optional[float]:
+    """Numeric answer of a model response: its '#### <number>' if any, else its last number."""
+    value = extract_gsm8k_answer(response)
+    if value is not None:
+        return value
+
+    run = _LAST_NUMBER_RUN_PATTERN.match(response)
+    if run:
+        try:
+            return float(_NUMBER_PATTERN.findall(run.group(1))[-1])
+        except ValueError:
+            pass
+    return None
+
+
+def extract_final_answer_from_response(response: str) -> Optional[str]:
+    """
+    Extract the final answer of a multiple-choice response.
+
+    Tries, in order: an 'Answer:'/'Final answer:'/'Choice:' line (last one wins) or such a prefix
+    line followed by the answer, an emphasized (bold/underline/code) answer, and a line starting
+    with a choice label.
+
+    Returns:
+        str: The extracted answer, or None if none was found
+    """
+    response = response.strip()
+    lines = [line.strip() for line in response.split('\n') if line.strip()]
+
+    # 1. A line starting with Final answer:, Answer: or Choice:
+    for line in reversed(lines):
+        match = _ANSWER_LINE_PATTERN.match(line)
+        if match:
+            return match.group(2).strip()
+
+    # 1b. A line with only Answer: or Choice:, and the answer on the next line
+    for i, line in enumerate(lines):
+        if _ANSWER_PREFIX_LINE_PATTERN.match(line):
+            if i + 1 < len(lines):
+                return lines[i + 1].strip()
+
+    # 2. An emphasized answer (bold, else underline, else inline code)
+    emphasized = []
+    for marker, pattern in _EMPHASIS_PATTERNS:
+        if marker in response:
+            emphasized = pattern.findall(response)
+            if emphasized:
+                break
+    for candidate in reversed(emphasized):
+        candidate = candidate.strip()
+        # Emphasized 'Answer: B. ...': keep the part after the prefix
+        match = _EMPHASIZED_ANSWER_PATTERN.match(candidate)
+        if match:
+            return match.group(2).strip()
+        if _EMPHASIZED_PREFIX_PATTERN.match(candidate):
+            continue  # Only a prefix, not an answer
+        if len(candidate) > _EMPHASIS_MAX_LENGTH:
+            continue
+        candidate_lower = candidate.lower()
+        if any(word in candidate_lower for word in _EMPHASIS_SKIP_WORDS):
+            continue
+        return candidate
+
+    # 3. A line starting with a letter/number/roman choice label (not normalized)
+    for line in reversed(lines):
+        match = _CHOICE_LINE_PATTERN.match(line)
+        if match:
+            return f'{match.group(1)}. {match.group(2).strip()}'
+        # Also a bare choice label
+        match = _BARE_CHOICE_LINE_PATTERN.match(line)
+        if match and len(line) <= _BARE_CHOICE_MAX_LENGTH:
+            return f'{match.group(1)}.'
+
+    return None
+
+
+def roman_to_int(roman: str) -> int:
+    """Value of a lowercase roman numeral made of i, v and x (other characters count as 0)."""
+    result = 0
+    prev_value = 0
+    for char in reversed(roman):
+        value = _ROMAN_VALUES.get(char, 0)
+        if value < prev_value:
+            result -= value
+        else:
+            result += value
+        prev_value = value
+    return result
+
+
+def normalize_choice_answer(answer: str) -> str:
+    """
+    Normalize a choice answer for comparison.
+
+    Lowercases and removes dots and whitespace, then maps a leading roman numeral (i, ii, ...) or
+    letter (a-d) label to its number, so 'B.', 'b', 'ii' and '2' all normalize to '2'.
+    """
+    if not answer:
+        return ""
+    normalized = ''.join(answer.strip().lower().replace('.', '').split())
+    match = _CHOICE_LABEL_PATTERN.match(normalized)
+    if match:
+        roman, roman_rest, letter, letter_rest = match.groups()
+        if roman:
+            return str(roman_to_int(roman)) + roman_rest
+        return _LETTER_NUMBERS[letter] + letter_rest
+    return normalized
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Provider Batch API mode for batch runners (--engine batch).
+
+Instead of one synchronous chat-completion request per variation, the pending runs of a file are
+written as batch-request JSONL, uploaded and processed by the provider's Batch API (cheaper, with
+its own quota). The runner polls until the batches finish and then scores the responses through
+the same metrics_function / create_result_entry path as synchronous runs.
+
+The submitted batch ids are kept in a state file next to the results, so an interrupted run
+resumes polling the same batches instead of submitting them again.
+
+Batch mode uses the OpenAI Batch API; point OPENAI_BASE_URL at any compatible server (for example
+scripts/stub_batch_api_server.py for local testing).
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from promptsuite.core.exceptions import APIKeyMissingError
+from promptsuite.shared import model_client
+from promptsuite_tasks.constants import (
+    LM_BATCH_API_PLATFORMS, LM_BATCH_API_ENDPOINT, LM_BATCH_API_COMPLETION_WINDOW,
+    LM_BATCH_API_MAX_REQUESTS, LM_BATCH_API_POLL_INTERVAL
+)
+from promptsuite_tasks.execution.response_cache import ResponseCache
+
+# Batch statuses after which the batch will not change anymore
+TERMINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def get_batch_state_path(output_file: str) -> Path:
+    """State file with the submitted batch ids of a results file (results.json -> results.batch.json)."""
+    return Path(output_file).with_suffix('.batch.json')
+
+
+def build_batch_request(variation: Dict[str, Any], model_name: str, max_tokens: Optional[int],
+                        temperature: float) -> Dict[str, Any]:
+    """One line of a batch input file; custom_id is the unique_run_id of the run."""
+    body = {
+        "model": model_name,
+        "messages": variation.get('conversation', []),
+        "temperature": temperature,
+    }
+    if max_tokens is not None:
+        body["max_tokens"] = max_tokens
+    return {
+        "custom_id": variation['unique_run_id'],
+        "method": "POST",
+        "url": LM_BATCH_API_ENDPOINT,
+        "body": body,
+    }
+
+
+def parse_batch_output_line(line: Dict[str, Any]) -> str:
+    """Response text of a batch output/error line, or an "ERROR: ..." string for failed requests."""
+    error = line.get('error')
+    response = line.get('response') or {}
+    body = response.get('body') or {}
+    if error or response.get('status_code') != 200:
+        message = (error or {}).get('message') or (body.get('error') or {}).get('message') or str(error or body)
+        return f"ERROR: {message}"
+    return body['choices'][0]['message']['content']
+
+
+def get_batch_client(platform: str):
+    """Pooled client used for the Batch API of a platform."""
+    if platform not in LM_BATCH_API_PLATFORMS:
+        raise ValueError(f"Batch API mode is not supported for {platform}. Supported platforms: {LM_BATCH_API_PLATFORMS}")
+    if not model_client.OPENAI_API_KEY:
+        raise APIKeyMissingError(platform)
+    return model_client.get_client(platform, model_client.OPENAI_API_KEY)
+
+
+def submit_batches(client, requests: List[Dict[str, Any]], work_path: Path) -> List[str]:
+    """Write the requests as JSONL input files (chunked to the provider limit), upload and submit them."""
+    batch_ids = []
+    for start in range(0, len(requests), LM_BATCH_API_MAX_REQUESTS):
+        chunk = requests[start:start + LM_BATCH_API_MAX_REQUESTS]
+        input_path = work_path.with_suffix(f'.batch_input_{start // LM_BATCH_API_MAX_REQUESTS}.jsonl')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for request in chunk:
+                f.write(json.dumps(request, ensure_ascii=False) + '\n')
+
+        with open(input_path, 'rb') as f:
+            input_file = client.files.create(file=f, purpose="batch")
+        batch = client.batches.create(input_file_id=input_file.id, endpoint=LM_BATCH_API_ENDPOINT,
+                                      completion_window=LM_BATCH_API_COMPLETION_WINDOW)
+        input_path.unlink()
+        print(f"📤 Submitted batch {batch.id} with {len(chunk)} requests")
+        batch_ids.append(batch.id)
+    return batch_ids
+
+
+def wait_for_batches(client, batch_ids: List[str], poll_interval: float) -> List[Any]:
+    """Poll the batches until all of them reach a terminal status."""
+    pending = list(batch_ids)
+    finished = {}
+    while True:
+        in_progress = []
+        for batch_id in pending:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_BATCH_STATUSES:
+                print(f"📥 Batch {batch_id} {batch.status}")
+                finished[batch_id] = batch
+            else:
+                in_progress.append(batch)
+        if not in_progress:
+            return [finished[batch_id] for batch_id in batch_ids]
+
+        pending = [batch.id for batch in in_progress]
+        counts = [batch.request_counts for batch in in_progress if batch.request_counts]
+        done = sum(count.completed + count.failed for count in counts)
+        total = sum(count.total for count in counts)
+        print(f"⏳ Waiting for {len(pending)} batch(es) ({done}/{total} requests done)...")
+        time.sleep(poll_interval)
+
+
+def download_batch_responses(client, batch) -> Dict[str, str]:
+    """custom_id -> response text (or "ERROR: ...") for every request the batch reported on."""
+    responses = {}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        content = client.files.content(file_id).text
+        for line in content.splitlines():
+            if line.strip():
+                record = json.loads(line)
+                responses[record['custom_id']] = parse_batch_output_line(record)
+    return responses
+
+
+def run_variations_batch_api(variations: Iterable[Dict[str, Any]],
+                             model_name: str,
+                             max_tokens: int,
+                             platform: str,
+                             temperature: float,
+                             output_file: str,
+                             score_function: Callable[[Dict[str, Any], str], Dict[str, Any]],
+                             on_result: Callable[[Optional[Dict[str, Any]], int], None],
+                             poll_interval: float = LM_BATCH_API_POLL_INTERVAL,
+                             response_cache: Optional[ResponseCache] = None) -> None:
+    """
+    Process run variations through the provider Batch API.
+
+    score_function(variation, response) builds the result entry; on_result(result, completed_count)
+    is called for every scored result, as in the synchronous engines.
+    """
+    client = get_batch_client(platform)
+    state_path = get_batch_state_path(output_file)
+
+    completed_count = 0
+    to_submit = {}
+    requests = []
+    for variation in variations:
+        if not variation.get('conversation'):
+            print(f"⚠️  Skipping run {variation['unique_run_id']}: No conversation found")
+            completed_count += 1
+            on_result(None, completed_count)
+            continue
+
+        # Deterministic requests answered before are not submitted again
+        if response_cache is not None and response_cache.is_cacheable(temperature):
+            cached = response_cache.get(response_cache.make_key(
+                platform, model_name, max_tokens, temperature, variation['conversation']))
+            if cached is not None:
+                completed_count += 1
+                on_result(score_function(variation, cached), completed_count)
+                continue
+
+        to_submit[variation['unique_run_id']] = variation
+        requests.append(build_batch_request(variation, model_name, max_tokens, temperature))
+
+    if not requests:
+        return
+
+    # Resume polling batches submitted by an interrupted run for the same model; runs it did not
+    # submit (e.g. after widening --rows) are submitted as new batches
+    batch_ids, submitted_ids = [], []
+    if state_path.exists():
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('model_name') == model_name and not set(to_submit).isdisjoint(state.get('custom_ids', [])):
+            batch_ids, submitted_ids = state['batch_ids'], state['custom_ids']
+            print(f"🔁 Resuming {len(batch_ids)} submitted batch(es) from {state_path}")
+
+    submitted = set(submitted_ids)
+    missing = [request for request in requests if request['custom_id'] not in submitted]
+    if missing:
+        batch_ids = batch_ids + submit_batches(client, missing, Path(output_file))
+        submitted_ids = submitted_ids + [request['custom_id'] for request in missing]
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump({'model_name': model_name, 'batch_ids': batch_ids, 'custom_ids': submitted_ids}, f)
+
+    # Saved batches may also hold runs that are no longer requested; only the requested ones are read
+    responses = {}
+    for batch in wait_for_batches(client, batch_ids, poll_interval):
+        for custom_id, response in download_batch_responses(client, batch).items():
+            if custom_id in to_submit:
+                responses[custom_id] = response
+
+    for custom_id, variation in to_submit.items():
+        response = responses.get(custom_id, "ERROR: No result returned by the batch")
+        if (response_cache is not None and response_cache.is_cacheable(temperature)
+                and not response.startswith("ERROR:")):
+            response_cache.set(response_cache.make_key(
+                platform, model_name, max_tokens, temperature, variation['conversation']), response)
+        completed_count += 1
+        on_result(score_function(variation, response), completed_count)
+
+    os.remove(state_path)
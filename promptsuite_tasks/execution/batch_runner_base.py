@@ -4,98 +4,142 @@ Base class for batch runners to reduce code duplication.
 """
 
 import argparse
+import asyncio
 import json
 import sys
 import time
 import os
 import csv
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from threading import Lock
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Callable
 
 # Add the project root to the path to import promptsuite
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from promptsuite.shared.model_client import get_model_response
+from promptsuite.shared.model_client import (
+    get_model_response, get_model_response_async, aclose_async_clients,
+    configure_client_pool, get_client_pool_settings
+)
 from promptsuite_tasks.constants import (
     LM_DEFAULT_MAX_TOKENS, LM_DEFAULT_PLATFORM, LM_DEFAULT_TEMPERATURE,
-    LM_DEFAULT_PARALLEL_WORKERS,
+    LM_DEFAULT_PARALLEL_WORKERS, LM_ENGINES, LM_DEFAULT_ENGINE, LM_DEFAULT_ASYNC_CONCURRENCY,
+    LM_DEFAULT_MAX_RETRIES, LM_DEFAULT_RETRY_SLEEP, LM_BATCH_API_POLL_INTERVAL, LM_DEFAULT_METRIC_WORKERS,
     PLATFORMS, MODEL_SHORT_NAMES, MODELS
 )
 from promptsuite_tasks.execution.shared_metrics import calculate_mmlu_correctness_and_metrics
+from promptsuite_tasks.execution.result_journal import ResultJournal, get_journal_path, write_atomically
+from promptsuite_tasks.execution.resume_index import load_resume_index, write_resume_index
+from promptsuite_tasks.execution.response_cache import ResponseCache, get_response_cache, format_cache_stats
+from promptsuite_tasks.execution.batch_api import run_variations_batch_api
+from promptsuite_tasks.execution.variation_stream import stream_variations_file
+from promptsuite_tasks.execution.metric_stage import (
+    MetricStage, get_responses_journal_path, get_response_key, load_unscored_responses
+)
+from promptsuite_tasks.execution.rate_limiter import (
+    get_rate_limiter, configure_rate_limiter, estimate_tokens,
+    is_rate_limit_error, get_retry_after, backoff_delay
+)
 
 
-def load_variations_file(file_path: str) -> List[Dict[str, Any]]:
-    """Load variations from a JSON file."""
-    if not os.path.exists(file_path):
-        print(f"❌ File not found: {file_path}")
-        return []
+def get_model_response_with_retry(conversation: List[Dict[str, Any]],
+                                  model_name: str,
+                                  max_tokens: int,
+                                  platform: str,
+                                  temperature: float = 0.0,
+                                  max_retries: int = LM_DEFAULT_MAX_RETRIES,
+                                  max_sleep_time: float = LM_DEFAULT_RETRY_SLEEP,
+                                  response_cache: Optional[ResponseCache] = None) -> str:
+    """
+    Get model response through the shared (platform, model) rate limiter, retrying rate limit errors.
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            variations = json.load(f)
-        print(f"✅ Loaded {len(variations)} variations from {file_path}")
-        return variations
-    except Exception as e:
-        print(f"❌ Error loading file {file_path}: {e}")
-        return []
+    Retries use jittered exponential backoff capped at max_sleep_time, or the provider's retry-after hint.
+    Deterministic requests are served from response_cache when it has them.
+    """
+    cache_key = None
+    if response_cache is not None and response_cache.is_cacheable(temperature):
+        cache_key = response_cache.make_key(platform, model_name, max_tokens, temperature, conversation)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+    limiter = get_rate_limiter(platform, model_name)
+    estimated_tokens = estimate_tokens(conversation, max_tokens)
+    for attempt in range(max_retries + 1):
+        ticket = limiter.acquire(estimated_tokens)
+        rate_limited, retry_after = False, None
+        try:
+            response = get_model_response(messages=conversation, model_name=model_name,
+                                          max_tokens=max_tokens, platform=platform, temperature=temperature)
+        except Exception as e:
+            if is_rate_limit_error(e):
+                rate_limited, retry_after = True, get_retry_after(e)
+            if not rate_limited or attempt >= max_retries:
+                raise e
+        finally:
+            limiter.release(ticket, rate_limited, retry_after)
 
-def filter_variations_by_rows_and_variations(variations: List[Dict[str, Any]],
-                                             max_rows: int = None,
-                                             max_variations_per_row: int = None) -> List[Dict[str, Any]]:
-    """Filter variations based on row and variation limits."""
-    if max_rows is None and max_variations_per_row is None:
-        return variations
+        if not rate_limited:
+            if cache_key is not None:
+                response_cache.set(cache_key, response)
+            return response
 
-    # Group variations by original row index
-    row_groups = {}
-    for variation in variations:
-        row_idx = variation.get('original_row_index', 0)
-        if row_idx not in row_groups:
-            row_groups[row_idx] = []
-        row_groups[row_idx].append(variation)
+        sleep_time = backoff_delay(attempt, max_sleep_time, retry_after)
+        print(f"⏳ Rate limit hit, retrying in {sleep_time:.1f}s...")
+        time.sleep(sleep_time)
 
-    # Sort rows and limit them
-    sorted_rows = sorted(row_groups.keys())
-    if max_rows is not None:
-        sorted_rows = sorted_rows[:max_rows]
+    raise Exception("Max retries exceeded")
 
-    # Filter variations
-    filtered_variations = []
-    for row_idx in sorted_rows:
-        row_variations = row_groups[row_idx]
-        if max_variations_per_row is not None:
-            row_variations = row_variations[:max_variations_per_row]
-        filtered_variations.extend(row_variations)
 
-    print(f"🔍 Filtered to {len(filtered_variations)} variations from {len(row_groups)} rows")
-    return filtered_variations
+async def get_model_response_with_retry_async(conversation: List[Dict[str, Any]],
+                                              model_name: str,
+                                              max_tokens: int,
+                                              platform: str,
+                                              temperature: float = 0.0,
+                                              max_retries: int = LM_DEFAULT_MAX_RETRIES,
+                                              max_sleep_time: float = LM_DEFAULT_RETRY_SLEEP,
+                                              response_cache: Optional[ResponseCache] = None) -> str:
+    """
+    Async version of get_model_response_with_retry (waits without blocking other requests).
 
+    Response cache lookups and writes are SQLite calls, so they run on a worker thread instead of
+    the event loop.
+    """
+    cache_key = None
+    if response_cache is not None and response_cache.is_cacheable(temperature):
+        cache_key = response_cache.make_key(platform, model_name, max_tokens, temperature, conversation)
+        cached = await asyncio.to_thread(response_cache.get, cache_key)
+        if cached is not None:
+            return cached
 
-def get_model_response_with_retry(conversation: List[Dict[str, Any]],
-                                  model_name: str,
-                                  max_tokens: int,
-                                  platform: str,
-                                  temperature: float = 0.0,
-                                  max_retries: int = 3,
-                                  base_sleep_time: int = 60) -> str:
-    """Get model response with retry logic for rate limit errors."""
+    limiter = get_rate_limiter(platform, model_name)
+    estimated_tokens = estimate_tokens(conversation, max_tokens)
     for attempt in range(max_retries + 1):
+        ticket = await limiter.acquire_async(estimated_tokens)
+        rate_limited, retry_after = False, None
         try:
-            return get_model_response(messages=conversation, model_name=model_name,
-                                      max_tokens=max_tokens, platform=platform, temperature=temperature)
+            response = await get_model_response_async(messages=conversation, model_name=model_name,
+                                                      max_tokens=max_tokens, platform=platform,
+                                                      temperature=temperature)
         except Exception as e:
-            if attempt < max_retries and "rate limit" in str(e).lower():
-                sleep_time = base_sleep_time * (attempt + 1)
-                print(f"⏳ Rate limit hit, sleeping {sleep_time}s...")
-                time.sleep(sleep_time)
-                continue
-            else:
+            if is_rate_limit_error(e):
+                rate_limited, retry_after = True, get_retry_after(e)
+            if not rate_limited or attempt >= max_retries:
                 raise e
+        finally:
+            limiter.release(ticket, rate_limited, retry_after)
+
+        if not rate_limited:
+            if cache_key is not None:
+                await asyncio.to_thread(response_cache.set, cache_key, response)
+            return response
+
+        sleep_time = backoff_delay(attempt, max_sleep_time, retry_after)
+        print(f"⏳ Rate limit hit, retrying in {sleep_time:.1f}s...")
+        await asyncio.sleep(sleep_time)
 
     raise Exception("Max retries exceeded")
 
@@ -145,8 +189,10 @@ def process_single_variation(variation: Dict[str, Any],
                            retry_sleep: int,
                            variation_num: int,
                            total_variations: int,
-                           metrics_function=None) -> Dict[str, Any]:
-    """Process a single variation and return the result."""
+                           metrics_function=None,
+                           response_cache: Optional[ResponseCache] = None,
+                           score: bool = True) -> Dict[str, Any]:
+    """Process a single variation and return the result (with score=False, the (variation, response) pair)."""
     try:
         # Get conversation from variation
         conversation = variation.get('conversation', [])
@@ -159,159 +205,698 @@ def process_single_variation(variation: Dict[str, Any],
         # Run the model with conversation format, max_tokens, platform, and temperature (with retry logic)
         response = get_model_response_with_retry(
             conversation, model_name, max_tokens=max_tokens, platform=platform,
-            temperature=temperature, max_retries=max_retries, base_sleep_time=retry_sleep
+            temperature=temperature, max_retries=max_retries, max_sleep_time=retry_sleep,
+            response_cache=response_cache
         )
 
-        # Extract gold answer and check correctness using custom or default function
-        if metrics_function:
-            gold_answer_text, is_correct, extra_metrics = metrics_function(variation, response)
-        else:
-            gold_answer_text, is_correct, extra_metrics = calculate_mmlu_correctness_and_metrics(variation, response)
-
-        # Create result entry
-        result = create_result_entry(variation, response, model_name, gold_answer_text, is_correct, extra_metrics)
+        # Create result entry (or leave the response to the metric stage)
+        result = score_response(variation, response, model_name, metrics_function) if score else (variation, response)
         
         print(f"✅ Completed {variation_num}/{total_variations} (variation {variation.get('variation_count')})")
         return result
 
     except Exception as e:
         print(f"❌ Error processing variation {variation_num}: {e}")
-        # Extract gold answer even for errors using custom or default function
-        if metrics_function:
-            gold_answer_text, is_correct, extra_metrics = metrics_function(variation, f"ERROR: {str(e)}")
-        else:
-            gold_answer_text, is_correct, extra_metrics = calculate_mmlu_correctness_and_metrics(variation, f"ERROR: {str(e)}")
-
-        # Create error result entry
+        # Create error result entry (gold answer is still extracted)
         error_response = f"ERROR: {str(e)}"
-        return create_result_entry(variation, error_response, model_name, gold_answer_text, is_correct, extra_metrics)
+        if not score:
+            return variation, error_response
+        return score_response(variation, error_response, model_name, metrics_function)
+
+
+async def process_single_variation_async(variation: Dict[str, Any],
+                                         model_name: str,
+                                         max_tokens: int,
+                                         platform: str,
+                                         temperature: float,
+                                         max_retries: int,
+                                         retry_sleep: int,
+                                         variation_num: int,
+                                         metrics_function=None,
+                                         response_cache: Optional[ResponseCache] = None,
+                                         score: bool = True) -> Optional[Dict[str, Any]]:
+    """Async version of process_single_variation; progress is reported per saved batch instead of per variation."""
+    conversation = variation.get('conversation', [])
+    if not conversation:
+        print(f"⚠️  Skipping variation {variation_num}: No conversation found")
+        return None
+
+    try:
+        response = await get_model_response_with_retry_async(
+            conversation, model_name, max_tokens=max_tokens, platform=platform,
+            temperature=temperature, max_retries=max_retries, max_sleep_time=retry_sleep,
+            response_cache=response_cache
+        )
+    except Exception as e:
+        print(f"❌ Error processing variation {variation_num}: {e}")
+        response = f"ERROR: {str(e)}"
+
+    if not score:
+        return variation, response
+    return score_response(variation, response, model_name, metrics_function)
+
+
+def score_response(variation: Dict[str, Any], response: str, model_name: str,
+                   metrics_function=None) -> Dict[str, Any]:
+    """Extract the gold answer, check correctness (custom or default function) and build the result entry."""
+    if metrics_function:
+        gold_answer_text, is_correct, extra_metrics = metrics_function(variation, response)
+    else:
+        gold_answer_text, is_correct, extra_metrics = calculate_mmlu_correctness_and_metrics(variation, response)
+
+    return create_result_entry(variation, response, model_name, gold_answer_text, is_correct, extra_metrics)
+
+
+def get_result_key(result: Dict[str, Any]) -> tuple:
+    """(original_row_index, variation_index, run_number) of a result."""
+    row_idx = result.get('original_row_index', 0)
+    var_idx = result['variation_index']
+    run_num = result.get('run_number', 1)  # Default to 1 for backward compatibility
+    return row_idx, var_idx, run_num
 
 
 def get_processed_variation_indices(results: List[Dict[str, Any]]) -> set:
     """Get set of (original_row_index, variation_index, run_number) tuples that have already been processed."""
-    processed = set()
-    for result in results:
-        if 'variation_index' in result:
-            row_idx = result.get('original_row_index', 0)
-            var_idx = result['variation_index']
-            run_num = result.get('run_number', 1)  # Default to 1 for backward compatibility
-            processed.add((row_idx, var_idx, run_num))
-    return processed
+    return {get_result_key(result) for result in results if 'variation_index' in result}
+
+
+class VariationRun:
+    """
+    Per-file state of a batch run: resume state, pending runs, result journal and progress.
+
+    Variations may be a list or a lazy iterator (e.g. streamed from a variations file); with an
+    iterator the number of pending runs is only known once it has been consumed. Results may
+    arrive from several worker threads; add_result is thread-safe. With deferred metrics, raw
+    responses are journaled by add_response before they are scored. If reading the variations
+    fails part-way, the run stops queueing, records the error in `error` and keeps its results
+    for resume instead of stopping the other files.
+    """
+
+    def __init__(self, variations: Iterable[Dict[str, Any]], output_file: str, batch_size: int = 10,
+                 resume: bool = True, runs_per_sample: int = 1, name: Optional[str] = None):
+        """
+        Prepare the runs of a file.
+
+        Args:
+            variations: Variations of the file (list or iterator)
+            output_file: Path of the JSON results file
+            batch_size: Number of results between journal fsyncs and progress reports
+            resume: Skip runs that are already in the results file or its journal
+            runs_per_sample: Number of runs for each variation
+            name: Label used in progress messages when several files run together
+        """
+        self.output_file = output_file
+        self.batch_size = batch_size
+        self.resume = resume
+        self.name = name
+        self.num_variations = 0
+        self.runs_per_sample = runs_per_sample
+        self.start_time = time.time()
+        self.duration = None
+        self.error: Optional[str] = None
+
+        # Load existing results if resume mode is enabled. With a resume index only the processed keys
+        # (and any journaled results) are read now; saved results are loaded when compacting at the end.
+        self.results = []
+        self._processed_indices = set()
+        self._saved_results_pending = False
+        if resume:
+            self.results, self._processed_indices, self._saved_results_pending = load_resume_state(output_file)
+            if self._processed_indices:
+                print(f"📋 Found {len(self._processed_indices)} already processed variations")
 
+        # Responses of an interrupted deferred-metrics run that were never scored
+        self._unscored_responses = load_unscored_responses(output_file) if resume else {}
+        self._responses_journal = None
 
-def run_model_on_variations(variations: List[Dict[str, Any]],
+        # Runs still to do; a list of variations is scanned now so progress can be reported in percent
+        self._pending_runs = self._find_pending_runs(variations)
+        self.total_pending = None
+        if isinstance(variations, list):
+            self._pending_runs = list(self._pending_runs)
+            self.total_pending = len(self._pending_runs)
+
+        self.queued = 0
+        self.completed = 0
+        self._all_queued = False
+        self._done = False
+
+        # Results are journaled as they complete and compacted into the JSON/CSV files at the end
+        self.journal = ResultJournal(output_file, sync_every=batch_size, resume=resume)
+        self._lock = Lock()
+
+    def _find_pending_runs(self, variations: Iterable[Dict[str, Any]]) -> Iterable[tuple]:
+        """(variation, run_number) for every run not processed yet; stops at a read error of a streamed file."""
+        try:
+            for variation in variations:
+                self.num_variations += 1
+                row_idx = variation.get('original_row_index', 0)
+                variation_index = variation.get('variation_count')
+
+                for run_number in range(1, self.runs_per_sample + 1):
+                    # Check if this specific run has already been processed
+                    if (row_idx, variation_index, run_number) not in self._processed_indices:
+                        yield variation, run_number
+        except (ValueError, OSError) as e:
+            # Malformed or unreadable file: the runs queued so far still finish
+            self.fail(f"Reading variations failed after {self.num_variations} variations: {e}")
+
+    def fail(self, error: str) -> None:
+        """Record the error that stopped this run (its finished results are kept for resume)."""
+        self.error = error
+        prefix = f"[{self.name}] " if self.name else ""
+        print(f"❌ {prefix}{error}")
+
+    def pending_variations(self, on_answered: Optional[Callable[[Dict[str, Any], str], None]] = None
+                           ) -> Iterable[Dict[str, Any]]:
+        """
+        Run variations still to process; each run gets its own copy of the variation only when it is queued.
+
+        Runs with a journaled but unscored response are passed to on_answered(variation, response)
+        instead of being yielded (without on_answered they are requested again).
+        """
+        for variation, run_number in self._pending_runs:
+            self.queued += 1
+            run_variation = create_run_variation(variation, run_number)
+            response = self._unscored_responses.pop(get_response_key(run_variation), None)
+            if response is not None and on_answered is not None:
+                on_answered(run_variation, response)
+            else:
+                yield run_variation
+
+    def add_response(self, variation: Dict[str, Any], response: str) -> None:
+        """Journal the raw response of a run before it is scored, so it is not requested again on resume."""
+        with self._lock:
+            if self._responses_journal is None:
+                self._responses_journal = ResultJournal(self.output_file, sync_every=self.batch_size,
+                                                        resume=self.resume,
+                                                        path=get_responses_journal_path(self.output_file))
+            entry = {key: variation.get(key) for key in ('original_row_index', 'variation_count', 'run_number')}
+            entry['model_response'] = response
+            self._responses_journal.append(entry)
+
+    def print_pending(self) -> None:
+        """Report how many runs are left."""
+        if self.total_pending is None:
+            print(f"🔄 Processing remaining runs while reading variations ({self.runs_per_sample} runs per variation)")
+        elif not self.total_pending:
+            print("✅ All variations and runs already processed!")
+        else:
+            total_runs = self.num_variations * self.runs_per_sample
+            print(f"🔄 Processing {self.total_pending} remaining runs ({self.num_variations} variations × "
+                  f"{self.runs_per_sample} runs = {total_runs} total runs)")
+
+    def _check_done(self) -> bool:
+        """True exactly once: when every run has been queued and its result added (call with the lock held)."""
+        if self._all_queued and self.completed == self.total_pending and not self._done:
+            self._done = True
+            return True
+        return False
+
+    def mark_queued(self) -> bool:
+        """Record that pending_variations() has been consumed; returns True if the file is already complete."""
+        with self._lock:
+            was_streaming = self.total_pending is None
+            self._all_queued = True
+            self.total_pending = self.queued
+            if was_streaming and not self.queued and self.error is None:
+                print("✅ All variations and runs already processed!")
+            return self._check_done()
+
+    def add_result(self, result: Optional[Dict[str, Any]]) -> bool:
+        """Add a finished run (None for skipped runs) and journal it; returns True when the file is complete."""
+        with self._lock:
+            self.completed += 1
+            if result is not None:
+                self.results.append(result)
+                self.journal.append(result)
+
+            # Report progress once per batch
+            if len(self.results) % self.batch_size == 0 or self.completed == self.total_pending:
+                prefix = f"[{self.name}] " if self.name else ""
+                if self.total_pending:
+                    progress_pct = (self.completed / self.total_pending) * 100
+                    print(f"💾 {prefix}Saved batch ({len(self.results)} total results, {progress_pct:.1f}% complete)")
+                else:
+                    print(f"💾 {prefix}Saved batch ({len(self.results)} total results, {self.completed} runs done)")
+
+            return self._check_done()
+
+    def close(self) -> None:
+        """Sync and close the journals; an interrupted run is resumed from them."""
+        self.journal.close()
+        if self._responses_journal is not None:
+            self._responses_journal.close()
+
+    def _remove_responses_journal(self) -> None:
+        """Delete the unscored responses journal once every response in it has been scored."""
+        if self._responses_journal is not None:
+            self._responses_journal.remove()
+        get_responses_journal_path(self.output_file).unlink(missing_ok=True)
+
+    def finish(self) -> None:
+        """Compact the journal into the final JSON/CSV files (a failed run keeps its journal for resume instead)."""
+        self.duration = time.time() - self.start_time
+        if self.error is not None:
+            self.close()
+            return
+        if not self.total_pending and not self.journal.recovered:
+            self.journal.remove()
+            self._remove_responses_journal()
+            return
+
+        if self._saved_results_pending:
+            self.results = _load_saved_results(self.output_file) + self.results
+        save_batch_results(self.results, self.output_file)
+        self.journal.remove()
+        self._remove_responses_journal()
+
+        if self.total_pending:
+            print(f"💾 Results saved to: {self.output_file}")
+            csv_file = str(self.output_file).replace('.json', '.csv')
+            print(f"📊 CSV saved to: {csv_file}")
+            print(f"📊 Total processed: {len(self.results)} variations")
+
+
+def print_engine_settings(model_name: str, batch_size: int, resume: bool, engine: str,
+                          parallel_workers: int, concurrency: int) -> None:
+    """Print the model and engine used for a run."""
+    if engine not in LM_ENGINES:
+        raise ValueError(f"Unsupported engine: {engine}. Supported engines: {LM_ENGINES}")
+
+    print(f"🤖 Using model: {model_name}")
+    if engine == "async":
+        print(f"📦 Batch size: {batch_size}, Resume: {resume}, Engine: async (concurrency {concurrency})")
+    elif engine == "batch":
+        print(f"📦 Batch size: {batch_size}, Resume: {resume}, Engine: provider Batch API")
+    else:
+        print(f"📦 Batch size: {batch_size}, Resume: {resume}, Workers: {parallel_workers}")
+
+
+def setup_request_limits(model_name: str, platform: str, requests_per_minute: Optional[float],
+                         tokens_per_minute: Optional[float], use_response_cache: bool) -> Optional[ResponseCache]:
+    """Configure the rate limiter of the model and return the response cache (None if disabled)."""
+    configure_rate_limiter(platform, model_name, requests_per_minute, tokens_per_minute)
+    if requests_per_minute or tokens_per_minute:
+        print(f"🚦 Rate limits: {requests_per_minute or 'unlimited'} requests/min, "
+              f"{tokens_per_minute or 'unlimited'} tokens/min")
+    return get_response_cache() if use_response_cache else None
+
+
+def run_model_on_variations(variations: Iterable[Dict[str, Any]],
                             model_name: str,
                             max_tokens: int,
                             platform: str,
                             output_file: str,
                             temperature: float = 0.0,
-                            max_retries: int = 3,
-                            retry_sleep: int = 60,
+                            max_retries: int = LM_DEFAULT_MAX_RETRIES,
+                            retry_sleep: float = LM_DEFAULT_RETRY_SLEEP,
                             batch_size: int = 10,
                             resume: bool = True,
                             parallel_workers: int = LM_DEFAULT_PARALLEL_WORKERS,
                             metrics_function=None,
                             runs_per_sample: int = 1,
-                            ) -> None:
-    """Run the language model on variations and save results."""
-    print(f"🤖 Using model: {model_name}")
-    print(f"📦 Batch size: {batch_size}, Resume: {resume}, Workers: {parallel_workers}")
+                            engine: str = LM_DEFAULT_ENGINE,
+                            concurrency: int = LM_DEFAULT_ASYNC_CONCURRENCY,
+                            requests_per_minute: Optional[float] = None,
+                            tokens_per_minute: Optional[float] = None,
+                            use_response_cache: bool = True,
+                            batch_poll_interval: float = LM_BATCH_API_POLL_INTERVAL,
+                            metric_workers: int = LM_DEFAULT_METRIC_WORKERS,
+                            ) -> int:
+    """
+    Run the language model on variations and save results; returns the number of variations read.
 
-    # Load existing results if resume mode is enabled
-    results = []
-    processed_indices = set()
-    if resume:
-        results = load_existing_results(output_file)
-        if results:
-            processed_indices = get_processed_variation_indices(results)
-            if processed_indices:
-                print(f"📋 Found {len(processed_indices)} already processed variations")
-
-    # Create multiple copies of each variation for multiple runs
-    variations_to_process = []
-    for variation in variations:
-        row_idx = variation.get('original_row_index', 0)
-        variation_index = variation.get('variation_count')
-        
-        for run_number in range(1, runs_per_sample + 1):
-            # Create unique key for each run
-            variation_key = (row_idx, variation_index, run_number)
-            
-            # Check if this specific run has already been processed
-            if variation_key not in processed_indices:
-                # Create a copy of variation with run number
-                variation_copy = variation.copy()
-                variation_copy['run_number'] = run_number
-                variation_copy['unique_run_id'] = f"{row_idx}_{variation_index}_{run_number}"
-                variations_to_process.append(variation_copy)
-
-    if not variations_to_process:
-        print("✅ All variations and runs already processed!")
-        return
+    variations may be a lazy iterator (see variation_stream.stream_variations_file), in which case
+    requests start while the rest of the file is still being read.
 
-    total_original_variations = len(variations)
-    total_runs = total_original_variations * runs_per_sample
-    print(f"🔄 Processing {len(variations_to_process)} remaining runs ({total_original_variations} variations × {runs_per_sample} runs = {total_runs} total runs)")
+    With engine="thread" calls are spread over parallel_workers threads; with engine="async" a single
+    event loop keeps up to `concurrency` requests in flight using the async provider clients;
+    with engine="batch" the pending runs are submitted to the provider Batch API and polled every
+    batch_poll_interval seconds. The synchronous engines share the (platform, model) rate limiter, which enforces the optional
+    requests/tokens per minute quotas and adapts concurrency to rate-limit errors.
+    With use_response_cache, deterministic (temperature 0) requests are answered from the on-disk
+    response cache when an identical request was made before. With metric_workers > 0, responses are
+    journaled and scored in batches on that many processes instead of on the request workers.
+    """
+    print_engine_settings(model_name, batch_size, resume, engine, parallel_workers, concurrency)
+    response_cache = setup_request_limits(model_name, platform, requests_per_minute, tokens_per_minute,
+                                          use_response_cache)
+    cache_stats_before = response_cache.stats() if response_cache is not None else None
 
-    # Thread-safe results list and counter
-    results_lock = Lock()
+    run = VariationRun(variations, output_file, batch_size=batch_size, resume=resume,
+                       runs_per_sample=runs_per_sample)
+    run.print_pending()
+    if run.total_pending == 0:
+        run.finish()
+        return run.num_variations
 
-    def add_result_and_save(result: Dict[str, Any], current_count: int):
-        """Thread-safe function to add results and save batches."""
-        with results_lock:
-            if result is not None:
-                results.append(result)
-            
-            # Save batch results
-            if len(results) % batch_size == 0 or current_count == len(variations_to_process):
-                progress_pct = (current_count / len(variations_to_process)) * 100
-                print(f"💾 Saving batch ({len(results)} total results, {progress_pct:.1f}% complete)...")
-                save_batch_results(results, output_file)
-
-    if parallel_workers > 1:
-        # Parallel processing
-        print(f"🚀 Starting parallel processing with {parallel_workers} workers...")
-        
-        with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-            # Submit all tasks
-            future_to_variation = {}
-            for i, variation in enumerate(variations_to_process, 1):
-                future = executor.submit(
-                    process_single_variation,
-                    variation, model_name, max_tokens, platform, temperature,
-                    max_retries, retry_sleep, i, len(variations_to_process), metrics_function
-                )
-                future_to_variation[future] = i
-
-            # Process completed tasks
-            completed_count = 0
-            for future in as_completed(future_to_variation):
-                completed_count += 1
+    _run_scheduled([run], model_name, max_tokens, platform, temperature, max_retries, retry_sleep,
+                   metrics_function, engine, parallel_workers, concurrency, batch_poll_interval,
+                   response_cache, metric_workers=metric_workers)
+
+    if response_cache is not None:
+        print(f"🗄️  Response cache: {format_cache_stats(cache_stats_before, response_cache.stats())}")
+    if run.error is not None:
+        raise ValueError(run.error)
+    return run.num_variations
+
+
+def run_model_on_files(runs: Iterable[VariationRun],
+                       model_name: str,
+                       max_tokens: int,
+                       platform: str,
+                       temperature: float = 0.0,
+                       max_retries: int = LM_DEFAULT_MAX_RETRIES,
+                       retry_sleep: float = LM_DEFAULT_RETRY_SLEEP,
+                       metrics_function=None,
+                       engine: str = LM_DEFAULT_ENGINE,
+                       parallel_workers: int = LM_DEFAULT_PARALLEL_WORKERS,
+                       concurrency: int = LM_DEFAULT_ASYNC_CONCURRENCY,
+                       batch_poll_interval: float = LM_BATCH_API_POLL_INTERVAL,
+                       response_cache: Optional[ResponseCache] = None,
+                       on_run_done: Optional[Callable[[VariationRun], None]] = None,
+                       metric_workers: int = LM_DEFAULT_METRIC_WORKERS) -> None:
+    """
+    Run the language model on the variations of several files through one global work queue.
+
+    The runs of all files are streamed into a single worker pool (or event loop), so the pool stays
+    busy across file boundaries instead of draining at the end of every file. `runs` may be a
+    generator: a file is only loaded once the queue reaches it. Every result is journaled to its own
+    file, each file is compacted as soon as its last run finishes and on_run_done(run) is called.
+
+    The Batch API engine submits and polls one file at a time. With metric_workers > 0 the responses
+    of all files are scored on one shared pool of metric processes.
+
+    An error that only concerns one file (unreadable variations, failed compaction or Batch API
+    submission) fails that run: it is reported to on_run_done with run.error set, keeps its journal
+    for resume, and the other files keep going.
+    """
+    def finish(run: VariationRun) -> None:
+        try:
+            run.finish()
+        except Exception as e:
+            run.fail(f"Saving results failed: {e}")
+            run.close()
+        if on_run_done:
+            on_run_done(run)
+
+    def ready_runs() -> Iterable[VariationRun]:
+        for run in runs:
+            run.print_pending()
+            if run.total_pending == 0:
+                finish(run)
+            else:
+                yield run
+
+    _run_scheduled(ready_runs(), model_name, max_tokens, platform, temperature, max_retries, retry_sleep,
+                   metrics_function, engine, parallel_workers, concurrency, batch_poll_interval,
+                   response_cache, finish, metric_workers=metric_workers)
+
+
+def _run_scheduled(runs: Iterable[VariationRun],
+                   model_name: str,
+                   max_tokens: int,
+                   platform: str,
+                   temperature: float,
+                   max_retries: int,
+                   retry_sleep: float,
+                   metrics_function,
+                   engine: str,
+                   parallel_workers: int,
+                   concurrency: int,
+                   batch_poll_interval: float,
+                   response_cache: Optional[ResponseCache],
+                   on_run_done: Optional[Callable[[VariationRun], None]] = None,
+                   metric_workers: int = LM_DEFAULT_METRIC_WORKERS) -> None:
+    """
+    Process the pending runs of one or more VariationRuns with the selected engine.
+
+    With metric_workers > 0 the engines return raw (variation, response) pairs, which are journaled
+    and handed to a MetricStage; scored results are added to their runs as the batches finish.
+    """
+    if on_run_done is None:
+        on_run_done = VariationRun.finish
+    open_runs = []
+
+    def score(variation: Dict[str, Any], response: str) -> Optional[Dict[str, Any]]:
+        # A response that cannot be scored is skipped like a failed request, without stopping its file
+        try:
+            return score_response(variation, response, model_name, metrics_function)
+        except Exception as e:
+            print(f"❌ Unexpected error scoring run {variation.get('unique_run_id')}: {e}")
+            return None
+
+    metric_stage = MetricStage(score, metric_workers) if metric_workers > 0 else None
+
+    def done(run: VariationRun) -> None:
+        open_runs.remove(run)
+        on_run_done(run)
+
+    def on_result(run: VariationRun, result: Optional[Dict[str, Any]]) -> None:
+        if run.add_result(result):
+            done(run)
+
+    def on_scored(scored: List[tuple]) -> None:
+        for run, result in scored:
+            on_result(run, result)
+
+    def on_answered(run: VariationRun, variation: Dict[str, Any], response: str) -> None:
+        """A response that is journaled already (or was recovered from the journal) is ready to be scored."""
+        if metric_stage is None:
+            on_result(run, score(variation, response))
+        else:
+            metric_stage.add(run, variation, response)
+            on_scored(metric_stage.collect())
+
+    def on_engine_result(run: VariationRun, result) -> None:
+        """Result of an engine: a result entry, None, or a (variation, response) pair with a metric stage."""
+        if metric_stage is None or result is None:
+            on_result(run, result)
+        else:
+            variation, response = result
+            run.add_response(variation, response)
+            on_answered(run, variation, response)
+
+    def pending_variations(run: VariationRun) -> Iterable[Dict[str, Any]]:
+        return run.pending_variations(lambda variation, response: on_answered(run, variation, response))
+
+    def tasks() -> Iterable[tuple]:
+        for run in runs:
+            open_runs.append(run)
+            for i, variation in enumerate(pending_variations(run), 1):
+                yield run, variation, i
+            if run.mark_queued():
+                done(run)
+
+    try:
+        if engine == "async":
+            print(f"🚀 Starting async processing with up to {concurrency} requests in flight...")
+            asyncio.run(_run_variations_async(
+                tasks(), model_name, max_tokens, platform, temperature,
+                max_retries, retry_sleep, metrics_function, concurrency, on_engine_result,
+                response_cache=response_cache, score=metric_stage is None
+            ))
+
+        elif engine == "batch":
+            for run in runs:
+                open_runs.append(run)
+                print(f"🚀 Submitting pending runs to the {platform} Batch API...")
+                try:
+                    run_variations_batch_api(
+                        pending_variations(run), model_name, max_tokens, platform, temperature, run.output_file,
+                        score if metric_stage is None else lambda variation, response: (variation, response),
+                        lambda result, completed_count, run=run: on_engine_result(run, result),
+                        poll_interval=batch_poll_interval, response_cache=response_cache
+                    )
+                except Exception as e:
+                    # Submitted batches are saved next to the results and polled again on resume
+                    run.fail(f"Batch API processing failed: {e}")
+                    done(run)
+                    continue
+                if run.mark_queued():
+                    done(run)
+
+        elif parallel_workers > 1:
+            print(f"🚀 Starting parallel processing with {parallel_workers} workers...")
+            _run_variations_threaded(
+                tasks(), model_name, max_tokens, platform, temperature,
+                max_retries, retry_sleep, metrics_function, parallel_workers, on_engine_result,
+                response_cache=response_cache, score=metric_stage is None
+            )
+
+        else:
+            # Sequential processing
+            print("🔄 Processing variations sequentially...")
+
+            for run, variation, i in tasks():
+                try:
+                    result = process_single_variation(
+                        variation, model_name, max_tokens, platform, temperature,
+                        max_retries, retry_sleep, i, run.total_pending or "?", metrics_function, response_cache,
+                        score=metric_stage is None
+                    )
+                except Exception as e:
+                    print(f"❌ Unexpected error in sequential processing: {e}")
+                    result = None
+                on_engine_result(run, result)
+
+        if metric_stage is not None:
+            on_scored(metric_stage.drain())
+    finally:
+        if metric_stage is not None:
+            metric_stage.close()
+        # Runs that did not finish keep their journals for resume
+        for run in open_runs:
+            run.close()
+
+
+def _run_variations_threaded(tasks: Iterable[tuple],
+                             model_name: str,
+                             max_tokens: int,
+                             platform: str,
+                             temperature: float,
+                             max_retries: int,
+                             retry_sleep: float,
+                             metrics_function,
+                             parallel_workers: int,
+                             on_result: Callable[[VariationRun, Optional[Dict[str, Any]]], None],
+                             response_cache: Optional[ResponseCache] = None,
+                             score: bool = True) -> None:
+    """
+    Process (run, variation, variation_num) tasks on a pool of parallel_workers threads.
+
+    Only a bounded window of tasks is queued at a time, so tasks (and the files behind them) are
+    consumed at the rate the workers finish them. on_result(run, result) is called from this thread.
+    """
+    max_queued = parallel_workers * 2
+    with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
+        future_to_run = {}
+
+        def collect(done) -> None:
+            for future in done:
+                run = future_to_run.pop(future)
                 try:
                     result = future.result()
-                    add_result_and_save(result, completed_count)
                 except Exception as e:
                     print(f"❌ Unexpected error in parallel processing: {e}")
+                    result = None
+                on_result(run, result)
 
-    else:
-        # Sequential processing
-        print("🔄 Processing variations sequentially...")
-        
-        for i, variation in enumerate(variations_to_process, 1):
-            result = process_single_variation(
+        for run, variation, i in tasks:
+            if len(future_to_run) >= max_queued:
+                done, _ = wait(future_to_run, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = executor.submit(
+                process_single_variation,
                 variation, model_name, max_tokens, platform, temperature,
-                max_retries, retry_sleep, i, len(variations_to_process), metrics_function
+                max_retries, retry_sleep, i, run.total_pending or "?", metrics_function, response_cache, score
             )
-            add_result_and_save(result, i)
+            future_to_run[future] = run
 
-    # Final save
-    print(f"💾 Results saved to: {output_file}")
-    csv_file = str(output_file).replace('.json', '.csv')
-    print(f"📊 CSV saved to: {csv_file}")
-    print(f"📊 Total processed: {len(results)} variations")
+        while future_to_run:
+            done, _ = wait(future_to_run, return_when=FIRST_COMPLETED)
+            collect(done)
+
+
+async def _run_variations_async(tasks: Iterable[tuple],
+                                model_name: str,
+                                max_tokens: int,
+                                platform: str,
+                                temperature: float,
+                                max_retries: int,
+                                retry_sleep: int,
+                                metrics_function,
+                                concurrency: int,
+                                on_result: Callable[[VariationRun, Optional[Dict[str, Any]]], None],
+                                response_cache: Optional[ResponseCache] = None,
+                                score: bool = True) -> None:
+    """
+    Process (run, variation, variation_num) tasks on the running event loop with at most `concurrency` requests in flight.
+
+    The next task is only taken from the iterator once a slot frees up, so inputs are consumed
+    at the rate the provider answers. on_result(run, result) is called as requests finish.
+    """
+    # The HTTP pool must allow as many connections as there are requests in flight
+    if get_client_pool_settings()['max_connections'] < concurrency:
+        configure_client_pool(max_connections=concurrency)
+
+    task_to_run = {}
+
+    def collect(done) -> None:
+        for task in done:
+            run = task_to_run.pop(task)
+            try:
+                result = task.result()
+            except Exception as e:
+                print(f"❌ Unexpected error in async processing: {e}")
+                result = None
+            on_result(run, result)
+
+    try:
+        for run, variation, i in tasks:
+            if len(task_to_run) >= concurrency:
+                done, _ = await asyncio.wait(task_to_run, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+            task = asyncio.create_task(process_single_variation_async(
+                variation, model_name, max_tokens, platform, temperature,
+                max_retries, retry_sleep, i, metrics_function, response_cache, score
+            ))
+            task_to_run[task] = run
+
+        while task_to_run:
+            done, _ = await asyncio.wait(task_to_run, return_when=asyncio.FIRST_COMPLETED)
+            collect(done)
+    finally:
+        await aclose_async_clients()
+
+
+def create_run_variation(variation: Dict[str, Any], run_number: int) -> Dict[str, Any]:
+    """Copy of a variation for one of its runs."""
+    row_idx = variation.get('original_row_index', 0)
+    variation_index = variation.get('variation_count')
+    variation_copy = variation.copy()
+    variation_copy['run_number'] = run_number
+    variation_copy['unique_run_id'] = f"{row_idx}_{variation_index}_{run_number}"
+    return variation_copy
+
+
+def load_resume_state(output_file: str) -> tuple:
+    """
+    Load what a resumed run needs: (results in memory, processed keys, saved results still on disk).
+
+    With a resume index only journaled results are loaded and the saved ones stay on disk;
+    otherwise all existing results are loaded.
+    """
+    indexed_keys = load_resume_index(output_file)
+    if indexed_keys is None:
+        results = load_existing_results(output_file)
+        return results, get_processed_variation_indices(results), False
+
+    journaled = [result for result in ResultJournal.replay(output_file)
+                 if get_result_key(result) not in indexed_keys]
+    if journaled:
+        print(f"📂 Replayed {len(journaled)} results from journal {get_journal_path(output_file)}")
+    print(f"📂 Loaded resume index with {len(indexed_keys)} results")
+    return journaled, indexed_keys | get_processed_variation_indices(journaled), True
 
 
 def load_existing_results(output_file: str) -> List[Dict[str, Any]]:
+    """Load existing results for resume: the saved CSV/JSON plus results journaled by an interrupted run."""
+    results = _load_saved_results(output_file)
+
+    journaled = ResultJournal.replay(output_file)
+    if journaled:
+        # A run interrupted during compaction can leave results in both places
+        processed = get_processed_variation_indices(results)
+        journaled = [result for result in journaled if get_result_key(result) not in processed]
+        print(f"📂 Replayed {len(journaled)} results from journal {get_journal_path(output_file)}")
+        results.extend(journaled)
+
+    return results
+
+
+def _load_saved_results(output_file: str) -> List[Dict[str, Any]]:
     """Load existing results from CSV file if it exists (for resume functionality)."""
     # Check for CSV file first (faster loading for resume)
     csv_file = str(output_file).replace('.json', '.csv')
@@ -341,14 +926,16 @@ def load_existing_results(output_file: str) -> List[Dict[str, Any]]:
 
 
 def save_batch_results(results: List[Dict[str, Any]], output_file: str) -> None:
-    """Save results to JSON file."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    """Save results to JSON file (atomically, so an interrupted save never leaves a truncated file)."""
+    write_atomically(output_file, lambda f: json.dump(results, f, indent=2, ensure_ascii=False))
 
     # Also save CSV
     csv_file = str(output_file).replace('.json', '.csv')
     save_results_as_csv(results, csv_file)
 
+    # Keys of the saved results, so resume does not need to parse them
+    write_resume_index([get_result_key(result) for result in results if 'variation_index' in result], output_file)
+
 
 def save_results_as_csv(results: List[Dict[str, Any]], csv_file: str) -> None:
     """Save results as CSV with essential information."""
@@ -364,7 +951,7 @@ def save_results_as_csv(results: List[Dict[str, Any]], csv_file: str) -> None:
     
     columns = base_columns + available_metrics
 
-    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+    def write_rows(f):
         writer = csv.DictWriter(f, fieldnames=columns)
         writer.writeheader()
         
@@ -373,6 +960,8 @@ def save_results_as_csv(results: List[Dict[str, Any]], csv_file: str) -> None:
             csv_row = {col: result.get(col, 0.0 if col in metric_columns else '') for col in columns}
             writer.writerow(csv_row)
 
+    write_atomically(csv_file, write_rows, newline='')
+
 
 class BatchRunnerBase:
     """Base class for batch processing of language model tasks."""
@@ -429,6 +1018,37 @@ class BatchRunnerBase:
         """Create a metrics function that uses the specified gold_field. Override in subclasses."""
         return None
 
+    def get_output_file(self, file_path: Path, full_model_name: str) -> Path:
+        """Results file for a variation file (tasks_data/results/<task>/<model>/<file stem>.json)."""
+        main_dir = Path(__file__).parent.parent  # Go to project root
+        results_dir = main_dir / "tasks_data" / "results" / self.data_dir_name
+        model_short = MODEL_SHORT_NAMES.get(full_model_name, "unknown")
+        results_dir = results_dir / model_short
+        results_dir.mkdir(parents=True, exist_ok=True)
+        return results_dir / f"{file_path.stem}.json"
+
+    def load_filtered_variations(self, file_path: Path, args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+        """Stream the variations of a file limited to --rows/--variations; raises ValueError if none are left."""
+        return stream_variations_file(str(file_path), max_rows=args.rows, max_variations_per_row=args.variations)
+
+    def get_metrics_function_for_args(self, args: argparse.Namespace) -> Optional[Callable]:
+        """Metrics function for the run - check if gold_field is specified."""
+        if hasattr(args, 'gold_field') and args.gold_field:
+            return self.create_metrics_function_with_gold_field(args.gold_field)
+        return self.get_metrics_function()
+
+    def get_engine_options(self, args: argparse.Namespace) -> Dict[str, Any]:
+        """Engine, rate limit and cache options of the parsed arguments (optional ones fall back to defaults)."""
+        return {
+            "engine": getattr(args, 'engine', LM_DEFAULT_ENGINE),
+            "concurrency": getattr(args, 'concurrency', LM_DEFAULT_ASYNC_CONCURRENCY),
+            "requests_per_minute": getattr(args, 'rpm', None),
+            "tokens_per_minute": getattr(args, 'tpm', None),
+            "use_response_cache": not getattr(args, 'no_response_cache', False),
+            "batch_poll_interval": getattr(args, 'batch_poll_interval', LM_BATCH_API_POLL_INTERVAL),
+            "metric_workers": getattr(args, 'metric_workers', LM_DEFAULT_METRIC_WORKERS),
+        }
+
     def run_language_model_on_file(self, file_path: Path, args: argparse.Namespace) -> Dict[str, Any]:
         """Run the language model on a single file."""
         identifier = self.extract_identifier_from_filename(file_path.name)
@@ -440,48 +1060,11 @@ class BatchRunnerBase:
         try:
             # Get the full model name
             full_model_name = get_model_name(args.platform, args.model)
-            
-            # Create output file path
-            main_dir = Path(__file__).parent.parent  # Go to project root
-            results_dir = main_dir / "tasks_data" / "results" / self.data_dir_name
-            model_short = MODEL_SHORT_NAMES.get(full_model_name, "unknown")
-            results_dir = results_dir / model_short
-            results_dir.mkdir(parents=True, exist_ok=True)
-            output_file = results_dir / f"{file_path.stem}.json"
-            
-            # Load variations
-            variations = load_variations_file(str(file_path))
-            if not variations:
-                return self.create_result_dict(
-                    identifier, "error", time.time() - start_time, 
-                    error="No variations found"
-                )
-            
-            # Filter variations based on row and variation limits
-            filtered_variations = filter_variations_by_rows_and_variations(
-                variations,
-                max_rows=args.rows,
-                max_variations_per_row=args.variations
-            )
-            
-            if not filtered_variations:
-                return self.create_result_dict(
-                    identifier, "error", time.time() - start_time,
-                    error="No variations to process after filtering"
-                )
-            
-            # Get metrics function - check if gold_field is specified
-            metrics_function = None
-            if hasattr(args, 'gold_field') and args.gold_field:
-                metrics_function = self.create_metrics_function_with_gold_field(args.gold_field)
-            else:
-                metrics_function = self.get_metrics_function()
-            
-            # Get runs_per_sample if available (only for code generation)
-            runs_per_sample = getattr(args, 'runs_per_sample', 1)
-            
+            output_file = self.get_output_file(file_path, full_model_name)
+            filtered_variations = self.load_filtered_variations(file_path, args)
+
             # Run model on variations
-            run_model_on_variations(
+            variations_processed = run_model_on_variations(
                 filtered_variations,
                 full_model_name,
                 args.max_tokens,
@@ -493,13 +1076,15 @@ class BatchRunnerBase:
                 batch_size=args.batch_size,
                 resume=not args.no_resume,
                 parallel_workers=args.parallel_workers,
-                metrics_function=metrics_function,
-                runs_per_sample=runs_per_sample
+                metrics_function=self.get_metrics_function_for_args(args),
+                # runs_per_sample is only set for code generation
+                runs_per_sample=getattr(args, 'runs_per_sample', 1),
+                **self.get_engine_options(args)
             )
             
             return self.create_result_dict(
                 identifier, "success", time.time() - start_time,
-                variations_processed=len(filtered_variations),
+                variations_processed=variations_processed,
                 output_file=str(output_file)
             )
             
@@ -508,6 +1093,113 @@ class BatchRunnerBase:
                 identifier, "error", time.time() - start_time,
                 error=str(e)
             )
+
+    def run_language_model_on_files(self, files: List[Path], args: argparse.Namespace) -> List[Dict[str, Any]]:
+        """
+        Run the language model on several files through one shared worker pool.
+
+        Files are loaded lazily as the global work queue reaches them, and the runs of consecutive
+        files overlap, so the pool never drains between files. Every file keeps its own results file,
+        journal and resume state; a file is saved and reported as soon as its last run finishes.
+        Returns one result dict per file, in the order of `files`.
+        """
+        results_by_file = {}
+        start_time = time.time()
+
+        def report(file_path: Path, result: Dict[str, Any]) -> None:
+            results_by_file[file_path] = result
+            display_name = self.get_display_name(self.extract_identifier_from_filename(file_path.name))
+            if result["status"] == "success":
+                variations_count = result.get("variations_processed", "unknown")
+                print(f"✅ {display_name} completed in {result['duration']:.1f}s ({variations_count} variations)")
+            else:
+                print(f"❌ {display_name} failed: {result.get('error', 'Unknown error')} in {result['duration']:.1f}s")
+            if len(results_by_file) < len(files):
+                self.print_progress_summary(list(results_by_file.values()), len(results_by_file), len(files))
+
+        try:
+            full_model_name = get_model_name(args.platform, args.model)
+        except ValueError as e:
+            for file_path in files:
+                report(file_path, self.create_result_dict(
+                    self.extract_identifier_from_filename(file_path.name), "error", 0.0, error=str(e)))
+            return [results_by_file[file_path] for file_path in files]
+
+        engine_options = self.get_engine_options(args)
+        run_files = {}
+
+        def file_runs() -> Iterable[VariationRun]:
+            for i, file_path in enumerate(files, 1):
+                identifier = self.extract_identifier_from_filename(file_path.name)
+                display_name = self.get_display_name(identifier)
+                print(f"\n🚀 Queueing {i}/{len(files)}: {file_path.name} ({display_name})")
+
+                file_start_time = time.time()
+                try:
+                    filtered_variations = self.load_filtered_variations(file_path, args)
+                    run = VariationRun(
+                        filtered_variations, str(self.get_output_file(file_path, full_model_name)),
+                        batch_size=args.batch_size, resume=not args.no_resume,
+                        runs_per_sample=getattr(args, 'runs_per_sample', 1), name=display_name
+                    )
+                except Exception as e:
+                    report(file_path, self.create_result_dict(
+                        identifier, "error", time.time() - file_start_time, error=str(e)))
+                    continue
+
+                run_files[run] = (file_path, identifier)
+                yield run
+
+        def on_run_done(run: VariationRun) -> None:
+            file_path, identifier = run_files[run]
+            if run.error is not None:
+                report(file_path, self.create_result_dict(identifier, "error", run.duration, error=run.error))
+                return
+            report(file_path, self.create_result_dict(
+                identifier, "success", run.duration,
+                variations_processed=run.num_variations,
+                output_file=run.output_file
+            ))
+
+        print_engine_settings(full_model_name, args.batch_size, not args.no_resume, engine_options["engine"],
+                              args.parallel_workers, engine_options["concurrency"])
+        try:
+            response_cache = setup_request_limits(
+                full_model_name, args.platform, engine_options["requests_per_minute"],
+                engine_options["tokens_per_minute"], engine_options["use_response_cache"]
+            )
+            cache_stats_before = response_cache.stats() if response_cache is not None else None
+
+            run_model_on_files(
+                file_runs(),
+                full_model_name,
+                args.max_tokens,
+                args.platform,
+                temperature=args.temperature,
+                max_retries=args.max_retries,
+                retry_sleep=args.retry_sleep,
+                metrics_function=self.get_metrics_function_for_args(args),
+                engine=engine_options["engine"],
+                parallel_workers=args.parallel_workers,
+                concurrency=engine_options["concurrency"],
+                batch_poll_interval=engine_options["batch_poll_interval"],
+                response_cache=response_cache,
+                on_run_done=on_run_done,
+                metric_workers=engine_options["metric_workers"]
+            )
+
+            if response_cache is not None:
+                print(f"🗄️  Response cache: {format_cache_stats(cache_stats_before, response_cache.stats())}")
+        except Exception as e:
+            # Files that did not finish keep their journals and are resumed on the next run
+            print(f"❌ Processing stopped: {e}")
+            for file_path in files:
+                if file_path not in results_by_file:
+                    report(file_path, self.create_result_dict(
+                        self.extract_identifier_from_filename(file_path.name), "error",
+                        time.time() - start_time, error=str(e)))
+
+        return [results_by_file[file_path] for file_path in files]
     
     def print_progress_summary(self, results: List[Dict[str, Any]], current: int, total: int) -> None:
         """Print a progress summary."""
@@ -546,10 +1238,15 @@ class BatchRunnerBase:
                            help="Maximum variations per row to process (None = all variations)")
 
         # Retry and batch options
-        parser.add_argument("--max_retries", type=int, default=3,
-                            help="Maximum number of retries for rate limit errors (default: 3)")
-        parser.add_argument("--retry_sleep", type=int, default=60,
-                            help="Base sleep time in seconds for rate limit retries (default: 60)")
+        parser.add_argument("--max_retries", type=int, default=LM_DEFAULT_MAX_RETRIES,
+                            help=f"Maximum number of retries for rate limit errors (default: {LM_DEFAULT_MAX_RETRIES})")
+        parser.add_argument("--retry_sleep", type=float, default=LM_DEFAULT_RETRY_SLEEP,
+                            help="Maximum backoff in seconds between rate limit retries; retry-after hints "
+                                 f"from the provider are always honored (default: {LM_DEFAULT_RETRY_SLEEP})")
+        parser.add_argument("--rpm", type=float, default=None,
+                            help="Requests per minute quota for the model (None = unlimited, adapt to rate limit errors)")
+        parser.add_argument("--tpm", type=float, default=None,
+                            help="Tokens per minute quota for the model (None = unlimited, adapt to rate limit errors)")
         parser.add_argument("--batch_size", type=int, default=10,
                             help="Number of variations to process before saving intermediate results (default: 10)")
 
@@ -557,9 +1254,23 @@ class BatchRunnerBase:
         parser.add_argument("--no_resume", action="store_true",
                             help="Don't resume from existing results files (start fresh)")
 
+        # Cache options
+        parser.add_argument("--no_response_cache", action="store_true",
+                            help="Don't serve temperature-0 requests from the on-disk response cache")
+
         # Parallel processing options
         parser.add_argument("--parallel_workers", type=int, default=LM_DEFAULT_PARALLEL_WORKERS,
                             help=f"Number of parallel workers for model calls (1=sequential, default: {LM_DEFAULT_PARALLEL_WORKERS})")
+        parser.add_argument("--engine", choices=LM_ENGINES, default=LM_DEFAULT_ENGINE,
+                            help="Execution engine: 'thread' (parallel_workers threads), 'async' (single event loop) "
+                                 f"or 'batch' (provider Batch API, OpenAI only) (default: {LM_DEFAULT_ENGINE})")
+        parser.add_argument("--concurrency", type=int, default=LM_DEFAULT_ASYNC_CONCURRENCY,
+                            help=f"Maximum in-flight requests for --engine async (default: {LM_DEFAULT_ASYNC_CONCURRENCY})")
+        parser.add_argument("--batch_poll_interval", type=float, default=LM_BATCH_API_POLL_INTERVAL,
+                            help=f"Seconds between status checks for --engine batch (default: {LM_BATCH_API_POLL_INTERVAL})")
+        parser.add_argument("--metric_workers", type=int, default=LM_DEFAULT_METRIC_WORKERS,
+                            help="Processes that score responses in batches after they are journaled "
+                                 f"(0 = score on the request workers, default: {LM_DEFAULT_METRIC_WORKERS})")
 
         # Note: gold_field is added by each specific batch runner with appropriate defaults
 
@@ -585,11 +1296,23 @@ class BatchRunnerBase:
         if args.variations is not None:
             print(f"Max variations per row: {args.variations}")
         print(f"Max retries: {args.max_retries}")
-        print(f"Retry sleep time: {args.retry_sleep} seconds")
+        print(f"Max retry backoff: {args.retry_sleep} seconds")
+        if getattr(args, 'rpm', None) or getattr(args, 'tpm', None):
+            print(f"Rate limits: {args.rpm or 'unlimited'} requests/min, {args.tpm or 'unlimited'} tokens/min")
         print(f"Batch size: {args.batch_size}")
         resume_mode = not args.no_resume
         print(f"Resume mode: {resume_mode}")
-        print(f"Parallel workers: {args.parallel_workers} {'(sequential)' if args.parallel_workers == 1 else '(parallel)'}")
+        print(f"Response cache: {not getattr(args, 'no_response_cache', False)}")
+        engine = getattr(args, 'engine', LM_DEFAULT_ENGINE)
+        if engine == "async":
+            print(f"Engine: async (up to {args.concurrency} requests in flight)")
+        elif engine == "batch":
+            print(f"Engine: provider Batch API (polling every {args.batch_poll_interval}s)")
+        else:
+            print(f"Parallel workers: {args.parallel_workers} {'(sequential)' if args.parallel_workers == 1 else '(parallel)'}")
+        metric_workers = getattr(args, 'metric_workers', LM_DEFAULT_METRIC_WORKERS)
+        if metric_workers > 0:
+            print(f"Metric workers: {metric_workers} (deferred, batched scoring)")
         
         # Show runs per sample if available (only for code generation)
         runs_per_sample = getattr(args, 'runs_per_sample', 1)
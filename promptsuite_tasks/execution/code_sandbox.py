@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Process-based sandbox pool for executing generated code (HumanEval completions).
+
+Every program runs in its own short-lived child process with resource limits (address space and
+CPU time), stdio redirected to /dev/null, destructive os/shutil/subprocess functions disabled and a
+private scratch working directory. A single scheduler keeps up to `workers` children running,
+collects each result over a pipe and kills children that exceed the per-test timeout, so one
+pool executes the completions of all samples without intermediate files.
+
+Like human_eval's own execution guard, this protects the evaluation from accidents in generated
+code (runaway loops, memory blowups, deleted files); it is not a security boundary against
+deliberately malicious code.
+"""
+
+import math
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from multiprocessing.connection import wait
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from promptsuite_tasks.constants import CODE_EXEC_DEFAULT_WORKERS, CODE_EXEC_TIMEOUT, CODE_EXEC_MEMORY_LIMIT_MB
+
+# Functions disabled in the child before the program runs (module name -> attribute names)
+_DISABLED_FUNCTIONS = {
+    'os': ('kill', 'killpg', 'system', 'putenv', 'remove', 'removedirs', 'rmdir', 'fchdir', 'setuid',
+           'fork', 'forkpty', 'rename', 'renames', 'truncate', 'replace', 'unlink', 'fchmod', 'fchown',
+           'chmod', 'chown', 'chroot', 'lchown', 'getcwd', 'chdir'),
+    'shutil': ('rmtree', 'move', 'chown'),
+    'subprocess': ('Popen',),
+}
+
+# Error types reported by the pool itself (program errors are reported by exception class name)
+TIMEOUT_ERROR = 'timed out'
+CRASH_ERROR = 'crashed'
+
+
+def _limit_resources(timeout: float, memory_limit_bytes: Optional[int]) -> None:
+    if resource is None:
+        return
+    limits = [(resource.RLIMIT_CPU, math.ceil(timeout) + 1)]
+    if memory_limit_bytes:
+        limits.append((resource.RLIMIT_AS, memory_limit_bytes))
+    for limit, value in limits:
+        try:
+            resource.setrlimit(limit, (value, value))
+        except (ValueError, OSError):
+            pass  # Limit not supported on this platform
+
+
+def _disable_destructive_functions() -> None:
+    import importlib
+    for module_name, names in _DISABLED_FUNCTIONS.items():
+        module = importlib.import_module(module_name)
+        for name in names:
+            if hasattr(module, name):
+                setattr(module, name, None)
+
+
+def _execute_program(program: str, conn, work_dir: str, timeout: float, memory_limit_bytes: Optional[int]) -> None:
+    """Child process entry point: run program and send {'passed', 'error'} back over conn."""
+    _limit_resources(timeout, memory_limit_bytes)
+    os.chdir(work_dir)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    _disable_destructive_functions()
+
+    try:
+        exec(program, {})
+        result = {'passed': True, 'error': None}
+    except BaseException as e:  # Includes SystemExit and KeyboardInterrupt raised by the program
+        result = {'passed': False, 'error': type(e).__name__}
+    try:
+        conn.send(result)
+    finally:
+        os._exit(0)
+
+
+class CodeSandboxPool:
+    """Runs programs in sandboxed child processes, up to `workers` at a time."""
+
+    def __init__(self, workers: int = CODE_EXEC_DEFAULT_WORKERS, timeout: float = CODE_EXEC_TIMEOUT,
+                 memory_limit_mb: int = CODE_EXEC_MEMORY_LIMIT_MB):
+        """
+        Create the pool.
+
+        Args:
+            workers: Maximum number of programs executing at the same time
+            timeout: Seconds a program may run before its process is killed
+            memory_limit_mb: Address space limit of each program in MB (0 = unlimited)
+        """
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        # Fork is cheap and needs no pickling; other platforms spawn a fresh interpreter per program
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context('fork')
+        else:
+            self._context = multiprocessing.get_context()
+        self._work_dir = tempfile.mkdtemp(prefix='code_sandbox_')
+
+    def _start(self, program: str) -> Tuple[Any, Any]:
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_execute_program,
+            args=(program, sender, self._work_dir, self.timeout, self.memory_limit_bytes),
+            daemon=True
+        )
+        process.start()
+        sender.close()
+        return process, receiver
+
+    def run(self, programs: Iterable[Tuple[Any, str]]) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """
+        Execute (key, program) pairs and yield (key, result) as programs finish.
+
+        A result is {'passed': bool, 'error': error type or None}; the error type is the exception
+        class name raised by the program, TIMEOUT_ERROR, or CRASH_ERROR when the process died
+        without reporting (e.g. killed by a resource limit).
+        """
+        programs = iter(programs)
+        running = {}  # pipe -> (process, key, deadline)
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(running) < self.workers:
+                    item = next(programs, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    key, program = item
+                    process, receiver = self._start(program)
+                    running[receiver] = (process, key, time.monotonic() + self.timeout)
+                if not running:
+                    return
+
+                next_deadline = min(deadline for _, _, deadline in running.values())
+                for receiver in wait(list(running), timeout=max(0.0, next_deadline - time.monotonic())):
+                    process, key, _ = running.pop(receiver)
+                    try:
+                        result = receiver.recv()
+                    except (EOFError, OSError):
+                        result = {'passed': False, 'error': CRASH_ERROR}
+                    receiver.close()
+                    process.join()
+                    yield key, result
+
+                now = time.monotonic()
+                for receiver, (process, key, deadline) in list(running.items()):
+                    if deadline <= now:
+                        del running[receiver]
+                        process.kill()
+                        process.join()
+                        receiver.close()
+                        yield key, {'passed': False, 'error': TIMEOUT_ERROR}
+        finally:
+            # Stopped early (error or abandoned generator): kill the programs still running
+            for receiver, (process, _, _) in running.items():
+                process.kill()
+                process.join()
+                receiver.close()
+
+    def close(self) -> None:
+        """Remove the scratch working directory."""
+        shutil.rmtree(self._work_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
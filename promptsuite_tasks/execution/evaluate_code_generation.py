@@ -12,13 +12,18 @@ python evaluate_code_generation.py --results_file promptsuite_tasks/tasks_data/r
 import argparse
 import json
 import os
-import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 from collections import defaultdict
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+
+from promptsuite_tasks.constants import CODE_EXEC_DEFAULT_WORKERS, CODE_EXEC_TIMEOUT, CODE_EXEC_MEMORY_LIMIT_MB
+from promptsuite_tasks.execution.code_sandbox import CodeSandboxPool
+from promptsuite_tasks.execution.execution_cache import ExecutionCache, get_execution_cache
+from promptsuite_tasks.execution.response_cache import format_cache_stats
+
+PASS_AT_K_VALUES = [1, 2, 3, 5, 10]
 
 
 def load_code_generation_results(results_file: str) -> List[Dict[str, Any]]:
@@ -46,14 +51,19 @@ def group_results_by_sample(results: List[Dict[str, Any]]) -> Dict[str, List[Dic
     return dict(grouped)
 
 
+@lru_cache(maxsize=None)
+def _load_test_task_ids(data_file: str) -> List[str]:
+    df = pd.read_csv(data_file)
+    return df[df['split'] == 'test']['task_id'].tolist()
+
+
 def get_task_id_from_row_index(row_index: int, data_file: str = None) -> str:
     """Get HumanEval task_id from row index."""
     if data_file and os.path.exists(data_file):
         try:
-            df = pd.read_csv(data_file)
-            df_test = df[df['split'] == 'test']
-            if row_index < len(df_test):
-                return df_test.iloc[row_index]['task_id']
+            task_ids = _load_test_task_ids(data_file)
+            if row_index < len(task_ids):
+                return task_ids[row_index]
         except Exception as e:
             print(f"⚠️ Error reading data file: {e}")
     
@@ -61,210 +71,154 @@ def get_task_id_from_row_index(row_index: int, data_file: str = None) -> str:
     return f"HumanEval/{row_index}"
 
 
-def evaluate_code_samples_with_human_eval(samples: List[Dict[str, Any]], task_id: str, sample_key: str, evaluation_dir: str) -> Dict[str, float]:
-    """Evaluate multiple code samples for a single task using human_eval."""
-    try:
-        from human_eval.data import write_jsonl
-        from human_eval.evaluation import evaluate_functional_correctness
-        import os
-        
-        # Prepare samples for evaluation
-        eval_samples = []
-        for i, sample in enumerate(samples):
-            completion = sample.get('model_response', '')
-            if completion.strip():  # Only add non-empty completions
-                eval_samples.append({
-                    "task_id": task_id,
-                    "completion": completion
-                })
-        
-        # If no valid samples, return zeros
-        if not eval_samples:
-            print(f"⚠️ No valid completions found for {task_id}")
-            results = {}
-            k_values = [1, 2, 3, 5, 10]
-            for k in k_values:
-                results[f'pass@{k}'] = 0.0
-            return results
-        
-        # Create descriptive file names based on task and variation
-        task_name = task_id.replace('/', '_')
-        task_file = os.path.join(evaluation_dir, f"{task_name}_{sample_key}_eval.jsonl")
-        
-        # Write task-specific file
+def build_check_program(problem: Dict[str, Any], completion: str) -> str:
+    """Program that runs a completion against the tests of its HumanEval problem (as human_eval does)."""
+    return (problem["prompt"] + completion + "\n" + problem["test"] + "\n" +
+            f"check({problem['entry_point']})")
+
+
+def estimate_pass_at_k(num_samples: int, num_correct: int, k: int) -> float:
+    """Unbiased pass@k estimator of the HumanEval paper: 1 - C(n - c, k) / C(n, k)."""
+    if num_samples - num_correct < k:
+        return 1.0
+    product = 1.0
+    for i in range(num_samples - num_correct + 1, num_samples + 1):
+        product *= 1.0 - k / i
+    return 1.0 - product
+
+
+def calculate_pass_at_k(num_runs: int, num_completions: int, num_passed: int) -> Dict[str, float]:
+    """
+    pass@k of a sample from the execution results of its completions.
+
+    k goes up to min(num_runs, 10); like evaluate_functional_correctness with ignore_incomplete,
+    pass@k is 0.0 when fewer than k runs have a non-empty completion.
+    """
+    if num_completions == 0:
+        return {f'pass@{k}': 0.0 for k in PASS_AT_K_VALUES}
+
+    max_k = min(num_runs, 10)
+    return {
+        f'pass@{k}': estimate_pass_at_k(num_completions, num_passed, k) if num_completions >= k else 0.0
+        for k in PASS_AT_K_VALUES if k <= max_k
+    }
+
+
+def evaluate_code_samples_by_syntax(samples: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Fallback pass@k that only checks that the non-empty completions compile."""
+    syntactically_correct = []
+    for sample in samples:
+        completion = sample.get('model_response', '')
+        if not completion.strip():
+            continue
         try:
-            write_jsonl(task_file, eval_samples)
-            # Small delay to ensure file is fully written
-            time.sleep(0.1)
-        except Exception as e:
-            print(f"❌ Failed to write task file {task_file}: {e}")
-            raise
-        
-        # Evaluate with different k values
-        results = {}
-        max_k = min(len(samples), 10)  # Evaluate up to k=10 or number of samples
-        k_values = [k for k in [1, 2, 3, 5, 10] if k <= max_k]
-        
-        try:            
-            # Validate that the file was written correctly
-            if not os.path.exists(task_file):
-                raise Exception(f"Task file does not exist: {task_file}")
-            
-            if os.path.getsize(task_file) == 0:
-                raise Exception(f"Task file is empty: {task_file}")
-            
-            # Validate file content
-            try:
-                with open(task_file, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) != len(eval_samples):
-                        raise Exception(f"File line count mismatch: expected {len(eval_samples)}, got {len(lines)}")
-                    
-                    # Try to parse first line to ensure valid JSON
-                    if lines:
-                        json.loads(lines[0])
-            except Exception as e:
-                raise Exception(f"Task file validation failed for {task_file}: {e}")
-            
-            eval_results = evaluate_functional_correctness(task_file, k=k_values, ignore_incomplete=True)
-            
-            # Validate eval_results
-            if not eval_results or not isinstance(eval_results, dict):
-                raise Exception(f"Invalid evaluation results for {task_id}")
-            
-            for k in k_values:
-                results[f'pass@{k}'] = eval_results.get(f'pass@{k}', 0.0)
-                
-        except Exception as e:
-            print(f"⚠️ HumanEval evaluation failed for {task_id}: {e}")
-            # Fallback to syntax checking
-            syntactically_correct = []
-            for sample in eval_samples:  # Use eval_samples instead of samples
-                try:
-                    completion = sample.get('completion', '')
-                    if completion.strip():
-                        compile(completion, '<string>', 'exec')
-                        syntactically_correct.append(True)
-                    else:
-                        syntactically_correct.append(False)
-                except:
-                    syntactically_correct.append(False)
-            
-            # Calculate pass@k based on syntax
-            max_k = min(len(syntactically_correct), 10) if syntactically_correct else 1
-            k_values = [k for k in [1, 2, 3, 5, 10] if k <= max_k]
-            
-            for k in k_values:
-                if len(syntactically_correct) >= k and any(syntactically_correct[:k]):
-                    results[f'pass@{k}'] = 1.0
-                else:
-                    results[f'pass@{k}'] = 0.0
-            
-        return results
-        
-    except ImportError:
-        print("⚠️ human_eval package not available, using syntactic correctness only")
-        # Fallback to syntax checking
-        syntactically_correct = []
-        for sample in samples:
-            try:
-                compile(sample.get('model_response', ''), '<string>', 'exec')
-                syntactically_correct.append(True)
-            except:
-                syntactically_correct.append(False)
-        
-        results = {}
-        max_k = min(len(samples), 10)
-        k_values = [k for k in [1, 2, 3, 5, 10] if k <= max_k]
-        
-        for k in k_values:
-            if any(syntactically_correct[:k]):
-                results[f'pass@{k}'] = 1.0
-            else:
-                results[f'pass@{k}'] = 0.0
-                
-        return results
-    
-    except Exception as e:
-        print(f"❌ Error in evaluation: {e}")
-        return {}
+            compile(completion, '<string>', 'exec')
+            syntactically_correct.append(True)
+        except Exception:
+            syntactically_correct.append(False)
 
+    max_k = min(len(syntactically_correct), 10) if syntactically_correct else 1
+    results = {}
+    for k in PASS_AT_K_VALUES:
+        if k <= max_k:
+            results[f'pass@{k}'] = 1.0 if any(syntactically_correct[:k]) else 0.0
+    return results
 
-def evaluate_single_sample(sample_data: tuple, data_file: str = None, evaluation_dir: str = None) -> tuple:
-    """Evaluate a single sample and return results."""
-    sample_key, runs = sample_data
-    
-    try:
-        # Get task_id from the first run
-        row_idx = runs[0].get('original_row_index', 0)
-        task_id = get_task_id_from_row_index(row_idx, data_file)
-        
-        # Evaluate all runs for this sample
-        sample_results = evaluate_code_samples_with_human_eval(runs, task_id, sample_key, evaluation_dir)
-        
-        return sample_key, sample_results
-    except Exception as e:
-        print(f"❌ Error evaluating sample {sample_key}: {e}")
-        return sample_key, {}
 
+def evaluate_all_samples(grouped_results: Dict[str, List[Dict[str, Any]]], data_file: str = None,
+                         max_workers: int = CODE_EXEC_DEFAULT_WORKERS, timeout: float = CODE_EXEC_TIMEOUT,
+                         memory_limit_mb: int = CODE_EXEC_MEMORY_LIMIT_MB,
+                         use_execution_cache: bool = True) -> Dict[str, Dict[str, float]]:
+    """
+    Evaluate all grouped samples and return pass@k metrics.
 
-def evaluate_all_samples(grouped_results: Dict[str, List[Dict[str, Any]]], data_file: str = None, max_workers: int = 4) -> Dict[str, Dict[str, float]]:
-    """Evaluate all grouped samples and return pass@k metrics."""
+    The completions of all samples are executed against their HumanEval tests by one sandbox
+    pool (see code_sandbox.py), and each sample's pass@k is computed as soon as its last
+    completion finishes. Each distinct (task_id, completion) is executed once; with
+    use_execution_cache, results of earlier evaluations are reused from the on-disk
+    execution cache (see execution_cache.py) and new results are stored there.
+    """
     evaluation_results = {}
-    
     total_samples = len(grouped_results)
-    print(f"🔄 Evaluating {total_samples} unique samples with {max_workers} workers...")
-    
-    # Use fixed evaluation directory
-    evaluation_dir = "human_eval_temp"
-    os.makedirs(evaluation_dir, exist_ok=True)
-    
-    print(f"📁 Using evaluation directory: {evaluation_dir}")
-    
-    # Thread-safe progress tracking
-    progress_lock = threading.Lock()
-    completed_count = [0]  # Use list for mutable reference
-    
-    def update_progress(sample_key: str, sample_results: Dict[str, float]):
-        with progress_lock:
-            completed_count[0] += 1
-            progress_pct = (completed_count[0] / total_samples) * 100
-            
-            if sample_results:
-                pass_at_1 = sample_results.get('pass@1', 0.0)
-                print(f"   ✅ ({completed_count[0]}/{total_samples}, {progress_pct:.1f}%) Sample {sample_key}: pass@1 = {pass_at_1:.3f}")
-            else:
-                print(f"   ❌ ({completed_count[0]}/{total_samples}, {progress_pct:.1f}%) Sample {sample_key}: evaluation failed")
-    
+
+    def report(sample_key: str, sample_results: Dict[str, float]):
+        evaluation_results[sample_key] = sample_results
+        progress_pct = (len(evaluation_results) / total_samples) * 100
+        if sample_results:
+            pass_at_1 = sample_results.get('pass@1', 0.0)
+            print(f"   ✅ ({len(evaluation_results)}/{total_samples}, {progress_pct:.1f}%) Sample {sample_key}: pass@1 = {pass_at_1:.3f}")
+        else:
+            print(f"   ❌ ({len(evaluation_results)}/{total_samples}, {progress_pct:.1f}%) Sample {sample_key}: evaluation failed")
+
     try:
-        # Prepare sample data for parallel processing
-        sample_items = list(grouped_results.items())
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_sample = {}
-            for sample_data in sample_items:
-                future = executor.submit(evaluate_single_sample, sample_data, data_file, evaluation_dir)
-                future_to_sample[future] = sample_data[0]  # sample_key
-            
-            # Process completed tasks
-            for future in as_completed(future_to_sample):
-                try:
-                    sample_key, sample_results = future.result()
-                    evaluation_results[sample_key] = sample_results
-                    update_progress(sample_key, sample_results)
-                except Exception as e:
-                    sample_key = future_to_sample[future]
-                    print(f"❌ Error processing sample {sample_key}: {e}")
-                    evaluation_results[sample_key] = {}
-                    update_progress(sample_key, {})
-    
-    finally:
-        print(f"📁 Evaluation files saved in directory: {evaluation_dir}")
-        # Count evaluation files created
-        eval_files = [f for f in os.listdir(evaluation_dir) if f.endswith('_eval.jsonl')]
-        print(f"📄 Created {len(eval_files)} evaluation files")
-    
+        from human_eval.data import read_problems
+    except ImportError:
+        print("⚠️ human_eval package not available, using syntactic correctness only")
+        for sample_key, runs in grouped_results.items():
+            report(sample_key, evaluate_code_samples_by_syntax(runs))
+        return evaluation_results
+
+    problems = read_problems()
+    execution_cache = get_execution_cache() if use_execution_cache else None
+    cache_stats_before = execution_cache.stats() if execution_cache else None
+
+    pending = {}  # sample_key -> [runs, completions, completions without a result, passed]
+
+    def add_result(sample_key: str, result: Dict[str, Any]):
+        state = pending[sample_key]
+        state[2] -= 1
+        state[3] += result['passed']
+        if state[2] == 0:
+            num_runs, num_completions, _, num_passed = state
+            report(sample_key, calculate_pass_at_k(num_runs, num_completions, num_passed))
+
+    # Programs of all samples, executed by a single scheduler; identical completions of a task share one execution
+    programs = []
+    waiting = {}  # completion key -> sample_keys waiting for its result
+    cached_results = []
+    for sample_key, runs in grouped_results.items():
+        task_id = get_task_id_from_row_index(runs[0].get('original_row_index', 0), data_file)
+        problem = problems.get(task_id)
+        if problem is None:
+            print(f"⚠️ Unknown HumanEval task {task_id} for sample {sample_key}, using syntactic correctness")
+            report(sample_key, evaluate_code_samples_by_syntax(runs))
+            continue
+
+        completions = [run.get('model_response', '') for run in runs]
+        completions = [completion for completion in completions if completion.strip()]
+        if not completions:
+            print(f"⚠️ No valid completions found for {task_id}")
+            report(sample_key, calculate_pass_at_k(len(runs), 0, 0))
+            continue
+
+        pending[sample_key] = [len(runs), len(completions), len(completions), 0]
+        for completion in completions:
+            completion_key = ExecutionCache.make_key(task_id, completion)
+            if completion_key in waiting:
+                waiting[completion_key].append(sample_key)
+                continue
+            cached = execution_cache.get(completion_key) if execution_cache else None
+            if cached is not None:
+                cached_results.append((sample_key, cached))
+                continue
+            waiting[completion_key] = [sample_key]
+            programs.append((completion_key, build_check_program(problem, completion)))
+
+    for sample_key, result in cached_results:
+        add_result(sample_key, result)
+
+    print(f"🔄 Executing {len(programs)} distinct completions of {len(pending)} samples with {max_workers} "
+          f"sandbox workers (timeout {timeout}s)...")
+    with CodeSandboxPool(max_workers, timeout, memory_limit_mb) as pool:
+        for completion_key, result in pool.run(programs):
+            if execution_cache:
+                execution_cache.set(completion_key, result)
+            for sample_key in waiting.pop(completion_key):
+                add_result(sample_key, result)
+
+    if execution_cache:
+        print(f"🗄️  Execution cache: {format_cache_stats(cache_stats_before, execution_cache.stats())}")
+
     return evaluation_results
 
 
@@ -324,8 +278,14 @@ def main():
                         help="Path to original data file for task_id mapping")
     parser.add_argument("--output_suffix", type=str, default="_evaluation",
                         help="Suffix for output evaluation files")
-    parser.add_argument("--max_workers", type=int, default=2,
-                        help="Number of parallel workers for evaluation (default: 10)")
+    parser.add_argument("--max_workers", type=int, default=CODE_EXEC_DEFAULT_WORKERS,
+                        help=f"Completions executing in parallel sandbox processes (default: {CODE_EXEC_DEFAULT_WORKERS})")
+    parser.add_argument("--timeout", type=float, default=CODE_EXEC_TIMEOUT,
+                        help=f"Seconds per completion before it is killed (default: {CODE_EXEC_TIMEOUT})")
+    parser.add_argument("--memory_limit_mb", type=int, default=CODE_EXEC_MEMORY_LIMIT_MB,
+                        help=f"Address space limit per completion in MB, 0 = unlimited (default: {CODE_EXEC_MEMORY_LIMIT_MB})")
+    parser.add_argument("--no_execution_cache", action="store_true",
+                        help="Execute every completion instead of reusing results from the on-disk execution cache")
     
     args = parser.parse_args()
     
@@ -376,7 +336,9 @@ def main():
             print(f"🔄 Runs per sample: min={min_runs}, max={max_runs}, avg={avg_runs:.1f}")
         
         # Evaluate all samples
-        evaluation_results = evaluate_all_samples(grouped_results, args.data_file, args.max_workers)
+        evaluation_results = evaluate_all_samples(grouped_results, args.data_file, args.max_workers,
+                                                  args.timeout, args.memory_limit_mb,
+                                                  use_execution_cache=not args.no_execution_cache)
         
         # Calculate overall metrics
         overall_metrics = calculate_overall_metrics(evaluation_results)
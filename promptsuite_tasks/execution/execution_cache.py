@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of HumanEval execution results.
+
+runs_per_sample copies and many prompt variations produce the same completion for the same task,
+so the outcome of running a completion against its tests is stored in an SQLite database keyed by
+a hash of (task_id, normalized completion) and reused by later samples and evaluation reruns
+instead of executing the completion again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from promptsuite.shared.constants import LLMCacheConstants
+from promptsuite.shared.llm_cache import LLMResponseCache
+from promptsuite_tasks.constants import CODE_EXEC_CACHE_FILENAME, CODE_EXEC_CACHE_MAX_SIZE_BYTES
+from promptsuite_tasks.execution.code_sandbox import CRASH_ERROR, TIMEOUT_ERROR
+
+
+class ExecutionCache:
+    """Execution result cache with hit/miss counters (shared by the whole process)."""
+
+    def __init__(self, path: str, max_size_bytes: int = CODE_EXEC_CACHE_MAX_SIZE_BYTES):
+        self.store = LLMResponseCache(path, max_size_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_completion(completion: str) -> str:
+        """
+        Completion without differences that do not change how it runs.
+
+        Line endings are unified, trailing whitespace is removed from every line and leading and
+        trailing blank lines are dropped; indentation is kept.
+        """
+        lines = completion.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        return '\n'.join(line.rstrip() for line in lines).strip('\n')
+
+    @staticmethod
+    def make_key(task_id: str, completion: str) -> str:
+        """Content address of a completion of a task."""
+        payload = json.dumps([task_id, ExecutionCache.normalize_completion(completion)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def is_cacheable(result: Dict[str, Any]) -> bool:
+        """Timeouts and crashes depend on machine load and limits, so only test outcomes are stored."""
+        return result.get('error') not in (TIMEOUT_ERROR, CRASH_ERROR)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached {'passed', 'error'} result for key, or None on a miss."""
+        result = self.store.get(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store an execution result (ignored if it is not cacheable)."""
+        if self.is_cacheable(result):
+            self.store.set(key, {'passed': result['passed'], 'error': result.get('error')})
+
+    def stats(self) -> Dict[str, int]:
+        """Current hit/miss counters."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+
+_execution_caches: Dict[str, ExecutionCache] = {}
+_execution_caches_lock = threading.Lock()
+
+
+def get_execution_cache() -> ExecutionCache:
+    """
+    Get the process-wide execution result cache.
+
+    The database lives next to the model response cache, in PROMPTSUITE_CACHE_DIR (default: ~/.cache/promptsuite).
+    """
+    cache_dir = os.getenv(LLMCacheConstants.CACHE_DIR_ENV_VAR) or LLMCacheConstants.DEFAULT_CACHE_DIR
+    path = os.path.join(os.path.expanduser(cache_dir), CODE_EXEC_CACHE_FILENAME)
+    with _execution_caches_lock:
+        if path not in _execution_caches:
+            _execution_caches[path] = ExecutionCache(path)
+        return _execution_caches[path]
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Deferred metric computation for batch runs (--metric_workers).
+
+By default every response is scored (gold answer extraction, BLEU/ROUGE, ...) on the worker that
+made the request, right after the API call. With a metric stage the network workers only fetch
+responses: each response is first appended to a `<results>.responses.jsonl` journal, then scored in
+batches on a separate process pool, so CPU-heavy scoring never holds up requests. Responses that
+were journaled but not scored when a run was interrupted are scored on resume without asking the
+model again.
+"""
+
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from promptsuite_tasks.constants import LM_METRIC_BATCH_SIZE
+
+# Score function of the worker process, set once by the pool initializer
+_score_function: Optional[Callable[[Dict[str, Any], str], Dict[str, Any]]] = None
+
+
+def get_responses_journal_path(output_file: str) -> Path:
+    """Journal of unscored responses of a results file (results.json -> results.responses.jsonl)."""
+    return Path(output_file).with_suffix('.responses.jsonl')
+
+
+def get_response_key(entry: Dict[str, Any]) -> tuple:
+    """(original_row_index, variation_count, run_number) of a variation or a responses journal entry."""
+    return entry.get('original_row_index', 0), entry.get('variation_count'), entry.get('run_number', 1)
+
+
+def load_unscored_responses(output_file: str) -> Dict[tuple, str]:
+    """Responses journaled by an interrupted run, by key (a truncated last line is ignored)."""
+    path = get_responses_journal_path(output_file)
+    if not path.exists():
+        return {}
+
+    responses = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            responses[get_response_key(entry)] = entry['model_response']
+    if responses:
+        print(f"📂 Found {len(responses)} journaled responses in {path} to score without new requests")
+    return responses
+
+
+def _init_worker(score_function: Callable[[Dict[str, Any], str], Dict[str, Any]]) -> None:
+    global _score_function
+    _score_function = score_function
+
+
+def _warm_up() -> None:
+    pass
+
+
+def _score_batch(items: List[Tuple[Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+    return [_score_function(variation, response) for variation, response in items]
+
+
+class MetricStage:
+    """
+    Scores (variation, response) pairs in batches on a process pool.
+
+    Pairs are buffered per owner (the VariationRun they belong to) and sent to the pool once
+    batch_size of them are buffered. Not thread-safe: add/collect/drain are called from the
+    scheduling thread.
+    """
+
+    def __init__(self, score_function: Callable[[Dict[str, Any], str], Dict[str, Any]], workers: int,
+                 batch_size: int = LM_METRIC_BATCH_SIZE):
+        """
+        Start the worker pool.
+
+        Args:
+            score_function: score_function(variation, response) -> result entry
+            workers: Number of scoring processes
+            batch_size: Pairs sent to a worker at a time
+        """
+        self.batch_size = max(1, batch_size)
+        self._score_function = score_function
+        self._buffers: Dict[Any, List[Tuple[Dict[str, Any], str]]] = {}
+        self._futures = {}
+        self._scored_inline: List[Tuple[Any, Dict[str, Any]]] = []
+
+        # The score function is usually a closure over metrics_function, which cannot be pickled:
+        # forked workers inherit it instead. Without fork, batches are scored in this process.
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                                 initializer=_init_worker, initargs=(score_function,))
+            # Fork the workers now, before the request threads start
+            for future in [self._executor.submit(_warm_up) for _ in range(workers)]:
+                future.result()
+            print(f"📐 Scoring responses in batches of {self.batch_size} on {workers} metric workers")
+        else:
+            self._executor = None
+            print("⚠️  Metric workers need the 'fork' start method; scoring batches in the main process")
+
+    def add(self, owner: Any, variation: Dict[str, Any], response: str) -> None:
+        """Buffer a response of owner for scoring."""
+        buffer = self._buffers.setdefault(owner, [])
+        buffer.append((variation, response))
+        if len(buffer) >= self.batch_size:
+            self._submit(owner)
+
+    def _submit(self, owner: Any) -> None:
+        items = self._buffers.pop(owner, None)
+        if not items:
+            return
+        if self._executor is None:
+            self._scored_inline.extend((owner, self._score_function(v, r)) for v, r in items)
+        else:
+            self._futures[self._executor.submit(_score_batch, items)] = owner
+
+    def collect(self, block: bool = False) -> List[Tuple[Any, Dict[str, Any]]]:
+        """(owner, result) of the finished batches; with block, waits for at least one pending batch."""
+        if self._executor is None:
+            finished, self._scored_inline = self._scored_inline, []
+            return finished
+
+        pending = list(self._futures)
+        if not pending:
+            return []
+        done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        finished = []
+        for future in done:
+            owner = self._futures.pop(future)
+            finished.extend((owner, result) for result in future.result())
+        return finished
+
+    def drain(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        """Submit all buffered responses and wait for every batch."""
+        for owner in list(self._buffers):
+            self._submit(owner)
+        finished = self.collect()
+        while self._futures:
+            finished.extend(self.collect(block=True))
+        return finished
+
+    def close(self) -> None:
+        """Stop the worker pool (buffered responses stay in the responses journal)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Shared rate limiting for model calls.
+
+Each (platform, model) pair gets one RateLimiter, shared by all workers and engines, that combines:
+- token buckets for requests per minute and tokens per minute (when the quota is known)
+- an AIMD concurrency limit: halved on rate-limit errors, grown back by ~1 slot per round of successes
+- a shared pause honoring retry-after hints, so every worker backs off together instead of hammering
+  the provider while one of them sleeps
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from promptsuite_tasks.constants import (
+    LM_RATE_LIMIT_BASE_BACKOFF, LM_RATE_LIMIT_MIN_CONCURRENCY, LM_RATE_LIMIT_MAX_CONCURRENCY,
+    LM_RATE_LIMIT_CHARS_PER_TOKEN
+)
+
+# How often a caller waiting for a concurrency slot re-checks (threads are also woken on release)
+SLOT_POLL_INTERVAL = 0.05
+
+_DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate_per_minute`, holding at most one minute of tokens."""
+
+    def __init__(self, rate_per_minute: float):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(rate_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` tokens and return how many seconds to wait before using them (0 if available now)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The balance may go negative: later callers queue behind earlier reservations
+            self._tokens -= min(amount, self.capacity)
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Request/token quotas and an adaptive concurrency limit for one (platform, model) pair."""
+
+    def __init__(self,
+                 requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None,
+                 max_concurrency: int = LM_RATE_LIMIT_MAX_CONCURRENCY,
+                 min_concurrency: int = LM_RATE_LIMIT_MIN_CONCURRENCY):
+        self.settings = (requests_per_minute, tokens_per_minute, max_concurrency, min_concurrency)
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency_limit = float(max_concurrency)
+        self.in_flight = 0
+        self.rate_limit_hits = 0
+        self._paused_until = 0.0
+        # Bumped on every decrease; requests sent before it cannot trigger another one, so a burst of
+        # rate-limit errors from one overloaded window halves the limit once (like TCP, once per RTT)
+        self._generation = 0
+        self._condition = threading.Condition()
+
+    def _reserve_quota(self, estimated_tokens: float) -> float:
+        wait = 0.0
+        if self.request_bucket is not None:
+            wait = max(wait, self.request_bucket.reserve(1))
+        if self.token_bucket is not None and estimated_tokens:
+            wait = max(wait, self.token_bucket.reserve(estimated_tokens))
+        return wait
+
+    def _try_enter(self) -> Tuple[float, int]:
+        """
+        Take a concurrency slot.
+
+        Returns (0, generation) on success, otherwise (seconds to wait before trying again, -1).
+        """
+        with self._condition:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                return pause, -1
+            if self.in_flight < max(1, int(self.concurrency_limit)):
+                self.in_flight += 1
+                return 0.0, self._generation
+            return SLOT_POLL_INTERVAL, -1
+
+    def acquire(self, estimated_tokens: float = 0) -> int:
+        """
+        Block until a request may be sent.
+
+        Returns a ticket that must be passed to release() once the request has finished.
+        """
+        wait = self._reserve_quota(estimated_tokens)
+        if wait > 0:
+            time.sleep(wait)
+        while True:
+            wait, ticket = self._try_enter()
+            if not wait:
+                return ticket
+            with self._condition:
+                self._condition.wait(timeout=wait)
+
+    async def acquire_async(self, estimated_tokens: float = 0) -> int:
+        """Async version of acquire()."""
+        wait = self._reserve_quota(estimated_tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        while True:
+            wait, ticket = self._try_enter()
+            if not wait:
+                return ticket
+            await asyncio.sleep(wait)
+
+    def release(self, ticket: int, rate_limited: bool = False, retry_after: Optional[float] = None) -> None:
+        """Free the slot and adapt the concurrency limit to the outcome of the request."""
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if rate_limited:
+                self.rate_limit_hits += 1
+                # Multiplicative decrease, based on what was actually in flight when the limit was hit
+                if ticket == self._generation:
+                    current = min(self.concurrency_limit, self.in_flight + 1)
+                    self.concurrency_limit = max(self.min_concurrency, current / 2)
+                    self._generation += 1
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+            else:
+                # Additive increase: about one extra slot per `limit` successful requests
+                self.concurrency_limit = min(self.max_concurrency,
+                                             self.concurrency_limit + 1 / self.concurrency_limit)
+            self._condition.notify_all()
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(platform: str, model_name: str) -> RateLimiter:
+    """Get the shared rate limiter for a platform and model, creating an unbounded one on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get((platform, model_name))
+        if limiter is None:
+            limiter = RateLimiter()
+            _limiters[(platform, model_name)] = limiter
+        return limiter
+
+
+def configure_rate_limiter(platform: str, model_name: str,
+                           requests_per_minute: Optional[float] = None,
+                           tokens_per_minute: Optional[float] = None,
+                           max_concurrency: int = LM_RATE_LIMIT_MAX_CONCURRENCY) -> RateLimiter:
+    """
+    Set the quotas for a platform and model.
+
+    The existing limiter (and its learned concurrency limit) is kept if the settings are unchanged.
+    """
+    settings = (requests_per_minute, tokens_per_minute, max_concurrency, LM_RATE_LIMIT_MIN_CONCURRENCY)
+    with _limiters_lock:
+        limiter = _limiters.get((platform, model_name))
+        if limiter is None or limiter.settings != settings:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute, max_concurrency)
+            _limiters[(platform, model_name)] = limiter
+        return limiter
+
+
+def estimate_tokens(conversation: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> int:
+    """Rough token count of a request as charged against a tokens-per-minute quota (prompt + max completion)."""
+    prompt_chars = sum(len(str(message.get('content', ''))) for message in conversation)
+    return int(prompt_chars / LM_RATE_LIMIT_CHARS_PER_TOKEN) + (max_tokens or 0)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an exception from a provider SDK signals a rate limit (HTTP 429)."""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status == 429 or 'ratelimit' in type(error).__name__.lower() or 'rate limit' in str(error).lower()
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse durations such as '20ms', '1.5s' or '6m0s' (OpenAI x-ratelimit-reset-* headers)."""
+    parts = _DURATION_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Extract the suggested wait in seconds from the response headers of a rate-limit error."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+
+    value = headers.get('retry-after-ms')
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get('retry-after')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    resets = [_parse_duration(headers.get(name, ''))
+              for name in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')]
+    resets = [reset for reset in resets if reset is not None]
+    return max(resets) if resets else None
+
+
+def backoff_delay(attempt: int, max_sleep_time: float, retry_after: Optional[float] = None,
+                  base: float = LM_RATE_LIMIT_BASE_BACKOFF) -> float:
+    """
+    Seconds to wait before retry number `attempt` (0-based).
+
+    A retry-after hint from the provider is honored (plus a little jitter so workers do not retry in
+    lockstep); otherwise full-jitter exponential backoff capped at max_sleep_time.
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, base)
+    return random.uniform(0, min(max_sleep_time, base * 2 ** attempt))
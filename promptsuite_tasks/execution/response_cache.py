@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of model responses for deterministic batch runs.
+
+At temperature 0 many variations send byte-identical conversations (duplicate renders, reruns of
+an experiment, runs_per_sample copies), so responses are stored in an SQLite database keyed by a
+hash of (platform, model, max_tokens, temperature, conversation) and served locally on repeat.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from promptsuite.shared.constants import LLMCacheConstants
+from promptsuite.shared.llm_cache import LLMResponseCache
+from promptsuite_tasks.constants import LM_RESPONSE_CACHE_FILENAME, LM_RESPONSE_CACHE_MAX_SIZE_BYTES
+
+
+class ResponseCache:
+    """Model response cache with hit/miss counters (shared by all workers of the process)."""
+
+    def __init__(self, path: str, max_size_bytes: int = LM_RESPONSE_CACHE_MAX_SIZE_BYTES):
+        self.store = LLMResponseCache(path, max_size_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_cacheable(temperature: float) -> bool:
+        """Only deterministic requests are cached; sampled runs must stay independent."""
+        return temperature == 0
+
+    @staticmethod
+    def make_key(platform: str, model_name: str, max_tokens: Optional[int], temperature: float,
+                 conversation: List[Dict[str, Any]]) -> str:
+        """Content address of a model request."""
+        payload = json.dumps([platform, model_name, max_tokens, temperature, conversation],
+                             ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        response = self.store.get(key)
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a successful response."""
+        self.store.set(key, response)
+
+    def stats(self) -> Dict[str, int]:
+        """Current hit/miss counters."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+
+_response_caches: Dict[str, ResponseCache] = {}
+_response_caches_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the process-wide model response cache.
+
+    The database lives next to the LLM variation cache, in PROMPTSUITE_CACHE_DIR (default: ~/.cache/promptsuite).
+    """
+    cache_dir = os.getenv(LLMCacheConstants.CACHE_DIR_ENV_VAR) or LLMCacheConstants.DEFAULT_CACHE_DIR
+    path = os.path.join(os.path.expanduser(cache_dir), LM_RESPONSE_CACHE_FILENAME)
+    with _response_caches_lock:
+        if path not in _response_caches:
+            _response_caches[path] = ResponseCache(path)
+        return _response_caches[path]
+
+
+def format_cache_stats(before: Dict[str, int], after: Dict[str, int]) -> str:
+    """Summary line for the hits and misses between two stats() snapshots."""
+    hits = after['hits'] - before['hits']
+    misses = after['misses'] - before['misses']
+    total = hits + misses
+    hit_rate = (hits / total) * 100 if total else 0.0
+    return f"{hits} hits, {misses} misses ({hit_rate:.1f}% hit rate)"
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal of model results.
+
+Every finished variation is appended as one JSON line, so saving a result costs O(1) instead of
+rewriting the whole results file. The journal is fsynced every `sync_every` results; after the run
+it is compacted into the final JSON/CSV files and removed. If a run is interrupted, the next run
+replays the journal on resume.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def get_journal_path(output_file: str) -> Path:
+    """Journal path for a results file (results.json -> results.jsonl)."""
+    return Path(output_file).with_suffix('.jsonl')
+
+
+class ResultJournal:
+    """Append-only JSONL journal next to a results file. Not thread-safe: callers hold their own lock."""
+
+    def __init__(self, output_file: str, sync_every: int = 10, resume: bool = True, path: Optional[Path] = None):
+        """
+        Open the journal for a results file.
+
+        Args:
+            output_file: Path of the final JSON results file
+            sync_every: Number of appended results between fsyncs
+            resume: Keep existing journal entries (otherwise the journal is truncated)
+            path: Journal file (default: get_journal_path(output_file))
+        """
+        self.path = path or get_journal_path(output_file)
+        self.sync_every = max(1, sync_every)
+        # Entries left by an interrupted run (already replayed by load_existing_results)
+        self.recovered = resume and self.path.exists() and self.path.stat().st_size > 0
+        if self.recovered:
+            # A killed run may have left half a line, which new entries must not be appended to
+            self._truncate_partial_line(self.path)
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        self._unsynced = 0
+
+    @staticmethod
+    def _truncate_partial_line(path: Path, chunk_size: int = 64 * 1024) -> None:
+        """Cut the file back to just after its last newline (the partial line was skipped by replay)."""
+        with open(path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - chunk_size)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def append(self, result: Dict[str, Any]) -> None:
+        """Append a single result."""
+        self._file.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffered lines and fsync them to disk."""
+        if self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self) -> None:
+        """Sync and close the journal (it stays on disk until remove())."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def remove(self) -> None:
+        """Close and delete the journal once its results have been compacted."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    @staticmethod
+    def replay(output_file: str) -> List[Dict[str, Any]]:
+        """
+        Read the results recorded in the journal of a results file.
+
+        A truncated last line (the process was killed mid-write) is ignored.
+        """
+        path = get_journal_path(output_file)
+        if not path.exists():
+            return []
+
+        results = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    results.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"⚠️  Skipping unreadable journal line {line_number} in {path}")
+        return results
+
+
+def write_atomically(path: str, write_function, newline: Optional[str] = None) -> None:
+    """Write a file through write_function(f) into a temporary file, then replace the target."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline=newline) as f:
+        write_function(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
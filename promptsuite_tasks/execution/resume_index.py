@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Compact resume index for batch runs.
+
+Next to each results file we keep a small .npy array of the (original_row_index, variation_index,
+run_number) keys it contains. Resume reads the processed keys from it in milliseconds instead of
+parsing the full CSV/JSON (responses, conversations, metrics) of a large run.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+def get_index_path(output_file: str) -> Path:
+    """Index path for a results file (results.json -> results.idx.npy)."""
+    return Path(output_file).with_suffix('.idx.npy')
+
+
+def write_resume_index(keys: List[Tuple[Any, Any, Any]], output_file: str) -> None:
+    """
+    Write the index of a results file. Call after the results file itself has been written.
+
+    Keys that are not integers cannot be indexed; the index is removed and resume falls back to
+    loading the results file.
+    """
+    index_path = get_index_path(output_file)
+    try:
+        array = np.array(keys, dtype=np.int64).reshape(-1, 3)
+    except (TypeError, ValueError):
+        if index_path.exists():
+            index_path.unlink()
+        return
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp_path, index_path)
+
+
+def load_resume_index(output_file: str) -> Optional[Set[Tuple[int, int, int]]]:
+    """
+    Read the processed keys of a results file from its index.
+
+    Returns None if there is no usable index: missing, unreadable, or older than the results file
+    (written by something else since), in which case the results file has to be loaded.
+    """
+    index_path = get_index_path(output_file)
+    if not index_path.exists():
+        return None
+    if os.path.exists(output_file) and index_path.stat().st_mtime_ns < os.stat(output_file).st_mtime_ns:
+        return None
+
+    try:
+        array = np.load(index_path)
+    except (OSError, ValueError):
+        return None
+    if array.ndim != 2 or array.shape[1] != 3:
+        return None
+
+    return set(zip(*array.T.tolist()))
@@ -202,27 +202,9 @@ def main():
     # Print header and process files
     runner.print_header(args, full_model_name, gpqa_files)
 
-    # Process files
-    results = []
+    # Process files (the runs of all files share one worker pool)
     total_start_time = time.time()
-
-    for i, gpqa_file in enumerate(gpqa_files, 1):
-        dataset = runner.extract_identifier_from_filename(gpqa_file.name)
-        print(f"\n🧪 Processing dataset {i}/{len(gpqa_files)}: {dataset}")
-
-        result = runner.run_language_model_on_file(gpqa_file, args)
-        results.append(result)
-
-        # Print result
-        if result["status"] == "success":
-            variations_count = result.get("variations_processed", "unknown")
-            print(f"✅ {dataset} completed in {result['duration']:.1f}s ({variations_count} variations)")
-        else:
-            print(f"❌ {dataset} failed: {result.get('error', 'Unknown error')} in {result['duration']:.1f}s")
-
-        # Show progress
-        if i < len(gpqa_files):
-            runner.print_progress_summary(results, i, len(gpqa_files))
+    results = runner.run_language_model_on_files(gpqa_files, args)
 
     # Save summary and print final results
     total_duration = time.time() - total_start_time
@@ -25,7 +25,8 @@ sys.path.insert(0, str(project_root))
 
 from promptsuite_tasks.constants import (
     LM_DEFAULT_MAX_TOKENS, LM_DEFAULT_PLATFORM, LM_DEFAULT_TEMPERATURE,
-    LM_DEFAULT_PARALLEL_WORKERS,
+    LM_DEFAULT_PARALLEL_WORKERS, LM_ENGINES, LM_DEFAULT_ENGINE, LM_DEFAULT_ASYNC_CONCURRENCY,
+    LM_DEFAULT_MAX_RETRIES, LM_DEFAULT_RETRY_SLEEP, LM_BATCH_API_POLL_INTERVAL, LM_DEFAULT_METRIC_WORKERS,
     PLATFORMS, MODEL_SHORT_NAMES
 )
 from promptsuite_tasks.execution.shared_metrics import (
@@ -33,9 +34,9 @@ from promptsuite_tasks.execution.shared_metrics import (
     calculate_translation_correctness_and_metrics
 )
 from promptsuite_tasks.execution.batch_runner_base import (
-    load_variations_file, filter_variations_by_rows_and_variations,
     run_model_on_variations, get_model_name, load_existing_results
 )
+from promptsuite_tasks.execution.variation_stream import stream_variations_file
 
 
 def main():
@@ -57,16 +58,30 @@ def main():
                         help="Maximum number of rows to process (None = all rows)")
     parser.add_argument("--variations", type=int, default=None,
                         help="Maximum variations per row to process (None = all variations)")
-    parser.add_argument("--max_retries", type=int, default=3,
-                        help="Maximum number of retries for rate limit errors (default: 3)")
-    parser.add_argument("--retry_sleep", type=int, default=60,
-                        help="Base sleep time in seconds for rate limit retries (default: 60)")
+    parser.add_argument("--max_retries", type=int, default=LM_DEFAULT_MAX_RETRIES,
+                        help=f"Maximum number of retries for rate limit errors (default: {LM_DEFAULT_MAX_RETRIES})")
+    parser.add_argument("--retry_sleep", type=float, default=LM_DEFAULT_RETRY_SLEEP,
+                        help=f"Maximum backoff in seconds between rate limit retries (default: {LM_DEFAULT_RETRY_SLEEP})")
+    parser.add_argument("--rpm", type=float, default=None,
+                        help="Requests per minute quota for the model (None = unlimited)")
+    parser.add_argument("--tpm", type=float, default=None,
+                        help="Tokens per minute quota for the model (None = unlimited)")
     parser.add_argument("--batch_size", type=int, default=10,
                         help="Number of variations to process before saving intermediate results (default: 10)")
     parser.add_argument("--no_resume", action="store_true",
                         help="Don't resume from existing results file (start fresh)")
+    parser.add_argument("--no_response_cache", action="store_true",
+                        help="Don't serve temperature-0 requests from the on-disk response cache")
     parser.add_argument("--parallel_workers", type=int, default=LM_DEFAULT_PARALLEL_WORKERS,
                         help=f"Number of parallel workers for model calls (1=sequential, default: {LM_DEFAULT_PARALLEL_WORKERS})")
+    parser.add_argument("--engine", choices=LM_ENGINES, default=LM_DEFAULT_ENGINE,
+                        help=f"Execution engine: 'thread', 'async' or 'batch' (provider Batch API) (default: {LM_DEFAULT_ENGINE})")
+    parser.add_argument("--concurrency", type=int, default=LM_DEFAULT_ASYNC_CONCURRENCY,
+                        help=f"Maximum in-flight requests for --engine async (default: {LM_DEFAULT_ASYNC_CONCURRENCY})")
+    parser.add_argument("--batch_poll_interval", type=float, default=LM_BATCH_API_POLL_INTERVAL,
+                        help=f"Seconds between status checks for --engine batch (default: {LM_BATCH_API_POLL_INTERVAL})")
+    parser.add_argument("--metric_workers", type=int, default=LM_DEFAULT_METRIC_WORKERS,
+                        help=f"Processes that score responses in batches (0 = score on the request workers, default: {LM_DEFAULT_METRIC_WORKERS})")
     parser.add_argument("--gold_field", type=str,
                         help="Field name in gold_updates containing the gold answer/label (auto-detected by file type if not specified)")
 
@@ -130,20 +145,15 @@ def main():
         print("Gold field: auto-detect (translation)")
     print("=" * 50)
 
-    # Load variations
-    variations = load_variations_file(input_file)
-    if not variations:
-        return
-
-    # Filter variations based on row and variation limits
-    filtered_variations = filter_variations_by_rows_and_variations(
-        variations,
-        max_rows=args.rows,
-        max_variations_per_row=args.variations
-    )
-
-    if not filtered_variations:
-        print("❌ No variations to process after filtering")
+    # Stream variations, filtered by row and variation limits while reading
+    try:
+        filtered_variations = stream_variations_file(
+            input_file,
+            max_rows=args.rows,
+            max_variations_per_row=args.variations
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
         return
 
     # Determine metrics function based on input file type and gold_field
@@ -203,7 +213,12 @@ def main():
         temperature=args.temperature, max_retries=args.max_retries, retry_sleep=args.retry_sleep,
         batch_size=args.batch_size, resume=not args.no_resume,
         parallel_workers=args.parallel_workers,
-        metrics_function=metrics_function
+        metrics_function=metrics_function,
+        engine=args.engine, concurrency=args.concurrency,
+        requests_per_minute=args.rpm, tokens_per_minute=args.tpm,
+        use_response_cache=not args.no_response_cache,
+        batch_poll_interval=args.batch_poll_interval,
+        metric_workers=args.metric_workers
     )
 
     print("\n✅ Processing completed!")
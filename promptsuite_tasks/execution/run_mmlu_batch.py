@@ -213,27 +213,9 @@ def main():
     # Print header and process files
     runner.print_header(args, full_model_name, mmlu_files)
 
-    # Process files
-    results = []
+    # Process files (the runs of all files share one worker pool)
     total_start_time = time.time()
-
-    for i, mmlu_file in enumerate(mmlu_files, 1):
-        subject = runner.extract_identifier_from_filename(mmlu_file.name)
-        print(f"\n📚 Processing subject {i}/{len(mmlu_files)}: {subject}")
-
-        result = runner.run_language_model_on_file(mmlu_file, args)
-        results.append(result)
-
-        # Print result
-        if result["status"] == "success":
-            variations_count = result.get("variations_processed", "unknown")
-            print(f"✅ {subject} completed in {result['duration']:.1f}s ({variations_count} variations)")
-        else:
-            print(f"❌ {subject} failed: {result.get('error', 'Unknown error')} in {result['duration']:.1f}s")
-
-        # Show progress
-        if i < len(mmlu_files):
-            runner.print_progress_summary(results, i, len(mmlu_files))
+    results = runner.run_language_model_on_files(mmlu_files, args)
 
     # Save summary and print final results
     total_duration = time.time() - total_start_time
@@ -197,27 +197,9 @@ def main():
     # Print header and process files
     runner.print_header(args, full_model_name, musique_files)
 
-    # Process files
-    results = []
+    # Process files (the runs of all files share one worker pool)
     total_start_time = time.time()
-
-    for i, musique_file in enumerate(musique_files, 1):
-        task = runner.extract_identifier_from_filename(musique_file.name)
-        print(f"\n📚 Processing task {i}/{len(musique_files)}: {task}")
-
-        result = runner.run_language_model_on_file(musique_file, args)
-        results.append(result)
-
-        # Print result
-        if result["status"] == "success":
-            variations_count = result.get("variations_processed", "unknown")
-            print(f"✅ {task} completed in {result['duration']:.1f}s ({variations_count} variations)")
-        else:
-            print(f"❌ {task} failed: {result.get('error', 'Unknown error')} in {result['duration']:.1f}s")
-
-        # Show progress
-        if i < len(musique_files):
-            runner.print_progress_summary(results, i, len(musique_files))
+    results = runner.run_language_model_on_files(musique_files, args)
 
     # Save summary and print final results
     total_duration = time.time() - total_start_time
@@ -205,28 +205,9 @@ def main():
     # Print header and process files
     runner.print_header(args, full_model_name, translation_files)
 
-    # Process files
-    results = []
+    # Process files (the runs of all files share one worker pool)
     total_start_time = time.time()
-
-    for i, translation_file in enumerate(translation_files, 1):
-        pair = runner.extract_identifier_from_filename(translation_file.name)
-        display_name = runner.get_display_name(pair)
-        print(f"\n🌍 Processing pair {i}/{len(translation_files)}: {display_name}")
-
-        result = runner.run_language_model_on_file(translation_file, args)
-        results.append(result)
-
-        # Print result
-        if result["status"] == "success":
-            variations_count = result.get("variations_processed", "unknown")
-            print(f"✅ {display_name} completed in {result['duration']:.1f}s ({variations_count} variations)")
-        else:
-            print(f"❌ {display_name} failed: {result.get('error', 'Unknown error')} in {result['duration']:.1f}s")
-
-        # Show progress
-        if i < len(translation_files):
-            runner.print_progress_summary(results, i, len(translation_files))
+    results = runner.run_language_model_on_files(translation_files, args)
 
     # Save summary and print final results
     total_duration = time.time() - total_start_time
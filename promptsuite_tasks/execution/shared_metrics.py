@@ -3,11 +3,63 @@
 Shared metrics calculation functions for different tasks.
 """
 
+import math
+import os
 import re
-from typing import Dict, Any, List, Tuple
+import threading
+import time
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 import evaluate
 from sklearn.metrics import mean_squared_error
 
+from promptsuite_tasks.constants import METRICS_DIR_ENV_VAR, METRIC_LOAD_RETRY_INTERVAL
+from promptsuite_tasks.execution.answer_extraction import (
+    extract_final_answer_from_response, extract_gsm8k_answer, extract_numeric_answer, normalize_choice_answer
+)
+
+# Process-wide registry of loaded `evaluate` metrics (see get_metric)
+_metrics: Dict[str, Any] = {}
+_metric_load_failures: Dict[str, Tuple[Exception, float]] = {}  # name -> (error, monotonic time of the failure)
+_metric_locks: Dict[str, threading.Lock] = {}
+_metrics_lock = threading.Lock()
+
+
+def get_metric(name: str):
+    """
+    Load an `evaluate` metric once per process and return the shared instance.
+
+    A metric script copied to $PROMPTSUITE_METRICS_DIR/<name> is used instead of the Hugging Face Hub,
+    so runs work offline (HF_EVALUATE_OFFLINE=1 also serves metrics from the evaluate cache).
+    A metric that failed to load (e.g. a network error) is loaded again on the next call once
+    METRIC_LOAD_RETRY_INTERVAL seconds have passed; calls before that raise the same error, so the
+    rows of a run do not each wait for another failing download.
+    """
+    with _metrics_lock:
+        failure = _metric_load_failures.get(name)
+        if failure is not None and time.monotonic() - failure[1] < METRIC_LOAD_RETRY_INTERVAL:
+            raise failure[0]
+        if name not in _metrics:
+            local_dir = os.getenv(METRICS_DIR_ENV_VAR)
+            local_path = os.path.join(os.path.expanduser(local_dir), name) if local_dir else None
+            try:
+                _metrics[name] = evaluate.load(local_path if local_path and os.path.isdir(local_path) else name)
+            except Exception as e:
+                print(f"Error loading metric '{name}': {e}")
+                _metric_load_failures[name] = (e, time.monotonic())
+                raise
+            _metric_load_failures.pop(name, None)
+            _metric_locks[name] = threading.Lock()
+        return _metrics[name]
+
+
+def compute_metric(name: str, **kwargs) -> Dict[str, Any]:
+    """Compute a registry metric; a metric instance keeps state during compute, so calls to it are serialized."""
+    metric = get_metric(name)
+    with _metric_locks[name]:
+        return metric.compute(**kwargs) or {}
+
+
 def calculate_text_generation_metrics(prediction: str, reference: str) -> Dict[str, float]:
     """
     Calculate BLEU, ROUGE, and SacreBLEU metrics for text generation tasks.
@@ -20,19 +72,14 @@ def calculate_text_generation_metrics(prediction: str, reference: str) -> Dict[s
         Dictionary with metric scores
     """
     try:
-        # Load evaluation metrics
-        bleu = evaluate.load("bleu")
-        rouge = evaluate.load("rouge")
-        sacrebleu = evaluate.load("sacrebleu")
-
-        # Calculate BLEU
-        bleu_score = bleu.compute(predictions=[prediction], references=[[reference]])
+        # Calculate BLEU (metrics are loaded once per process)
+        bleu_score = compute_metric("bleu", predictions=[prediction], references=[[reference]])
 
         # Calculate ROUGE
-        rouge_score = rouge.compute(predictions=[prediction], references=[reference])
+        rouge_score = compute_metric("rouge", predictions=[prediction], references=[reference])
 
         # Calculate SacreBLEU
-        sacrebleu_score = sacrebleu.compute(predictions=[prediction], references=[[reference]])
+        sacrebleu_score = compute_metric("sacrebleu", predictions=[prediction], references=[[reference]])
 
         return {
             "bleu": bleu_score.get("bleu", 0.0),
@@ -46,6 +93,231 @@ def calculate_text_generation_metrics(prediction: str, reference: str) -> Dict[s
         return {"bleu": 0.0, "rouge1": 0.0, "rouge2": 0.0, "rougeL": 0.0, "sacrebleu": 0.0}
 
 
+# 13a tokenization (used by the `evaluate` BLEU and SacreBLEU metrics). Symbols are split off with
+# a translation table; periods, commas and dashes depend on their neighbours and use regexes.
+_TOKENIZER_13A_SYMBOLS = str.maketrans({
+    c: f' {c} ' for c in '{|}~[\\]^_` !"#$%&()*+:;<=>?@/'
+})
+_TOKENIZER_13A_PATTERNS = [
+    (re.compile(r'([^0-9])([\.,])'), r'\1 \2 '),
+    (re.compile(r'([\.,])([^0-9])'), r' \1 \2'),
+]
+_TOKENIZER_13A_DASH = re.compile(r'([0-9])(-)')
+_ROUGE_NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+BLEU_MAX_ORDER = 4
+
+
+def tokenize_13a(text: str) -> List[str]:
+    """Tokenize text like the 13a tokenizer of sacrebleu (mteval-v13a)."""
+    text = text.replace('<skipped>', '').replace('-\n', '').replace('\n', ' ')
+    if '&' in text:
+        text = text.replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+    text = f' {text} '.translate(_TOKENIZER_13A_SYMBOLS)
+    if '.' in text or ',' in text:
+        for pattern, replacement in _TOKENIZER_13A_PATTERNS:
+            text = pattern.sub(replacement, text)
+    if '-' in text:
+        text = _TOKENIZER_13A_DASH.sub(r'\1 \2 ', text)
+    return text.split()
+
+
+def tokenize_rouge(text: str) -> List[str]:
+    """Tokenize text like the default rouge_score tokenizer (lowercase alphanumeric words, no stemming)."""
+    return _ROUGE_NON_ALPHANUMERIC.sub(' ', text.lower()).split()
+
+
+def _ngrams(tokens: List[str], order: int):
+    return zip(*[tokens[i:] for i in range(order)]) if order > 1 else tokens
+
+
+def _bleu_ngram_counts(tokens: List[str]) -> List[Counter]:
+    return [Counter(_ngrams(tokens, order)) for order in range(1, BLEU_MAX_ORDER + 1)]
+
+
+def _overlap(prediction_counts: Counter, reference_counts: Counter) -> int:
+    """Number of clipped n-gram matches."""
+    return sum(min(count, reference_counts[ngram]) for ngram, count in prediction_counts.items()
+               if ngram in reference_counts)
+
+
+def _bleu_statistics(prediction_tokens: List[str], reference_tokens: List[str],
+                     reference_counts: Optional[List[Counter]] = None) -> List[int]:
+    """[matches per order..., possible matches per order..., prediction length, reference length]."""
+    if reference_counts is None:
+        reference_counts = _bleu_ngram_counts(reference_tokens)
+    matches = [_overlap(prediction_counts, counts)
+               for prediction_counts, counts in zip(_bleu_ngram_counts(prediction_tokens), reference_counts)]
+    possible = [max(0, len(prediction_tokens) - order + 1) for order in range(1, BLEU_MAX_ORDER + 1)]
+    return matches + possible + [len(prediction_tokens), len(reference_tokens)]
+
+
+def _bleu_from_statistics(stats: List[int]) -> float:
+    """BLEU in [0, 1] as computed by the `evaluate` bleu metric (no smoothing); 0 where it is undefined."""
+    matches, possible = stats[:BLEU_MAX_ORDER], stats[BLEU_MAX_ORDER:2 * BLEU_MAX_ORDER]
+    prediction_length, reference_length = stats[-2], stats[-1]
+    if not prediction_length or not reference_length:
+        return 0.0
+    precisions = [m / p if p > 0 else 0.0 for m, p in zip(matches, possible)]
+    if min(precisions) <= 0:
+        return 0.0
+    geo_mean = math.exp(sum(math.log(p) for p in precisions) / BLEU_MAX_ORDER)
+    ratio = prediction_length / reference_length
+    brevity_penalty = 1.0 if ratio > 1.0 else math.exp(1 - 1.0 / ratio)
+    return geo_mean * brevity_penalty
+
+
+def _sacrebleu_from_statistics(stats: List[int]) -> float:
+    """SacreBLEU in [0, 100] with its default 'exp' smoothing, as computed by the `evaluate` sacrebleu metric."""
+    matches, possible = stats[:BLEU_MAX_ORDER], stats[BLEU_MAX_ORDER:2 * BLEU_MAX_ORDER]
+    prediction_length, reference_length = stats[-2], stats[-1]
+    if not any(matches):
+        return 0.0
+    if prediction_length < reference_length:
+        brevity_penalty = math.exp(1 - reference_length / prediction_length) if prediction_length > 0 else 0.0
+    else:
+        brevity_penalty = 1.0
+
+    precisions = [0.0] * BLEU_MAX_ORDER
+    smooth = 1.0
+    for n in range(BLEU_MAX_ORDER):
+        if possible[n] == 0:
+            break
+        if matches[n] == 0:
+            smooth *= 2
+            precisions[n] = 100.0 / (smooth * possible[n])
+        else:
+            precisions[n] = 100.0 * matches[n] / possible[n]
+    if min(precisions) <= 0:
+        return 0.0
+    return brevity_penalty * math.exp(sum(math.log(p) for p in precisions) / BLEU_MAX_ORDER)
+
+
+def _f_measure(overlap: int, prediction_count: int, reference_count: int) -> float:
+    precision = overlap / max(prediction_count, 1)
+    recall = overlap / max(reference_count, 1)
+    return 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0.0
+
+
+def _token_positions(tokens: List[str]) -> Dict[str, int]:
+    """Bit mask of the positions of every token."""
+    positions = {}
+    for i, token in enumerate(tokens):
+        positions[token] = positions.get(token, 0) | (1 << i)
+    return positions
+
+
+def _lcs_length(prediction_tokens: List[str], reference_length: int, reference_positions: Dict[str, int]) -> int:
+    """Length of the longest common subsequence, with a bit-parallel row per prediction token."""
+    full = (1 << reference_length) - 1
+    row = full
+    for token in prediction_tokens:
+        matches = row & reference_positions.get(token, 0)
+        row = ((row + matches) | (row - matches)) & full
+    return reference_length - bin(row).count('1')
+
+
+class _Reference:
+    """Tokens and n-gram counts of a reference text, computed once per distinct reference."""
+
+    def __init__(self, text: str):
+        self.bleu_tokens = tokenize_13a(text)
+        self.bleu_counts = _bleu_ngram_counts(self.bleu_tokens)
+        # SacreBLEU strips trailing whitespace before tokenizing, which only matters for a trailing "-\n"
+        self.sacrebleu_tokens = tokenize_13a(text.rstrip()) if _ends_with_dash_newline(text) else None
+        self.rouge_tokens = tokenize_rouge(text)
+        self.rouge_counts = [Counter(_ngrams(self.rouge_tokens, order)) for order in (1, 2)]
+        self.rouge_positions = _token_positions(self.rouge_tokens)
+
+
+def _ends_with_dash_newline(text: str) -> bool:
+    stripped = text.rstrip()
+    return stripped != text and stripped.endswith('-')
+
+
+def _rouge_scores(prediction_tokens: List[str], reference: _Reference) -> Tuple[float, float, float]:
+    """(rouge1, rouge2, rougeL) F-measures of one pair, as computed by rouge_score."""
+    scores = []
+    for order, reference_counts in zip((1, 2), reference.rouge_counts):
+        overlap = _overlap(Counter(_ngrams(prediction_tokens, order)), reference_counts)
+        scores.append(_f_measure(overlap, max(0, len(prediction_tokens) - order + 1),
+                                 max(0, len(reference.rouge_tokens) - order + 1)))
+    reference_length = len(reference.rouge_tokens)
+    if prediction_tokens and reference_length:
+        lcs = _lcs_length(prediction_tokens, reference_length, reference.rouge_positions)
+        scores.append(_f_measure(lcs, len(prediction_tokens), reference_length))
+    else:
+        scores.append(0.0)
+    return tuple(scores)
+
+
+def _score_pair(prediction: str, reference: _Reference) -> Tuple[List[int], List[int], Dict[str, float]]:
+    """(BLEU statistics, SacreBLEU statistics, scores by metric name) of one pair."""
+    stats = _bleu_statistics(tokenize_13a(prediction), reference.bleu_tokens, reference.bleu_counts)
+    sacrebleu_stats = stats
+    if reference.sacrebleu_tokens is not None or _ends_with_dash_newline(prediction):
+        reference_tokens = reference.bleu_tokens if reference.sacrebleu_tokens is None else reference.sacrebleu_tokens
+        sacrebleu_stats = _bleu_statistics(tokenize_13a(prediction.rstrip()), reference_tokens)
+    rouge1, rouge2, rouge_l = _rouge_scores(tokenize_rouge(prediction), reference)
+    return stats, sacrebleu_stats, {
+        "bleu": _bleu_from_statistics(stats),
+        "rouge1": rouge1,
+        "rouge2": rouge2,
+        "rougeL": rouge_l,
+        "sacrebleu": _sacrebleu_from_statistics(sacrebleu_stats),
+    }
+
+
+def calculate_text_generation_metrics_batch(predictions: List[str],
+                                            references: List[str]) -> Tuple[Dict[str, List[float]], Dict[str, float]]:
+    """
+    Calculate BLEU, ROUGE, and SacreBLEU for whole columns of predictions and references.
+
+    Each text is tokenized once (each distinct reference and each distinct pair only once for the
+    whole batch) and BLEU and SacreBLEU share the same n-gram statistics. Per-row scores match
+    calculate_text_generation_metrics. Corpus BLEU/SacreBLEU are computed from the summed
+    statistics of all rows, corpus ROUGE is the mean of the per-row scores.
+
+    Args:
+        predictions: Model prediction texts
+        references: Reference/gold texts (one per prediction)
+
+    Returns:
+        tuple: (per-row scores by metric name, corpus scores by metric name)
+    """
+    if len(predictions) != len(references):
+        raise ValueError(f"Got {len(predictions)} predictions for {len(references)} references")
+
+    rows = {"bleu": [], "rouge1": [], "rouge2": [], "rougeL": [], "sacrebleu": []}
+    corpus_stats = [0] * (2 * BLEU_MAX_ORDER + 2)
+    corpus_sacrebleu_stats = list(corpus_stats)
+    parsed_references = {}
+    scored_pairs = {}
+    for prediction, reference_text in zip(predictions, references):
+        prediction, reference_text = str(prediction), str(reference_text)
+        scored = scored_pairs.get((prediction, reference_text))
+        if scored is None:
+            reference = parsed_references.get(reference_text)
+            if reference is None:
+                reference = parsed_references[reference_text] = _Reference(reference_text)
+            scored = scored_pairs[(prediction, reference_text)] = _score_pair(prediction, reference)
+
+        stats, sacrebleu_stats, scores = scored
+        corpus_stats = [total + value for total, value in zip(corpus_stats, stats)]
+        corpus_sacrebleu_stats = [total + value for total, value in zip(corpus_sacrebleu_stats, sacrebleu_stats)]
+        for name, score in scores.items():
+            rows[name].append(score)
+
+    num_rows = max(len(predictions), 1)
+    corpus = {
+        "bleu": _bleu_from_statistics(corpus_stats),
+        "rouge1": sum(rows["rouge1"]) / num_rows,
+        "rouge2": sum(rows["rouge2"]) / num_rows,
+        "rougeL": sum(rows["rougeL"]) / num_rows,
+        "sacrebleu": _sacrebleu_from_statistics(corpus_sacrebleu_stats),
+    }
+    return rows, corpus
+
+
 def calculate_summarization_metrics(variation: dict, model_response: str, gold_field: str = "highlights"):
     """
     Calculate BLEU, ROUGE, and SacreBLEU for summarization tasks.
@@ -350,59 +622,14 @@ def calculate_math_correctness_and_metrics(variation: Dict[str, Any], model_resp
         if gold_answer is None:
             return f"No gold answer in gold_updates['{gold_field}']", False, {}
 
-        # Extract numeric value from model response
-        def extract_numeric_from_response(response: str) -> float:
-            """Extract numeric answer from model response."""
-            import re
-
-            # First try to find #### pattern (if model follows GSM8K format)
-            gsm8k_pattern = r"#### (\-?[0-9\.\,]+)"
-            gsm8k_matches = re.findall(gsm8k_pattern, response)
-            if gsm8k_matches:
-                try:
-                    return float(gsm8k_matches[0].replace(',', ''))
-                except ValueError:
-                    pass
-
-            # Fallback: look for any numbers in the response, prioritizing the last one
-            numbers = re.findall(r'-?\d+(?:\.\d+)?', response.strip())
-            if numbers:
-                try:
-                    return float(numbers[-1].replace(',', ''))
-                except ValueError:
-                    pass
-
-            return None
-
-        # Extract numeric value from gold answer (GSM8K format)
-        def extract_numeric_from_gold_answer(answer_text: str) -> float:
-            """Extract the final numeric answer from GSM8K answer format."""
-            import re
-
-            # GSM8K answers end with "#### [number]" format
-            regex_pattern = r"#### (\-?[0-9\.\,]+)"
-            matches = re.findall(regex_pattern, answer_text)
-
-            if matches:
-                # Take the first (and should be only) match
-                numeric_part = matches[0]
-                # Remove commas and return the clean number
-                try:
-                    return float(numeric_part.replace(',', ''))
-                except ValueError:
-                    pass
-
-            # If no #### pattern found, this is an error in the dataset
-            raise ValueError(f"No numeric answer found in expected format '#### [number]' in: {answer_text}")
-
-        # Extract numeric answers from both gold and model response
-        try:
-            gold_numeric = extract_numeric_from_gold_answer(str(gold_answer))
-        except (ValueError, TypeError) as e:
-            return f"Invalid gold answer format: {gold_answer} - {str(e)}", False, {}
+        # Extract numeric value from gold answer (GSM8K answers end with "#### [number]")
+        gold_numeric = extract_gsm8k_answer(str(gold_answer))
+        if gold_numeric is None:
+            return (f"Invalid gold answer format: {gold_answer} - No numeric answer found in expected "
+                    f"format '#### [number]' in: {gold_answer}"), False, {}
 
         # Extract predicted numeric answer
-        predicted_numeric = extract_numeric_from_response(model_response)
+        predicted_numeric = extract_numeric_answer(model_response)
 
         if predicted_numeric is None:
             return str(gold_answer), False, {
@@ -422,58 +649,6 @@ def calculate_math_correctness_and_metrics(variation: Dict[str, Any], model_resp
         return f"Error calculating math correctness: {str(e)}", False, {}
 
 
-def extract_final_answer_from_response(response: str) -> str:
-    import re
-    response = response.strip()
-    lines = [line.strip() for line in response.split('\n') if line.strip()]
-
-    # 1. חפש שורה שמתחילה ב-Final answer: או Answer: או Choice:
-    for line in reversed(lines):
-        m = re.match(r'^(Final answer|Answer|Choice)[:.\s-]+(.+)$', line, flags=re.IGNORECASE)
-        if m:
-            answer = m.group(2).strip()
-            return answer
-
-    # 1b. חפש שורה שמכילה רק Answer: או Choice: ואז בשורה הבאה את התשובה
-    for i, line in enumerate(lines):
-        if re.match(r'^(Final answer|Answer|Choice)[:.\s-]*$', line, flags=re.IGNORECASE):
-            if i + 1 < len(lines):
-                return lines[i + 1].strip()
-
-    # 2. חפש תשובה מודגשת (bold) או underline או inline code (כמו קודם)
-    all_bold = re.findall(r'\*\*([^*]+)\*\*', response)
-    if not all_bold:
-        all_bold = re.findall(r'__([^_]+)__', response)
-    if not all_bold:
-        all_bold = re.findall(r'`([^`]+)`', response)
-    if all_bold:
-        for candidate in reversed(all_bold):
-            candidate = candidate.strip()
-            # אם candidate מתחיל ב-Answer/Choice וכו', נסה להוציא את החלק שאחריהם
-            m = re.match(r'^(Answer|Choice)[:.\s-]*([a-dA-D1-4IVXivx]+[.:]?\s*.+)', candidate, flags=re.IGNORECASE)
-            if m:
-                return m.group(2).strip()
-            m2 = re.match(r'^(Answer|Choice)[:.\s-]*$', candidate, flags=re.IGNORECASE)
-            if m2:
-                continue  # זה רק prefix, לא תשובה
-            if len(candidate) > 100 or any(word in candidate.lower() for word in ['dimethyl', 'sulfane', 'methane', 'reagent', 'chlorochromate']):
-                continue
-            return candidate
-
-    # 3. חפש תבניות של אות/מספר/רומאי בתחילת שורה (ללא נרמול)
-    for line in reversed(lines):
-        m = re.match(r'^([a-dA-D1-4IVXivx]+)[.:]\s*(.+)', line)
-        if m:
-            return f'{m.group(1)}. {m.group(2).strip()}'
-        # גם מקרים של רק אות/מספר/רומאי
-        m2 = re.match(r'^([a-dA-D1-4IVXivx]+)[.]?\s*$', line)
-        if m2 and len(line) <= 5:
-            return f'{m2.group(1)}.'
-
-    # 4. fallback: תחזיר None
-    return None
-
-
 def calculate_gpqa_correctness_and_metrics(variation: Dict[str, Any], model_response: str, gold_field: str = "answer") -> tuple:
     """
     Calculate correctness for GPQA tasks.
@@ -508,58 +683,12 @@ def calculate_gpqa_correctness_and_metrics(variation: Dict[str, Any], model_resp
         predicted_answer = extract_final_answer_from_response(model_response)
         # Clean gold answer for comparison
         gold_answer_clean = gold_answer_text.strip().lower()
-        # Normalize answers for comparison (remove dots, spaces, etc.)
-        def roman_to_int(roman: str) -> int:
-            roman = roman.upper()
-            roman_numerals = {'I': 1, 'V': 5, 'X': 10}
-            result = 0
-            prev_value = 0
-            for char in reversed(roman):
-                value = roman_numerals.get(char, 0)
-                if value < prev_value:
-                    result -= value
-                else:
-                    result += value
-                prev_value = value
-            return result
-
-        def normalize_answer(answer: str) -> str:
-            import re
-            if not answer:
-                return ""
-            # Remove dots, spaces, and lowercase
-            answer = answer.strip()
-            normalized = re.sub(r'[.\s]+', '', answer.lower())
-            # Convert roman numerals at start to number
-            match = re.match(r'^([ivx]+)(\d*)$', normalized)
-            if match:
-                roman = match.group(1)
-                rest = match.group(2)
-                try:
-                    number = str(roman_to_int(roman))
-                    return number + rest
-                except Exception:
-                    pass
-            # Convert letter to number (a=1, b=2, ...)
-            match = re.match(r'^([a-d])([0-9]*)$', normalized)
-            if match:
-                letter = match.group(1)
-                rest = match.group(2)
-                letter_map = {'a': '1', 'b': '2', 'c': '3', 'd': '4'}
-                if letter in letter_map:
-                    return letter_map[letter] + rest
-            # If already number at start
-            match = re.match(r'^(\d+)(\d*)$', normalized)
-            if match:
-                return match.group(1) + match.group(2)
-            return normalized
-
-        gold_normalized = normalize_answer(gold_answer_clean)
+        gold_normalized = normalize_choice_answer(gold_answer_clean)
 
         is_correct = False
         if predicted_answer:
             # Normalize both answers (handles roman, letter, number)
-            predicted_normalized = normalize_answer(predicted_answer)
+            predicted_normalized = normalize_choice_answer(predicted_answer)
             # Check for exact match after normalization
             is_correct = predicted_normalized == gold_normalized
 
@@ -715,6 +844,5 @@ def calculate_bertscore_metrics(predictions: list, references: list, lang: str =
     Returns:
         List of BERTScore F1 scores
     """
-    bertscore = evaluate.load("bertscore")
-    results = bertscore.compute(predictions=predictions, references=references, lang=lang)
+    results = compute_metric("bertscore", predictions=predictions, references=references, lang=lang)
     return results.get('f1', [])
\ No newline at end of file
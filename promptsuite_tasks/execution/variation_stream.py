@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for variation files.
+
+Variations files can be several GB (every entry repeats the full template configuration), so the
+batch runners read them one variation at a time instead of json.load-ing the whole array, and
+apply the --rows / --variations limits while reading. Both the JSON array written by
+PromptSuite and JSONL files (one variation per line) are supported.
+"""
+
+import itertools
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# Characters read from the file at a time (grown while a single variation does not fit)
+READ_CHUNK_SIZE = 1 << 20
+
+_decoder = json.JSONDecoder()
+
+
+def iter_variations_file(file_path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the variations of a .json (top-level array) or .jsonl file one at a time.
+
+    Raises ValueError for malformed files.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if str(file_path).endswith('.jsonl'):
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number} of {file_path}: {e}") from e
+            return
+
+        yield from _iter_json_array(f, file_path, chunk_size)
+
+
+def _iter_json_array(f, file_path: str, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """Decode the elements of a top-level JSON array from a text stream, reading it in chunks."""
+    buffer = ""
+    pos = 0
+    eof = False
+    read_size = chunk_size
+    in_array = False
+
+    while True:
+        # Skip whitespace and separators between elements
+        while pos < len(buffer) and (buffer[pos].isspace() or (in_array and buffer[pos] == ',')):
+            pos += 1
+
+        if pos < len(buffer):
+            char = buffer[pos]
+            if not in_array:
+                if char != '[':
+                    raise ValueError(f"Expected a JSON array of variations in {file_path}")
+                in_array = True
+                pos += 1
+                continue
+            if char == ']':
+                return
+
+            try:
+                element, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                element, end = None, None
+            # An element is only complete if it ends before the buffered text (or the file) does
+            if end is not None and (end < len(buffer) or eof):
+                yield element
+                pos = end
+                read_size = chunk_size
+                continue
+            if eof:
+                raise ValueError(f"Invalid or truncated JSON in {file_path} near character offset {pos}")
+        elif eof:
+            if in_array:
+                raise ValueError(f"Truncated JSON array in {file_path}")
+            return
+
+        # Need more text: drop what was consumed and read the next chunk
+        buffer = buffer[pos:]
+        pos = 0
+        chunk = f.read(read_size)
+        if chunk:
+            buffer += chunk
+            # An element larger than the buffered text is read in growing chunks
+            read_size *= 2
+        else:
+            eof = True
+
+
+def filter_variations_stream(variations: Iterable[Dict[str, Any]],
+                             max_rows: Optional[int] = None,
+                             max_variations_per_row: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Apply the row and variation limits to a stream of variations.
+
+    Variation files list the variations of each row together, in row order, so the first
+    max_rows rows of the stream are the rows with the lowest indices. Reading stops as soon
+    as all selected rows are complete.
+    """
+    if max_rows is None and max_variations_per_row is None:
+        yield from variations
+        return
+
+    row_counts = {}
+    kept = 0
+    last_row = None
+    for variation in variations:
+        row_idx = variation.get('original_row_index', 0)
+        if row_idx not in row_counts:
+            if max_rows is not None and len(row_counts) >= max_rows:
+                # Rows are contiguous, so a new row after the last selected one ends the selection
+                break
+            if last_row is not None and row_idx < last_row:
+                print(f"⚠️  Row {row_idx} appears after row {last_row}; rows are selected in file order")
+            row_counts[row_idx] = 0
+            last_row = row_idx
+
+        if max_variations_per_row is None or row_counts[row_idx] < max_variations_per_row:
+            row_counts[row_idx] += 1
+            kept += 1
+            yield variation
+
+    print(f"🔍 Filtered to {kept} variations from {len(row_counts)} rows")
+
+
+def stream_variations_file(file_path: str,
+                           max_rows: Optional[int] = None,
+                           max_variations_per_row: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Open a variations file as a lazy, filtered stream of variations.
+
+    Only the beginning of the file is read here, to fail early: raises ValueError if the file
+    is missing, has no variations, or has none left after filtering.
+    """
+    if not os.path.exists(file_path):
+        raise ValueError(f"File not found: {file_path}")
+
+    variations = iter_variations_file(file_path)
+    first = next(variations, None)
+    if first is None:
+        raise ValueError("No variations found")
+
+    filtered = filter_variations_stream(itertools.chain([first], variations), max_rows, max_variations_per_row)
+    first = next(filtered, None)
+    if first is None:
+        raise ValueError("No variations to process after filtering")
+
+    print(f"📖 Streaming variations from {file_path}")
+    return itertools.chain([first], filtered)
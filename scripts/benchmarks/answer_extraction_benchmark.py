@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark: answer extraction of GPQA (multiple choice) and math (numeric) responses.
+
+"Before" is the previous per-call implementation (nested helpers, `import re` and pattern lookups
+on every call); "after" is execution/answer_extraction.py with precompiled patterns and lookup
+tables. Both run over the same synthetic corpus of model responses and must produce identical
+outputs.
+
+Example usage:
+python scripts/benchmarks/answer_extraction_benchmark.py --responses 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path to import promptsuite_tasks
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from promptsuite_tasks.execution.answer_extraction import (
+    extract_final_answer_from_response, extract_numeric_answer, normalize_choice_answer
+)
+
+
+# --- Previous implementation (old behaviour) ---
+
+def old_extract_final_answer_from_response(response: str) -> str:
+    import re
+    response = response.strip()
+    lines = [line.strip() for line in response.split('\n') if line.strip()]
+
+    for line in reversed(lines):
+        m = re.match(r'^(Final answer|Answer|Choice)[:.\s-]+(.+)$', line, flags=re.IGNORECASE)
+        if m:
+            answer = m.group(2).strip()
+            return answer
+
+    for i, line in enumerate(lines):
+        if re.match(r'^(Final answer|Answer|Choice)[:.\s-]*$', line, flags=re.IGNORECASE):
+            if i + 1 < len(lines):
+                return lines[i + 1].strip()
+
+    all_bold = re.findall(r'\*\*([^*]+)\*\*', response)
+    if not all_bold:
+        all_bold = re.findall(r'__([^_]+)__', response)
+    if not all_bold:
+        all_bold = re.findall(r'`([^`]+)`', response)
+    if all_bold:
+        for candidate in reversed(all_bold):
+            candidate = candidate.strip()
+            m = re.match(r'^(Answer|Choice)[:.\s-]*([a-dA-D1-4IVXivx]+[.:]?\s*.+)', candidate, flags=re.IGNORECASE)
+            if m:
+                return m.group(2).strip()
+            m2 = re.match(r'^(Answer|Choice)[:.\s-]*$', candidate, flags=re.IGNORECASE)
+            if m2:
+                continue
+            if len(candidate) > 100 or any(word in candidate.lower() for word in ['dimethyl', 'sulfane', 'methane', 'reagent', 'chlorochromate']):
+                continue
+            return candidate
+
+    for line in reversed(lines):
+        m = re.match(r'^([a-dA-D1-4IVXivx]+)[.:]\s*(.+)', line)
+        if m:
+            return f'{m.group(1)}. {m.group(2).strip()}'
+        m2 = re.match(r'^([a-dA-D1-4IVXivx]+)[.]?\s*$', line)
+        if m2 and len(line) <= 5:
+            return f'{m2.group(1)}.'
+
+    return None
+
+
+def old_normalize_answer(answer: str) -> str:
+    def roman_to_int(roman: str) -> int:
+        roman = roman.upper()
+        roman_numerals = {'I': 1, 'V': 5, 'X': 10}
+        result = 0
+        prev_value = 0
+        for char in reversed(roman):
+            value = roman_numerals.get(char, 0)
+            if value < prev_value:
+                result -= value
+            else:
+                result += value
+            prev_value = value
+        return result
+
+    import re
+    if not answer:
+        return ""
+    answer = answer.strip()
+    normalized = re.sub(r'[.\s]+', '', answer.lower())
+    match = re.match(r'^([ivx]+)(\d*)$', normalized)
+    if match:
+        return str(roman_to_int(match.group(1))) + match.group(2)
+    match = re.match(r'^([a-d])([0-9]*)$', normalized)
+    if match:
+        letter_map = {'a': '1', 'b': '2', 'c': '3', 'd': '4'}
+        return letter_map[match.group(1)] + match.group(2)
+    match = re.match(r'^(\d+)(\d*)$', normalized)
+    if match:
+        return match.group(1) + match.group(2)
+    return normalized
+
+
+def old_extract_numeric_from_response(response: str) -> float:
+    import re
+    gsm8k_matches = re.findall(r"#### (\-?[0-9\.\,]+)", response)
+    if gsm8k_matches:
+        try:
+            return float(gsm8k_matches[0].replace(',', ''))
+        except ValueError:
+            pass
+    numbers = re.findall(r'-?\d+(?:\.\d+)?', response.strip())
+    if numbers:
+        try:
+            return float(numbers[-1].replace(',', ''))
+        except ValueError:
+            pass
+    return None
+
+
+# --- Synthetic corpus ---
+
+LABELS = ['A', 'B', 'C', 'D', 'a', 'b', 'c', 'd', '1', '2', '3', '4', 'I', 'II', 'III', 'IV', 'i', 'ii', 'iii', 'iv']
+CHOICE_TEXTS = ['10^-4 eV', 'dimethyl sulfoxide', 'The reaction is exothermic', '4', 'II and IV only',
+                'pyridinium chlorochromate', '3.5 x 10^3 m/s', 'None of the above']
+FILLER = ("Let's think step by step. First we compute the energy difference, which is 2.5 eV, "
+          "then we compare it with the thermal energy at 300 K.")
+CHOICE_TEMPLATES = [
+    "{filler}\nAnswer: {label}",
+    "{filler}\n\nFinal answer: {label}. {text}",
+    "{filler}\nChoice:\n{label}",
+    "{filler} The correct option is **{label}. {text}**.",
+    "{filler} **Answer: {label}**",
+    "**Reasoning**\n{filler}\n**{text}**",
+    "{filler} so we pick __{label}__.",
+    "{filler} The answer is `{label}`.",
+    "{label}. {text}",
+    "{filler}\n{label}.",
+    "{filler} I believe the answer is {text}.",
+    "{label}",
+]
+NUMERIC_TEMPLATES = [
+    "{filler}\n#### {number}",
+    "{filler} So the total is {number} apples.",
+    "{filler} That leaves {number}, then subtract 3 to get {number2}.",
+    "#### {number}",
+    "{filler} I cannot determine the answer.",
+]
+
+
+def build_corpus(n_responses: int, seed: int) -> list:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n_responses):
+        filler = FILLER if rng.random() < 0.5 else FILLER * rng.randint(2, 6)
+        if rng.random() < 0.6:
+            template = rng.choice(CHOICE_TEMPLATES)
+            corpus.append(template.format(filler=filler, label=rng.choice(LABELS), text=rng.choice(CHOICE_TEXTS)))
+        else:
+            template = rng.choice(NUMERIC_TEMPLATES)
+            corpus.append(template.format(filler=filler, number=f"{rng.randint(-50, 100000):,}",
+                                          number2=round(rng.uniform(0, 1000), 2)))
+    return corpus
+
+
+def score_all(corpus: list, extract_answer, normalize, extract_numeric) -> list:
+    """Extraction output of every response: (parsed answer, normalized answer, numeric answer)."""
+    outputs = []
+    for response in corpus:
+        answer = extract_answer(response)
+        outputs.append((answer, normalize(answer) if answer else None, extract_numeric(response)))
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark precompiled vs per-call answer extraction")
+    parser.add_argument("--responses", type=int, default=1000000, help="Synthetic responses to score")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the synthetic corpus")
+    args = parser.parse_args()
+
+    print(f"🧪 Building {args.responses:,} synthetic responses...")
+    corpus = build_corpus(args.responses, args.seed)
+
+    start = time.perf_counter()
+    before = score_all(corpus, old_extract_final_answer_from_response, old_normalize_answer,
+                       old_extract_numeric_from_response)
+    before_elapsed = time.perf_counter() - start
+    print(f"⏱️  Per-call extraction:    {before_elapsed:.2f}s ({args.responses / before_elapsed:,.0f} responses/s)")
+
+    start = time.perf_counter()
+    after = score_all(corpus, extract_final_answer_from_response, normalize_choice_answer, extract_numeric_answer)
+    after_elapsed = time.perf_counter() - start
+    print(f"⚡ Precompiled extraction: {after_elapsed:.2f}s ({args.responses / after_elapsed:,.0f} responses/s)")
+
+    mismatches = sum(1 for old, new in zip(before, after) if old != new)
+    assert mismatches == 0, f"{mismatches} responses extracted differently"
+    print(f"✅ Identical outputs, speedup: {before_elapsed / after_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
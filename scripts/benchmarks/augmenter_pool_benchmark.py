@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-row cost of field variation generation with and without the augmenter pool.
+
+"Before" re-creates every augmenter through AugmenterFactory.create for each value, variation
+type and row (the previous behaviour); "after" reuses instances from VariationGenerator's
+AugmenterPool. Both paths must produce identical variations.
+
+Example usage:
+python scripts/benchmarks/augmenter_pool_benchmark.py --rows 200 --variations_per_field 5
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+import pandas as pd
+
+from promptsuite.augmentations.factory import AugmenterFactory
+from promptsuite.core.models import GoldFieldConfig, VariationConfig, FieldVariation
+from promptsuite.core.template_keys import (
+    INSTRUCTION_VARIATIONS, PROMPT_FORMAT_VARIATIONS, SHUFFLE_VARIATION, ENUMERATE_VARIATION,
+    TYPOS_AND_NOISE_VARIATION, FORMAT_STRUCTURE_VARIATION, CONTEXT_VARIATION
+)
+from promptsuite.generation import VariationGenerator
+
+
+class FactoryPerCall:
+    """Stand-in for AugmenterPool that creates a new augmenter on every request (old behaviour)."""
+
+    def get(self, variation_type, n_augments, api_key=None, seed=None):
+        return AugmenterFactory.create(variation_type=variation_type, n_augments=n_augments,
+                                       api_key=api_key, seed=seed)
+
+    def clear(self):
+        pass
+
+
+def build_data(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        'question': [f"Question {i}: which of the following planets is closest to the sun?" for i in range(rows)],
+        'choices': [[f"Venus {i}", f"Mercury {i}", f"Earth {i}", f"Mars {i}"] for i in range(rows)],
+        'answer': [i % 4 for i in range(rows)],
+    })
+
+
+def run(generator: VariationGenerator, data: pd.DataFrame, variation_fields: dict,
+        variation_config: VariationConfig, gold_config: GoldFieldConfig) -> tuple:
+    pre_generated = {
+        INSTRUCTION_VARIATIONS: [FieldVariation(data='', gold_update=None)],
+        PROMPT_FORMAT_VARIATIONS: [FieldVariation(data='', gold_update=None)],
+    }
+    outputs = []
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _, row in data.iterrows():
+            outputs.append(generator.generate_row_specific_field_variations(
+                variation_fields, row, variation_config, gold_config, pre_generated
+            ))
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the augmenter pool in VariationGenerator")
+    parser.add_argument("--rows", type=int, default=200, help="Number of rows to generate (default: 200)")
+    parser.add_argument("--variations_per_field", type=int, default=5,
+                        help="Variations per field (default: 5)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed repetitions, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    data = build_data(args.rows)
+    variation_fields = {
+        'question': [TYPOS_AND_NOISE_VARIATION, FORMAT_STRUCTURE_VARIATION, CONTEXT_VARIATION],
+        'choices': [SHUFFLE_VARIATION, ENUMERATE_VARIATION],
+    }
+    variation_config = VariationConfig(variations_per_field=args.variations_per_field, seed=42)
+    gold_config = GoldFieldConfig(field='answer', type='index', options_field='choices')
+
+    before_gen = VariationGenerator()
+    before_gen.augmenter_pool = FactoryPerCall()
+    after_gen = VariationGenerator()
+
+    before_times, after_times = [], []
+    for _ in range(args.repeats):
+        before_time, before_out = run(before_gen, data, variation_fields, variation_config, gold_config)
+        after_gen.augmenter_pool.clear()
+        after_time, after_out = run(after_gen, data, variation_fields, variation_config, gold_config)
+        if before_out != after_out:
+            print("❌ Pooled augmenters produced different variations than fresh ones")
+            sys.exit(1)
+        before_times.append(before_time)
+        after_times.append(after_time)
+
+    before_ms = min(before_times) / args.rows * 1000
+    after_ms = min(after_times) / args.rows * 1000
+    print(f"📊 Augmenter pool benchmark ({args.rows} rows, {args.variations_per_field} variations per field)")
+    print(f"   Before (factory per call): {before_ms:.3f} ms/row")
+    print(f"   After  (pooled):           {after_ms:.3f} ms/row")
+    print(f"   Speedup: {before_ms / after_ms:.2f}x, pooled augmenters: {len(after_gen.augmenter_pool)}")
+    print("✅ Outputs identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: requests per second of shared.model_client against a local mock OpenAI-compatible server.
+
+"Before" builds a new OpenAI client for every call (the previous behaviour, which opens a new
+connection per request); "after" goes through get_model_response, which reuses the pooled client
+for the (platform, api_key) pair. The mock server answers /v1/chat/completions with a fixed
+completion after an optional simulated latency.
+
+Example usage:
+python scripts/benchmarks/model_client_benchmark.py --requests 2000 --threads 16 --latency_ms 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to Python path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from openai import OpenAI
+
+from promptsuite.shared import model_client
+from promptsuite.shared.model_client import get_model_response
+
+MOCK_API_KEY = "mock-key"
+MOCK_MODEL = "mock-model"
+MESSAGES = [{"role": "user", "content": "What is the capital of France?"}]
+
+
+def make_handler(latency_s: float):
+    body = json.dumps({
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": 0,
+        "model": MOCK_MODEL,
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": "Paris"}}],
+        "usage": {"prompt_tokens": 8, "completion_tokens": 1, "total_tokens": 9},
+    }).encode()
+
+    class MockOpenAIHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like the real endpoints
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if latency_s:
+                time.sleep(latency_s)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MockOpenAIHandler
+
+
+def new_client_per_call() -> str:
+    client = OpenAI(api_key=MOCK_API_KEY)
+    response = client.chat.completions.create(model=MOCK_MODEL, messages=MESSAGES, temperature=0.0)
+    return response.choices[0].message.content
+
+
+def pooled_client() -> str:
+    return get_model_response(MESSAGES, model_name=MOCK_MODEL, platform="OpenAI", api_key=MOCK_API_KEY)
+
+
+def run(call, n_requests: int, threads: int) -> float:
+    """Issue n_requests calls from a thread pool and return requests per second."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(lambda _: call(), range(n_requests)))
+    elapsed = time.perf_counter() - start
+    assert all(result == "Paris" for result in results)
+    return n_requests / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call LLM clients")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per run")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent client threads")
+    parser.add_argument("--latency_ms", type=float, default=0.0, help="Simulated server latency per request")
+    parser.add_argument("--max_connections", type=int, default=None, help="Pool size for the shared client")
+    parser.add_argument("--max_keepalive_connections", type=int, default=None, help="Idle connections kept open")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency_ms / 1000))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    model_client.configure_client_pool(max_connections=args.max_connections,
+                                       max_keepalive_connections=args.max_keepalive_connections)
+    print(f"🚀 Mock server on {os.environ['OPENAI_BASE_URL']}")
+    print(f"   Requests: {args.requests}, threads: {args.threads}, latency: {args.latency_ms} ms")
+    print(f"   Pool settings: {model_client.get_client_pool_settings()}")
+
+    # Warm up both paths (imports, first connection)
+    run(new_client_per_call, args.threads, args.threads)
+    run(pooled_client, args.threads, args.threads)
+
+    before = run(new_client_per_call, args.requests, args.threads)
+    print(f"⏱️  New client per call: {before:,.0f} req/s")
+    after = run(pooled_client, args.requests, args.threads)
+    print(f"⚡ Pooled client:       {after:,.0f} req/s")
+    print(f"✅ Speedup: {after / before:.1f}x")
+
+    model_client.close_clients()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
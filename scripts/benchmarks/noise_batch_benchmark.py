@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark and parity check: TextNoiseAugmenter.augment_batch against augment() on the same seed.
+
+"Before" augments every text with augment() (one pooled augmenter, reset before each text, as
+VariationGenerator does); "after" is one augment_batch call over the whole column. The two use
+different random streams, so their variations are not identical; instead the check requires:
+- Structure: the original text comes first, at most n_augments unique variations, and (for
+  augment_batch, which masks placeholders instead of swapping them for numeric tokens that typos can
+  hit) placeholders intact
+- Determinism: the same seed gives the same variations, and a text's variations do not depend on the
+  rest of the batch (shuffled and halved batches)
+- Statistical parity: one application of each technique, with the settings augment() uses, changes
+  the same share of characters (the length ratio for spacing) as its batched counterpart, to within
+  --tolerance (relative). Single applications are compared rather than augment()'s output, since most
+  augment() techniques reseed a fixed stream on every call (so its retries repeat the first attempt)
+  while augment_batch retries with fresh draws. The augment() methods get a per-text seed so that
+  texts are independent samples, and only texts without placeholders are used (see above)
+
+Example usage:
+python scripts/benchmarks/noise_batch_benchmark.py --rows 10000
+"""
+
+import argparse
+import difflib
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the path to import promptsuite
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from promptsuite.augmentations.text.noise import (
+    TextNoiseAugmenter, _BATCH_TECHNIQUES, _from_code_points, _to_code_points
+)
+
+TECHNIQUES = ["typos", "capitalization", "spacing", "swap_characters", "punctuation"]
+PLACEHOLDER = re.compile(r"\{[^}]+\}")
+
+# One application of each technique exactly as TextNoiseAugmenter.augment calls it, apart from the seed
+AUGMENT_TECHNIQUES = {
+    "typos": lambda augmenter, text, seed: augmenter.butter_finger(text, prob=0.05, seed=seed, max_outputs=1),
+    "capitalization": lambda augmenter, text, seed: augmenter.change_char_case(text, prob=0.15, seed=seed,
+                                                                               max_outputs=1),
+    "spacing": lambda augmenter, text, seed: augmenter.add_white_spaces(text, max_outputs=1),
+    "swap_characters": lambda augmenter, text, seed: augmenter.swap_characters(text, seed=seed, max_outputs=1),
+    "punctuation": lambda augmenter, text, seed: augmenter.switch_punctuation(text, seed=seed, max_outputs=1),
+}
+
+
+# --- Synthetic corpus ---
+
+WORDS = ["the", "capital", "of", "France", "is", "Paris", "which", "answer", "is", "correct", "question",
+         "choose", "one", "option", "below", "photosynthesis", "happens", "in", "chloroplasts", "42",
+         "3.14", "don't", "state-of-the-art", "naïve", "Straße", "東京", "(A)", "(B)", "e-mail"]
+PUNCTUATION = [".", ",", "!", "?", ";", ":"]
+
+
+def random_text(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(3, 40))]
+    for _ in range(rng.randint(0, 2)):
+        words.insert(rng.randint(0, len(words)), rng.choice(["{question}", "{answer}", "{options}"]))
+    text = ""
+    for word in words:
+        text += word + rng.choice(PUNCTUATION) if rng.random() < 0.1 else word
+        text += rng.choice([" ", " ", " ", "  ", "\n"])
+    return text.strip()
+
+
+def build_corpus(n_rows: int, seed: int) -> list:
+    """Texts of a dataset column, with repeated values."""
+    rng = random.Random(seed)
+    pool = [random_text(rng) for _ in range(max(1, n_rows * 4 // 5))]
+    return [rng.choice(pool) for _ in range(n_rows)]
+
+
+# --- Checks ---
+
+def check_structure(texts: list, outputs: list, n_augments: int, check_placeholders: bool):
+    for text, variations in zip(texts, outputs):
+        assert variations[0] == text, f"original text is not first: {text!r}"
+        assert len(variations) <= n_augments, f"{len(variations)} variations for {text!r}"
+        assert len(set(variations)) == len(variations), f"duplicate variations for {text!r}"
+        for variation in variations if check_placeholders else []:
+            assert PLACEHOLDER.findall(variation) == PLACEHOLDER.findall(text), \
+                f"placeholders changed: {text!r} -> {variation!r}"
+
+
+def change_rate(texts: list, outputs: list, technique: str) -> float:
+    """
+    Share of the characters of all texts that the outputs changed (length ratio for spacing).
+
+    Characters are aligned with difflib rather than compared by position, since augment() changes
+    the length of non-ASCII letters like "ß" when it changes their case.
+    """
+    total_length = sum(len(text) for text in texts)
+    if technique == "spacing":
+        return sum(len(output) for output in outputs) / total_length
+    changed = 0
+    for text, output in zip(texts, outputs):
+        opcodes = difflib.SequenceMatcher(None, text, output, autojunk=False).get_opcodes()
+        changed += sum(max(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+    return changed / total_length
+
+
+def apply_once(texts: list, technique: str, seed: int) -> tuple:
+    """One application of a technique to every text: (augment() outputs, augment_batch outputs)."""
+    augmenter = TextNoiseAugmenter(seed=seed)
+    transformation, prob = _BATCH_TECHNIQUES[technique]
+    before, after = [], []
+    for index, text in enumerate(texts):
+        before.append(AUGMENT_TECHNIQUES[technique](augmenter, text, index)[0])
+        codes, protected = _to_code_points(text)
+        rng = np.random.default_rng([seed, index])
+        after.append(_from_code_points(transformation(codes, protected, rng, prob)[0]))
+    return before, after
+
+
+def augment_each(augmenter: TextNoiseAugmenter, texts: list, techniques: list = None) -> list:
+    outputs = []
+    for text in texts:
+        augmenter.reset()
+        outputs.append(augmenter.augment(text, techniques))
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check TextNoiseAugmenter.augment_batch against augment()")
+    parser.add_argument("--rows", type=int, default=10000, help="Synthetic column values to augment")
+    parser.add_argument("--n-augments", type=int, default=3, help="Variations per text")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the corpus and of both augmenters")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Largest allowed relative rate difference")
+    args = parser.parse_args()
+
+    print(f"🧪 Building {args.rows:,} synthetic column values...")
+    texts = build_corpus(args.rows, args.seed)
+    augmenter = TextNoiseAugmenter(n_augments=args.n_augments, seed=args.seed)
+
+    start = time.perf_counter()
+    before = augment_each(augmenter, texts)
+    before_elapsed = time.perf_counter() - start
+    print(f"⏱️  augment() per text: {before_elapsed:.2f}s ({args.rows / before_elapsed:,.0f} texts/s)")
+
+    start = time.perf_counter()
+    after = augmenter.augment_batch(texts, args.seed)
+    after_elapsed = time.perf_counter() - start
+    print(f"⚡ augment_batch():    {after_elapsed:.2f}s ({args.rows / after_elapsed:,.0f} texts/s)")
+
+    check_structure(texts, before, args.n_augments, check_placeholders=False)
+    check_structure(texts, after, args.n_augments, check_placeholders=True)
+
+    assert augmenter.augment_batch(texts, args.seed) == after, "augment_batch is not deterministic"
+    order = list(range(len(texts)))
+    random.Random(args.seed).shuffle(order)
+    shuffled = augmenter.augment_batch([texts[i] for i in order], args.seed)
+    assert all(shuffled[k] == after[i] for k, i in enumerate(order)), "variations depend on the batch order"
+    half = len(texts) // 2
+    assert augmenter.augment_batch(texts[half:], args.seed) == after[half:], "variations depend on the batch"
+    print("✅ Structure and determinism checks passed")
+
+    plain_texts = [text for text in texts if not PLACEHOLDER.search(text)]
+    for technique in TECHNIQUES:
+        before_outputs, after_outputs = apply_once(plain_texts, technique, args.seed)
+        expected = change_rate(plain_texts, before_outputs, technique)
+        actual = change_rate(plain_texts, after_outputs, technique)
+        difference = abs(actual - expected) / expected
+        assert difference <= args.tolerance, \
+            f"{technique}: batch rate {actual:.4f} differs from augment() rate {expected:.4f} by {difference:.1%}"
+        print(f"✅ {technique:<16} augment() {expected:.4f}  augment_batch() {actual:.4f}  ({difference:.1%})")
+
+    print(f"✅ augment_batch matches augment() statistically, speedup: {before_elapsed / after_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark and parity check: batched BLEU/SacreBLEU/ROUGE scoring against the reference libraries.
+
+"Before" scores every row with the libraries the `evaluate` metrics wrap (sacrebleu.corpus_bleu
+on one pair, rouge_score's RougeScorer); "after" is calculate_text_generation_metrics_batch.
+Per-row scores and the corpus BLEU/SacreBLEU (sacrebleu.corpus_bleu over all rows) must agree to
+within --tolerance. BLEU is compared with sacrebleu without smoothing (the nmt compute_bleu used by
+the `evaluate` bleu metric); sacrebleu strips trailing whitespace first, so texts ending in "-\\n",
+where the two tokenize differently, are not generated.
+
+Requires sacrebleu and rouge_score (both installed with `evaluate`'s metrics).
+
+Example usage:
+python scripts/benchmarks/text_generation_metrics_benchmark.py --rows 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import sacrebleu
+from rouge_score import rouge_scorer
+
+# Add the project root to the path to import promptsuite_tasks
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from promptsuite_tasks.execution.shared_metrics import calculate_text_generation_metrics_batch
+
+ROUGE_TYPES = ["rouge1", "rouge2", "rougeL"]
+
+
+# --- Reference libraries (old behaviour: one metric call per row) ---
+
+def library_scores(predictions: list, references: list) -> tuple:
+    """(per-row scores by metric name, corpus BLEU/SacreBLEU) computed with sacrebleu and rouge_score."""
+    scorer = rouge_scorer.RougeScorer(ROUGE_TYPES)
+    rows = {name: [] for name in ["bleu", "sacrebleu"] + ROUGE_TYPES}
+    for prediction, reference in zip(predictions, references):
+        rows["bleu"].append(sacrebleu.corpus_bleu([prediction], [[reference]], smooth_method="none").score / 100)
+        rows["sacrebleu"].append(sacrebleu.corpus_bleu([prediction], [[reference]]).score)
+        rouge = scorer.score(reference, prediction)
+        for name in ROUGE_TYPES:
+            rows[name].append(rouge[name].fmeasure)
+    corpus = {
+        "bleu": sacrebleu.corpus_bleu(predictions, [references], smooth_method="none").score / 100,
+        "sacrebleu": sacrebleu.corpus_bleu(predictions, [references]).score,
+    }
+    return rows, corpus
+
+
+# --- Synthetic corpus ---
+
+WORDS = ["the", "cat", "sat", "on", "mat", "a", "dog", "ran", "quickly", "home", "Paris", "is", "capital",
+         "of", "France", "3.14", "1,000", "42", "state-of-the-art", "U.S.", "don't", "(see", "above)", "e-mail",
+         "&amp;", "&quot;quoted&quot;", "$5", "50%", "naïve", "Straße", "東京", "—", "...", "CAT", "Dog"]
+PUNCTUATION = [".", ",", "!", "?", ";", ":", ""]
+
+
+def random_sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    text = " ".join(words) + rng.choice(PUNCTUATION)
+    if rng.random() < 0.1:
+        text = text.replace(" ", "\n", 1)
+    return text
+
+
+def build_corpus(n_rows: int, seed: int) -> tuple:
+    """Predictions and references, with repeated references and predictions like a results CSV."""
+    rng = random.Random(seed)
+    references_pool = [random_sentence(rng, 1, 30) for _ in range(max(1, n_rows // 10))]
+    predictions, references = [], []
+    for _ in range(n_rows):
+        reference = rng.choice(references_pool)
+        roll = rng.random()
+        if roll < 0.2:
+            prediction = reference
+        elif roll < 0.6:
+            # Edit a copy of the reference: drop, swap and insert words
+            words = reference.split()
+            for _ in range(rng.randint(1, 4)):
+                action = rng.random()
+                if action < 0.4 and len(words) > 1:
+                    words.pop(rng.randrange(len(words)))
+                elif action < 0.7 and len(words) > 1:
+                    i, j = rng.randrange(len(words)), rng.randrange(len(words))
+                    words[i], words[j] = words[j], words[i]
+                else:
+                    words.insert(rng.randint(0, len(words)), rng.choice(WORDS))
+            prediction = " ".join(words)
+        elif roll < 0.95:
+            prediction = random_sentence(rng, 1, 40)
+        else:
+            prediction = rng.choice(["", " ", "."])
+        predictions.append(prediction)
+        references.append(reference)
+    return predictions, references
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check batched text generation metrics against sacrebleu/rouge_score")
+    parser.add_argument("--rows", type=int, default=20000, help="Synthetic prediction/reference pairs to score")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the synthetic corpus")
+    parser.add_argument("--tolerance", type=float, default=1e-9, help="Largest allowed absolute score difference")
+    args = parser.parse_args()
+
+    print(f"🧪 Building {args.rows:,} synthetic prediction/reference pairs...")
+    predictions, references = build_corpus(args.rows, args.seed)
+
+    start = time.perf_counter()
+    before_rows, before_corpus = library_scores(predictions, references)
+    before_elapsed = time.perf_counter() - start
+    print(f"⏱️  sacrebleu/rouge_score per row: {before_elapsed:.2f}s ({args.rows / before_elapsed:,.0f} rows/s)")
+
+    start = time.perf_counter()
+    after_rows, after_corpus = calculate_text_generation_metrics_batch(predictions, references)
+    after_elapsed = time.perf_counter() - start
+    print(f"⚡ Batched scoring:              {after_elapsed:.2f}s ({args.rows / after_elapsed:,.0f} rows/s)")
+
+    for name, expected in before_rows.items():
+        differences = [abs(a - b) for a, b in zip(expected, after_rows[name])]
+        worst = max(range(len(differences)), key=differences.__getitem__)
+        assert differences[worst] <= args.tolerance, (
+            f"{name} differs by {differences[worst]:.3g} on row {worst}: "
+            f"prediction={predictions[worst]!r} reference={references[worst]!r}"
+        )
+    for name, expected in before_corpus.items():
+        assert abs(expected - after_corpus[name]) <= args.tolerance, \
+            f"corpus {name}: {after_corpus[name]} != {expected}"
+    print(f"✅ Scores match sacrebleu and rouge_score (corpus BLEU {after_corpus['bleu']:.4f}, "
+          f"SacreBLEU {after_corpus['sacrebleu']:.2f}), speedup: {before_elapsed / after_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Local stub of the OpenAI Files/Batches API (plus chat completions) for testing --engine batch.
+
+Batches move from "validating" to "in_progress" and complete after a configurable number of status
+checks; every request is answered with a fixed completion (optionally failing every Nth request).
+
+Example usage:
+python scripts/stub_batch_api_server.py --port 8765 --answer "A"
+OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub \\
+    python promptsuite_tasks/execution/run_mmlu_batch.py --engine batch --batch_poll_interval 1
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubBatchAPI:
+    """In-memory files and batches."""
+
+    def __init__(self, answer: str, polls_to_complete: int, fail_every: int):
+        self.answer = answer
+        self.polls_to_complete = polls_to_complete
+        self.fail_every = fail_every
+        self.files = {}
+        self.batches = {}
+        self.polls = {}
+        self.lock = threading.Lock()
+
+    def add_file(self, content: bytes, filename: str, purpose: str) -> dict:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        self.files[file_id] = {
+            "id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+            "filename": filename, "purpose": purpose, "status": "processed", "content": content,
+        }
+        return self.public_file(file_id)
+
+    def public_file(self, file_id: str) -> dict:
+        return {key: value for key, value in self.files[file_id].items() if key != "content"}
+
+    def completion(self, request_body: dict) -> dict:
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}", "object": "chat.completion", "created": int(time.time()),
+            "model": request_body.get("model", "stub"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": self.answer}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+    def create_batch(self, body: dict) -> dict:
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        requests = [json.loads(line) for line in self.files[body["input_file_id"]]["content"].decode().splitlines()
+                    if line.strip()]
+        self.batches[batch_id] = {
+            "id": batch_id, "object": "batch", "endpoint": body["endpoint"], "errors": None,
+            "input_file_id": body["input_file_id"], "completion_window": body["completion_window"],
+            "status": "validating", "output_file_id": None, "error_file_id": None,
+            "created_at": int(time.time()),
+            "request_counts": {"total": len(requests), "completed": 0, "failed": 0},
+        }
+        self.polls[batch_id] = 0
+        return self.batches[batch_id]
+
+    def retrieve_batch(self, batch_id: str) -> dict:
+        batch = self.batches[batch_id]
+        self.polls[batch_id] += 1
+        if batch["status"] == "validating":
+            batch["status"] = "in_progress"
+        elif batch["status"] == "in_progress" and self.polls[batch_id] >= self.polls_to_complete:
+            self._complete(batch)
+        return batch
+
+    def _complete(self, batch: dict):
+        requests = [json.loads(line) for line in self.files[batch["input_file_id"]]["content"].decode().splitlines()
+                    if line.strip()]
+        output_lines, error_lines = [], []
+        for i, request in enumerate(requests, 1):
+            line = {"id": f"batch_req_{uuid.uuid4().hex[:12]}", "custom_id": request["custom_id"]}
+            if self.fail_every and i % self.fail_every == 0:
+                line["response"] = {"status_code": 400, "body": {"error": {"message": "Stub failure"}}}
+                line["error"] = None
+                error_lines.append(line)
+            else:
+                line["response"] = {"status_code": 200, "body": self.completion(request["body"])}
+                line["error"] = None
+                output_lines.append(line)
+
+        def to_file(lines):
+            content = "".join(json.dumps(line) + "\n" for line in lines).encode()
+            return self.add_file(content, "batch_output.jsonl", "batch_output")["id"] if lines else None
+
+        batch["output_file_id"] = to_file(output_lines)
+        batch["error_file_id"] = to_file(error_lines)
+        batch["request_counts"] = {"total": len(requests), "completed": len(output_lines), "failed": len(error_lines)}
+        batch["status"] = "completed"
+
+
+def make_handler(api: StubBatchAPI):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, payload, content_type: str = "application/json"):
+            body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        def do_POST(self):
+            body = self._body()
+            with api.lock:
+                if self.path == "/v1/files":
+                    message = BytesParser(policy=default_policy).parsebytes(
+                        f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body)
+                    fields = {part.get_param("name", header="content-disposition"): part
+                              for part in message.iter_parts()}
+                    file_part = fields["file"]
+                    return self._send(200, api.add_file(file_part.get_payload(decode=True),
+                                                        file_part.get_filename() or "upload.jsonl",
+                                                        fields["purpose"].get_content().strip()))
+                if self.path == "/v1/batches":
+                    return self._send(200, api.create_batch(json.loads(body)))
+                if self.path == "/v1/chat/completions":
+                    return self._send(200, api.completion(json.loads(body)))
+            self._send(404, {"error": {"message": f"Unknown endpoint {self.path}"}})
+
+        def do_GET(self):
+            with api.lock:
+                match = re.fullmatch(r"/v1/batches/([\w-]+)", self.path)
+                if match and match.group(1) in api.batches:
+                    return self._send(200, api.retrieve_batch(match.group(1)))
+                match = re.fullmatch(r"/v1/files/([\w-]+)/content", self.path)
+                if match and match.group(1) in api.files:
+                    return self._send(200, api.files[match.group(1)]["content"], "application/octet-stream")
+                match = re.fullmatch(r"/v1/files/([\w-]+)", self.path)
+                if match and match.group(1) in api.files:
+                    return self._send(200, api.public_file(match.group(1)))
+            self._send(404, {"error": {"message": f"Unknown endpoint {self.path}"}})
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, answer: str = "A",
+                      polls_to_complete: int = 2, fail_every: int = 0) -> ThreadingHTTPServer:
+    """Start the stub in a background thread; its base URL is http://host:server.server_address[1]/v1."""
+    api = StubBatchAPI(answer, polls_to_complete, fail_every)
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub OpenAI Batch API server for local testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--answer", default="A", help="Completion returned for every request")
+    parser.add_argument("--polls_to_complete", type=int, default=2,
+                        help="Status checks before a batch completes")
+    parser.add_argument("--fail_every", type=int, default=0,
+                        help="Fail every Nth request of a batch (0 = never)")
+    args = parser.parse_args()
+
+    server = start_stub_server(args.host, args.port, args.answer, args.polls_to_complete, args.fail_every)
+    print(f"🚀 Stub Batch API listening on http://{args.host}:{server.server_address[1]}/v1")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,14 @@ class BaseAxisAugmenter:
         """Get the name of this augmenter."""
         return self.__class__.__name__
 
+    def reset(self):
+        """
+        Restore the augmenter's random state to what it was right after construction.
+
+        Lets a single instance be reused (see AugmenterPool) while producing exactly the
+        same output as a freshly created one. Augmenters that keep an RNG override this.
+        """
+
     # def augment(self, prompt: str, identification_data: Dict[str, Any] = None) -> List[str]:
     #     """
     #     Generate variations of the prompt based on identification data.
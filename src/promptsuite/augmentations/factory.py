@@ -12,6 +12,7 @@ from promptsuite.augmentations.text.context import ContextAugmenter
 from promptsuite.augmentations.text.format_structure import FormatStructureAugmenter
 from promptsuite.augmentations.text.noise import TextNoiseAugmenter
 from promptsuite.augmentations.text.paraphrase import Paraphrase
+from promptsuite.shared.constants import GenerationDefaults
 from promptsuite.core.template_keys import (
     PARAPHRASE_WITH_LLM, SHUFFLE_VARIATION, CONTEXT_VARIATION, FEW_SHOT_VARIATION, ENUMERATE_VARIATION,
     FORMAT_STRUCTURE_VARIATION, TYPOS_AND_NOISE_VARIATION
@@ -70,7 +71,9 @@ class AugmenterFactory:
         if augmenter_class == Paraphrase:
             # Paraphrase requires api_key
             if api_key:
-                return augmenter_class(n_augments=n_augments - 1, api_key=api_key, seed=seed)
+                return augmenter_class(n_augments=n_augments - 1, api_key=api_key, seed=seed,
+                                       model_name=kwargs.get('model_name', GenerationDefaults.MODEL_NAME),
+                                       platform=kwargs.get('platform', GenerationDefaults.API_PLATFORM))
             else:
                 print(f"⚠️ Paraphrase augmenter requires api_key, using TextNoiseAugmenter as fallback")
                 return TextNoiseAugmenter(n_augments=n_augments, seed=seed)
@@ -79,7 +82,10 @@ class AugmenterFactory:
             # ContextAugmenter requires api_key
             if api_key:
                 print(f"✅ Creating ContextAugmenter with API key")
-                return augmenter_class(n_augments=n_augments, seed=seed)
+                return augmenter_class(n_augments=n_augments, seed=seed, api_key=api_key,
+                                       max_concurrency=kwargs.get('max_concurrency', GenerationDefaults.LLM_CONCURRENCY),
+                                       model_name=kwargs.get('model_name', GenerationDefaults.MODEL_NAME),
+                                       platform=kwargs.get('platform', GenerationDefaults.API_PLATFORM))
             else:
                 print(f"⚠️ ContextAugmenter requires api_key, using TextNoiseAugmenter as fallback")
                 print(f"   Context variations add background information but need LLM API access")
@@ -216,6 +222,48 @@ class AugmenterFactory:
         return [str(result)]
 
 
+class AugmenterPool:
+    """
+    Per-run cache of augmenter instances keyed by (variation_type, n_augments, seed, api_key).
+
+    AugmenterFactory.create() is called once per key; later requests reuse the instance after
+    calling its reset(), so the output is identical to creating a fresh augmenter each time
+    but without the construction cost and the factory's console output on every row.
+    """
+
+    def __init__(self):
+        self._augmenters: Dict[tuple, BaseAxisAugmenter] = {}
+
+    def get(
+            self,
+            variation_type: str,
+            n_augments: int,
+            api_key: Optional[str] = None,
+            seed: Optional[int] = None
+    ) -> BaseAxisAugmenter:
+        """Return a ready-to-use augmenter, creating it through AugmenterFactory on first use."""
+        key = (variation_type, n_augments, seed, api_key)
+        augmenter = self._augmenters.get(key)
+        if augmenter is None:
+            augmenter = AugmenterFactory.create(
+                variation_type=variation_type,
+                n_augments=n_augments,
+                api_key=api_key,
+                seed=seed
+            )
+            self._augmenters[key] = augmenter
+        else:
+            augmenter.reset()
+        return augmenter
+
+    def clear(self) -> None:
+        """Drop all pooled augmenters (called at the start of every generation run)."""
+        self._augmenters.clear()
+
+    def __len__(self) -> int:
+        return len(self._augmenters)
+
+
 def create_augmenter(variation_type: str, n_augments: int, api_key: Optional[str] = None,
                      seed: Optional[int] = None) -> BaseAxisAugmenter:
     """
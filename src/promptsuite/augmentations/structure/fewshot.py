@@ -1,11 +1,121 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 
+import numpy as np
 import pandas as pd
 
 from promptsuite.augmentations.base import BaseAxisAugmenter
 from promptsuite.core.exceptions import FewShotGoldFieldMissingError, FewShotDataInsufficientError
 from promptsuite.utils.formatting import format_field_value
 
+# Formats served from a FewShotExampleBank; unknown formats take the DataFrame path
+BANKED_FEW_SHOT_FORMATS = (
+    "shared_ordered_first_n", "shared_ordered_random_n", "shared_unordered_random_n", "random_per_row"
+)
+
+
+def _random_state(seed: Any):
+    """NumPy random state for a seed, resolved the same way DataFrame.sample resolves random_state."""
+    return np.random if seed is None else np.random.RandomState(seed)
+
+
+class FewShotSplitIndex:
+    """
+    Positional index arrays of the rows in each few-shot split of a dataset.
+
+    Each split is computed once per dataset instead of masking the whole DataFrame on every
+    few-shot lookup. Rows without a 'split' column count as 'train'.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._split_positions: Dict[str, np.ndarray] = {}
+        self._label_positions: Optional[Dict[Any, int]] = None
+
+    def positions(self, split: str) -> np.ndarray:
+        """Sorted positions (into data) of the rows available for the given split."""
+        if split not in self._split_positions:
+            if split in ("train", "test"):
+                if 'split' in self.data.columns:
+                    positions = np.flatnonzero((self.data['split'] == split).to_numpy())
+                else:
+                    positions = np.arange(len(self.data) if split == "train" else 0)
+            else:
+                positions = np.arange(len(self.data))
+            self._split_positions[split] = positions
+        return self._split_positions[split]
+
+    def position_of(self, label: Any) -> Optional[int]:
+        """Position of a row label in data, or None if it is not present."""
+        if self._label_positions is None:
+            self._label_positions = {row_label: position for position, row_label in enumerate(self.data.index)}
+        return self._label_positions.get(label)
+
+
+class FewShotExampleBank:
+    """
+    Rendered few-shot examples for one split and prompt format variant.
+
+    Each data row is rendered at most once. The current row is excluded by position lookup
+    rather than a DataFrame drop, and samples are drawn with NumPy over the split's positions,
+    matching what DataFrame.sample would return for the same format, count and seeds.
+    """
+
+    def __init__(self, split_index: FewShotSplitIndex, split: str,
+                 render: Callable[[pd.Series], Optional[Dict[str, str]]]):
+        self.split_index = split_index
+        self.split = split
+        self.pool = split_index.positions(split)
+        self._render = render
+        self._rendered: Dict[int, Optional[Dict[str, str]]] = {}
+        self._shared_positions: Dict[tuple, List[int]] = {}
+
+    def _excluded_position(self, current_row_idx: Any) -> Optional[int]:
+        """Position of the current row within the pool, if the row belongs to this split."""
+        data_position = self.split_index.position_of(current_row_idx)
+        if data_position is None:
+            return None
+        pool_position = int(np.searchsorted(self.pool, data_position))
+        if pool_position < len(self.pool) and self.pool[pool_position] == data_position:
+            return pool_position
+        return None
+
+    def get_examples(self, few_shot_format: str, count: int, current_row_idx: Any,
+                     order_seed: Any = None, selection_seed: Any = None) -> List[Dict[str, str]]:
+        """Return the examples for a row, excluding the row itself from the selection."""
+        excluded = self._excluded_position(current_row_idx)
+        population = len(self.pool) - (excluded is not None)
+        if population < count:
+            raise FewShotDataInsufficientError(count, population, self.split)
+
+        if few_shot_format == "shared_ordered_first_n":
+            positions = [position for position in range(min(count + 1, len(self.pool)))
+                         if position != excluded][:count]
+        else:
+            if few_shot_format == "random_per_row":
+                positions = _random_state(selection_seed).choice(population, size=count, replace=False).tolist()
+            else:
+                # The fixed-seed sample depends only on the population size, so it is drawn once per size
+                sample_key = (population, count)
+                if sample_key not in self._shared_positions:
+                    self._shared_positions[sample_key] = _random_state(42).choice(
+                        population, size=count, replace=False).tolist()
+                positions = self._shared_positions[sample_key]
+                if few_shot_format == "shared_unordered_random_n":
+                    order = _random_state(order_seed).choice(count, size=count, replace=False)
+                    positions = [positions[i] for i in order]
+            if excluded is not None:
+                # Shift positions at or past the current row, as if it had been dropped from the pool
+                positions = [position + 1 if position >= excluded else position for position in positions]
+
+        missing = [position for position in positions if position not in self._rendered]
+        if missing:
+            rows = self.split_index.data.iloc[self.pool[missing]]
+            for position, (_, example_row) in zip(missing, rows.iterrows()):
+                self._rendered[position] = self._render(example_row)
+
+        # Callers may annotate the returned examples, so hand out copies
+        return [dict(self._rendered[position]) for position in positions if self._rendered[position]]
+
 
 class FewShotAugmenter(BaseAxisAugmenter):
     """
@@ -22,10 +132,17 @@ This augmenter handles few-shot examples for NLP tasks.
             seed: Random seed for reproducibility
         """
         super().__init__(n_augments=n_augments, seed=seed)
+        self._example_banks: Dict[tuple, Optional[FewShotExampleBank]] = {}
+        self._split_index: Optional[FewShotSplitIndex] = None
 
     def get_name(self):
         return "Few-Shot Examples"
 
+    def clear_example_bank(self):
+        """Drop all banked few-shot examples (called at the start of each generation run)."""
+        self._example_banks.clear()
+        self._split_index = None
+
     def augment(self, prompt: str, identification_data: Dict[str, Any] = None) -> List[Dict[str, str]]:
         """
         Generate few-shot variations of the prompt for engine use.
@@ -105,13 +222,16 @@ This augmenter handles few-shot examples for NLP tasks.
         few_shot_format = few_shot_field.few_shot_format or "shared_ordered_first_n"
         split = few_shot_field.few_shot_split or "all"
 
-        # Get available data for few-shot examples based on split configuration
-        if split == "train":
-            available_data = data[data.get('split', 'train') == 'train']
-        elif split == "test":
-            available_data = data[data.get('split', 'train') == 'test']
-        else:
-            available_data = data
+        if few_shot_format in BANKED_FEW_SHOT_FORMATS:
+            bank = self._get_example_bank(data, split, prompt_format_variant, gold_field, gold_type,
+                                          options_field, enumerate_configs)
+            if bank is not None:
+                seeds = identification_data or {}
+                return bank.get_examples(few_shot_format, count, current_row_idx,
+                                         order_seed=seeds.get('order_seed', current_row_idx),
+                                         selection_seed=seeds.get('selection_seed', current_row_idx))
+
+        available_data = self._filter_by_split(data, split)
 
         # Remove current row to avoid data leakage (regardless of its split)
         available_data = available_data.drop(current_row_idx, errors='ignore')
@@ -139,87 +259,129 @@ This augmenter handles few-shot examples for NLP tasks.
 
         examples = []
         for _, example_row in sampled_data.iterrows():
-            input_values = {}
-            output_value = ""
-            for col in example_row.index:
-                if gold_field and col == gold_field:
-                    from promptsuite.utils.formatting import convert_index_to_value
-                    output_value = convert_index_to_value(
-                        example_row, gold_field, gold_type, options_field
-                    )
-                    # If the options field is enumerated and gold_type is 'index', 
-                    # we need to format the output to match the enumerated format
-                    if (gold_type == 'index' and options_field and 
-                        enumerate_configs and options_field in enumerate_configs):
-                        enum_config = enumerate_configs[options_field]
-                        enum_type = enum_config.get('type', '1234')
-                        try:
-                            gold_index = int(example_row[gold_field])
-                            from promptsuite.augmentations.structure.enumerate import EnumeratorAugmenter
-                            enumerator = EnumeratorAugmenter()
-                            
-                            # Handle both list and string formats for options
-                            options_data = example_row[options_field]
-                            if isinstance(options_data, (list, tuple)):
-                                options_list = [str(item).strip() for item in options_data]
-                            else:
-                                # Create enumerated format: "1. option1, 2. option2, ..." then extract the right one
-                                options_text = str(options_data)
-                                options_list = [item.strip() for item in options_text.split(',')]
-                            
-                            if 0 <= gold_index < len(options_list):
-                                # Format as enumerated item: "2. option_text"
-                                if enum_type == '1234':
-                                    output_value = f"{gold_index + 1}. {options_list[gold_index].strip()}"
-                                elif enum_type == 'ABCD':
-                                    letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-                                    if gold_index < len(letters):
-                                        output_value = f"{letters[gold_index]}. {options_list[gold_index].strip()}"
-                                elif enum_type == 'abcd':
-                                    letters = 'abcdefghijklmnopqrstuvwxyz'
-                                    if gold_index < len(letters):
-                                        output_value = f"{letters[gold_index]}. {options_list[gold_index].strip()}"
-                                elif enum_type == 'roman':
-                                    romans = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII', 'XIX', 'XX', 'XXI', 'XXII', 'XXIII', 'XXIV', 'XXV', 'XXVI', 'XXVII', 'XXVIII', 'XXIX', 'XXX', 'XXXI', 'XXXII', 'XXXIII', 'XXXIV', 'XXXV', 'XXXVI', 'XXXVII', 'XXXVIII', 'XXXIX', 'XL']
-                                    if gold_index < len(romans):
-                                        output_value = f"{romans[gold_index]}. {options_list[gold_index].strip()}"
-                                # Add more enum types as needed
-                        except (ValueError, IndexError) as e:
-                            print(f"⚠️ Error formatting enumerated gold value: {e}")
-                else:
-                    # Keep original field value for enumeration processing
-                    original_field_value = example_row[col]
-                    
-                    # Apply enumeration if configured (before formatting)
-                    if enumerate_configs and col in enumerate_configs:
-                        enum_config = enumerate_configs[col]
-                        enum_type = enum_config.get('type', '1234')
-                        try:
-                            from promptsuite.augmentations.structure.enumerate import EnumeratorAugmenter
-                            enumerator = EnumeratorAugmenter()
-                            # Pass the original value (could be list or string) directly to enumerate
-                            field_value = enumerator.enumerate_field(original_field_value, enum_type)
-                        except Exception as e:
-                            print(f"⚠️ Error enumerating field '{col}' in few-shot example: {e}")
-                            # Fallback to formatted original value
-                            field_value = format_field_value(original_field_value)
-                    else:
-                        # No enumeration needed, just format the value
-                        field_value = format_field_value(original_field_value)
-                    
-                    input_values[col] = field_value
-            input_template = prompt_format_variant
-            if gold_field:
-                gold_placeholder = f'{{{gold_field}}}'
-                input_template = input_template.replace(gold_placeholder, '').strip()
-            input_text = self._fill_template_placeholders(input_template, input_values)
-            if input_text:
-                examples.append({
-                    "input": input_text,
-                    "output": output_value if output_value else ""
-                })
+            example = self._render_example(example_row, prompt_format_variant, gold_field, gold_type,
+                                           options_field, enumerate_configs)
+            if example:
+                examples.append(example)
         return examples
 
+    def _get_split_index(self, data: pd.DataFrame) -> FewShotSplitIndex:
+        """Get the split index for this dataset, resetting the banks when the dataset changes."""
+        if self._split_index is None or self._split_index.data is not data:
+            self._example_banks.clear()
+            self._split_index = FewShotSplitIndex(data)
+        return self._split_index
+
+    def _filter_by_split(self, data: pd.DataFrame, split: str) -> pd.DataFrame:
+        """Get available data for few-shot examples based on split configuration."""
+        return data.iloc[self._get_split_index(data).positions(split)]
+
+    def _get_example_bank(self, data: pd.DataFrame, split: str, prompt_format_variant: str, gold_field: str,
+                          gold_type: str, options_field: str,
+                          enumerate_configs: Optional[Dict[str, dict]]) -> Optional[FewShotExampleBank]:
+        """Get (or build) the example bank for this data, split and rendering configuration."""
+        split_index = self._get_split_index(data)
+        enumerate_key = tuple(sorted(
+            (field, config.get('type', '1234')) for field, config in (enumerate_configs or {}).items()
+        ))
+        key = (split, prompt_format_variant, gold_field, gold_type, options_field, enumerate_key)
+        if key not in self._example_banks:
+            if not data.index.is_unique:
+                # Dropping a duplicated label removes several rows; leave that to the DataFrame path
+                self._example_banks[key] = None
+                return None
+            self._example_banks[key] = FewShotExampleBank(
+                split_index, split,
+                lambda example_row: self._render_example(example_row, prompt_format_variant, gold_field,
+                                                         gold_type, options_field, enumerate_configs)
+            )
+        return self._example_banks[key]
+
+    def _render_example(self, example_row: pd.Series, prompt_format_variant: str, gold_field: str = None,
+                        gold_type: str = 'value', options_field: str = None,
+                        enumerate_configs: Dict[str, dict] = None) -> Optional[Dict[str, str]]:
+        """Render a single data row as a few-shot example, or None if the rendered input is empty."""
+        input_values = {}
+        output_value = ""
+        for col in example_row.index:
+            if gold_field and col == gold_field:
+                from promptsuite.utils.formatting import convert_index_to_value
+                output_value = convert_index_to_value(
+                    example_row, gold_field, gold_type, options_field
+                )
+                # If the options field is enumerated and gold_type is 'index', 
+                # we need to format the output to match the enumerated format
+                if (gold_type == 'index' and options_field and 
+                    enumerate_configs and options_field in enumerate_configs):
+                    enum_config = enumerate_configs[options_field]
+                    enum_type = enum_config.get('type', '1234')
+                    try:
+                        gold_index = int(example_row[gold_field])
+                        from promptsuite.augmentations.structure.enumerate import EnumeratorAugmenter
+                        enumerator = EnumeratorAugmenter()
+                        
+                        # Handle both list and string formats for options
+                        options_data = example_row[options_field]
+                        if isinstance(options_data, (list, tuple)):
+                            options_list = [str(item).strip() for item in options_data]
+                        else:
+                            # Create enumerated format: "1. option1, 2. option2, ..." then extract the right one
+                            options_text = str(options_data)
+                            options_list = [item.strip() for item in options_text.split(',')]
+                        
+                        if 0 <= gold_index < len(options_list):
+                            # Format as enumerated item: "2. option_text"
+                            if enum_type == '1234':
+                                output_value = f"{gold_index + 1}. {options_list[gold_index].strip()}"
+                            elif enum_type == 'ABCD':
+                                letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                                if gold_index < len(letters):
+                                    output_value = f"{letters[gold_index]}. {options_list[gold_index].strip()}"
+                            elif enum_type == 'abcd':
+                                letters = 'abcdefghijklmnopqrstuvwxyz'
+                                if gold_index < len(letters):
+                                    output_value = f"{letters[gold_index]}. {options_list[gold_index].strip()}"
+                            elif enum_type == 'roman':
+                                romans = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII', 'XIX', 'XX', 'XXI', 'XXII', 'XXIII', 'XXIV', 'XXV', 'XXVI', 'XXVII', 'XXVIII', 'XXIX', 'XXX', 'XXXI', 'XXXII', 'XXXIII', 'XXXIV', 'XXXV', 'XXXVI', 'XXXVII', 'XXXVIII', 'XXXIX', 'XL']
+                                if gold_index < len(romans):
+                                    output_value = f"{romans[gold_index]}. {options_list[gold_index].strip()}"
+                            # Add more enum types as needed
+                    except (ValueError, IndexError) as e:
+                        print(f"⚠️ Error formatting enumerated gold value: {e}")
+            else:
+                # Keep original field value for enumeration processing
+                original_field_value = example_row[col]
+                
+                # Apply enumeration if configured (before formatting)
+                if enumerate_configs and col in enumerate_configs:
+                    enum_config = enumerate_configs[col]
+                    enum_type = enum_config.get('type', '1234')
+                    try:
+                        from promptsuite.augmentations.structure.enumerate import EnumeratorAugmenter
+                        enumerator = EnumeratorAugmenter()
+                        # Pass the original value (could be list or string) directly to enumerate
+                        field_value = enumerator.enumerate_field(original_field_value, enum_type)
+                    except Exception as e:
+                        print(f"⚠️ Error enumerating field '{col}' in few-shot example: {e}")
+                        # Fallback to formatted original value
+                        field_value = format_field_value(original_field_value)
+                else:
+                    # No enumeration needed, just format the value
+                    field_value = format_field_value(original_field_value)
+                
+                input_values[col] = field_value
+        input_template = prompt_format_variant
+        if gold_field:
+            gold_placeholder = f'{{{gold_field}}}'
+            input_template = input_template.replace(gold_placeholder, '').strip()
+        input_text = self._fill_template_placeholders(input_template, input_values)
+        if not input_text:
+            return None
+        return {
+            "input": input_text,
+            "output": output_value if output_value else ""
+        }
+
     def _fill_template_placeholders(self, template: str, values: Dict[str, str]) -> str:
         """Fill template placeholders with values."""
         if not template:
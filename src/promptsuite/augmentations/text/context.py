@@ -1,6 +1,8 @@
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from promptsuite.augmentations.base import BaseAxisAugmenter
+from promptsuite.shared.constants import GenerationDefaults
 from promptsuite.shared.model_client import get_completion
 
 
@@ -10,7 +12,9 @@ class ContextAugmenter(BaseAxisAugmenter):
     This doesn't change the meaning of the task but makes the prompt longer.
     """
 
-    def __init__(self, n_augments=3, seed: Optional[int] = None, api_key: str = None):
+    def __init__(self, n_augments=3, seed: Optional[int] = None, api_key: str = None,
+                 max_concurrency: int = GenerationDefaults.LLM_CONCURRENCY,
+                 model_name: str = GenerationDefaults.MODEL_NAME, platform: str = GenerationDefaults.API_PLATFORM):
         """
         Initialize the context augmenter.
 
@@ -18,9 +22,15 @@ class ContextAugmenter(BaseAxisAugmenter):
             n_augments: Number of variations to generate
             seed: Random seed for reproducibility
             api_key: API key for the language model service
+            max_concurrency: Maximum number of concurrent LLM requests (1 = sequential)
+            model_name: Model that generates the context
+            platform: Platform serving the model
         """
         super().__init__(n_augments=n_augments, seed=seed)
         self.api_key = api_key
+        self.max_concurrency = max_concurrency
+        self.model_name = model_name
+        self.platform = platform
         
     def get_name(self):
         return "Context Variations"
@@ -39,12 +49,19 @@ class ContextAugmenter(BaseAxisAugmenter):
         variations = [prompt]  # Start with the original prompt
         
         # Generate n_augments-1 variations (since we already have the original)
-        for _ in range(self.n_augments - 1):
-            # Randomly decide whether to add context before, after, or both
-            variation_type = random.choice(["before", "after", "both"])
-            
-            # Generate the variation
-            new_variation = self._generate_variation(prompt, variation_type)
+        # Randomly decide whether to add context before, after, or both
+        variation_types = [random.choice(["before", "after", "both"]) for _ in range(self.n_augments - 1)]
+
+        # The LLM requests are independent, so issue them concurrently (results keep their order)
+        if self.max_concurrency > 1 and len(variation_types) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(variation_types))) as executor:
+                new_variations = list(executor.map(
+                    lambda variation_type: self._generate_variation(prompt, variation_type), variation_types
+                ))
+        else:
+            new_variations = [self._generate_variation(prompt, variation_type) for variation_type in variation_types]
+
+        for new_variation in new_variations:
             if new_variation and new_variation != prompt:
                 variations.append(new_variation)
         
@@ -66,7 +83,8 @@ class ContextAugmenter(BaseAxisAugmenter):
         
         # Call language model to generate the variation
         try:
-            result = get_completion(meta_prompt, api_key=self.api_key)
+            result = get_completion(meta_prompt, model_name=self.model_name, platform=self.platform,
+                                    api_key=self.api_key)
             # Check if the result is valid (not empty and not the same as the original prompt and the original prompt is in the result)
             if result and result != prompt and prompt in result:
                 return result
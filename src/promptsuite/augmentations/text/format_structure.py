@@ -10,7 +10,7 @@ import re
 from typing import List
 
 from promptsuite.augmentations.base import BaseAxisAugmenter
-from promptsuite.augmentations.utils import random_composed_augmentations, protect_placeholders, restore_placeholders
+from promptsuite.augmentations.utils import random_composed_augmentations, protect_text
 
 
 class FormatStructureAugmenter(BaseAxisAugmenter):
@@ -36,6 +36,10 @@ class FormatStructureAugmenter(BaseAxisAugmenter):
     def __init__(self, n_augments=5, seed=None):
         super().__init__(n_augments=n_augments, seed=seed)
         self._rng = random.Random(self.seed)
+
+    def reset(self):
+        """Re-seed the internal RNG so a reused instance behaves like a new one."""
+        self._rng.seed(self.seed)
     
     def change_separators(self, text: str) -> List[str]:
         """
@@ -148,7 +152,7 @@ class FormatStructureAugmenter(BaseAxisAugmenter):
                 - "Question {text} Answer {answer}"
         """
         # Protect placeholders before augmentation
-        protected_text, placeholder_map = protect_placeholders(text)
+        protected = protect_text(text)
         
         # Use the shared utility for random composed augmentations
         transformations = [
@@ -158,13 +162,13 @@ class FormatStructureAugmenter(BaseAxisAugmenter):
             self.remove_separators
         ]
         variations = random_composed_augmentations(
-            protected_text,
+            protected.text,
             transformations,
             self.n_augments,
             self._rng
         )
         # Restore placeholders in all variations
-        restored_variations = [restore_placeholders(var, placeholder_map) for var in variations]
+        restored_variations = [protected.restore(var) for var in variations]
         return restored_variations
 
 
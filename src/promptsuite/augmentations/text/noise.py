@@ -8,13 +8,130 @@ to noisy input, including typos, character swaps, punctuation changes, etc.
 import itertools
 import random
 import re
-from typing import List
+import zlib
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from promptsuite.augmentations.base import BaseAxisAugmenter
 from promptsuite.shared.constants import NoiseAugmenterConstants
-from promptsuite.augmentations.utils import random_composed_augmentations, protect_placeholders, restore_placeholders
+from promptsuite.augmentations.utils import PLACEHOLDER_PATTERN, random_composed_augmentations, protect_text
+
+
+# Lookup tables for the batched (NumPy) noise engine, indexed by ASCII code point
+_ASCII_SIZE = 128
+_KEYBOARD_COUNTS = np.zeros(_ASCII_SIZE, dtype=np.int64)
+_KEYBOARD_NEIGHBORS = np.zeros(
+    (_ASCII_SIZE, max(len(keys) for keys in NoiseAugmenterConstants.QUERTY_KEYBOARD.values())), dtype=np.uint32
+)
+for _key, _keys in NoiseAugmenterConstants.QUERTY_KEYBOARD.items():
+    _KEYBOARD_COUNTS[ord(_key)] = len(_keys)
+    _KEYBOARD_NEIGHBORS[ord(_key), :len(_keys)] = [ord(c) for c in _keys]
+_PUNCTUATION_CODES = np.array([ord(p) for p in NoiseAugmenterConstants.PUNCTUATION_MARKS], dtype=np.uint32)
+_PUNCTUATION_INDEX = np.full(_ASCII_SIZE, -1, dtype=np.int64)
+_PUNCTUATION_INDEX[_PUNCTUATION_CODES] = np.arange(len(_PUNCTUATION_CODES))
+_WHITESPACE_MASK = np.zeros(_ASCII_SIZE, dtype=bool)
+_WHITESPACE_MASK[[ord(c) for c in " \t\n\r\x0b\x0c"]] = True
+_WHITESPACE_CODES = np.array([ord(option) for option in NoiseAugmenterConstants.WHITE_SPACE_OPTIONS[
+    NoiseAugmenterConstants.MIN_WHITESPACE_INDEX:NoiseAugmenterConstants.MAX_WHITESPACE_INDEX + 1] if option],
+    dtype=np.uint32)
+
+
+def _to_code_points(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert text to a code-point array plus a mask of positions inside {placeholders}."""
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).copy()
+    protected = np.zeros(len(codes), dtype=bool)
+    for match in PLACEHOLDER_PATTERN.finditer(text):
+        protected[match.start():match.end()] = True
+    return codes, protected
+
+
+def _from_code_points(codes: np.ndarray) -> str:
+    return codes.tobytes().decode('utf-32-le')
+
+
+def _ascii_lookup(table: np.ndarray, codes: np.ndarray, default):
+    """Look up codes in an ASCII table, using default for non-ASCII code points."""
+    is_ascii = codes < _ASCII_SIZE
+    return np.where(is_ascii, table[np.where(is_ascii, codes, 0)], default)
+
+
+def _batch_typos(codes, protected, rng, prob):
+    """Replace keyboard characters with a neighbouring key, keeping their case."""
+    is_upper = (codes >= 65) & (codes <= 90)
+    lower = np.where(is_upper, codes + 32, codes)
+    hit = (_ascii_lookup(_KEYBOARD_COUNTS, lower, 0) > 0) & ~protected & (rng.random(len(codes)) < prob)
+    if not hit.any():
+        return codes, protected
+    keys = lower[hit]
+    picks = (rng.random(len(keys)) * _KEYBOARD_COUNTS[keys]).astype(np.int64)
+    replacements = _KEYBOARD_NEIGHBORS[keys, picks]
+    is_lower_letter = (replacements >= 97) & (replacements <= 122)
+    codes = codes.copy()
+    codes[hit] = np.where(is_upper[hit] & is_lower_letter, replacements - 32, replacements)
+    return codes, protected
+
+
+def _batch_change_case(codes, protected, rng, prob):
+    """Flip the case of ASCII letters."""
+    is_letter = ((codes >= 65) & (codes <= 90)) | ((codes >= 97) & (codes <= 122))
+    hit = is_letter & ~protected & (rng.random(len(codes)) < prob)
+    return np.where(hit, codes ^ 32, codes).astype(np.uint32), protected
+
+
+def _batch_swap_characters(codes, protected, rng, prob):
+    """Swap adjacent characters; of two overlapping swaps only the left one is applied."""
+    if len(codes) < 2:
+        return codes, protected
+    picked = ~protected[:-1] & ~protected[1:] & (rng.random(len(codes) - 1) < prob)
+    picked &= ~np.concatenate(([False], picked[:-1]))
+    indices = np.flatnonzero(picked)
+    if not len(indices):
+        return codes, protected
+    codes = codes.copy()
+    codes[indices], codes[indices + 1] = codes[indices + 1], codes[indices]
+    return codes, protected
+
+
+def _batch_switch_punctuation(codes, protected, rng, prob):
+    """Replace punctuation marks with a different punctuation mark."""
+    current = _ascii_lookup(_PUNCTUATION_INDEX, codes, -1)
+    hit = (current >= 0) & ~protected & (rng.random(len(codes)) < prob)
+    if not hit.any():
+        return codes, protected
+    current = current[hit]
+    # Draw from the other marks: skip over the current mark's index
+    choices = rng.integers(0, len(_PUNCTUATION_CODES) - 1, size=len(current))
+    codes = codes.copy()
+    codes[hit] = _PUNCTUATION_CODES[choices + (choices >= current)]
+    return codes, protected
+
+
+def _batch_white_spaces(codes, protected, rng, prob=None):
+    """Replace every whitespace run with a random run of white space characters."""
+    is_space = _ascii_lookup(_WHITESPACE_MASK, codes, False) & ~protected
+    if not is_space.any():
+        return codes, protected
+    run_starts = is_space & ~np.concatenate(([False], is_space[:-1]))
+    repeats = np.where(is_space, 0, 1)
+    repeats[run_starts] = rng.integers(NoiseAugmenterConstants.MIN_WHITESPACE_COUNT,
+                                       NoiseAugmenterConstants.MAX_WHITESPACE_COUNT + 1,
+                                       size=int(run_starts.sum()))
+    new_codes = np.repeat(codes, repeats)
+    new_spaces = np.repeat(run_starts, repeats)
+    new_codes[new_spaces] = _WHITESPACE_CODES[rng.integers(0, len(_WHITESPACE_CODES), size=int(new_spaces.sum()))]
+    return new_codes, np.repeat(protected, repeats)
+
+
+# Batched counterparts of the techniques used by TextNoiseAugmenter.augment, with the same per-character
+# rates (butter_finger's `choice(range(100)) <= int(prob * 100)` makes a typo with probability 0.06 for prob 0.05)
+_BATCH_TECHNIQUES = {
+    "typos": (_batch_typos, (int(0.05 * 100) + 1) / 100),
+    "capitalization": (_batch_change_case, 0.15),
+    "spacing": (_batch_white_spaces, None),
+    "swap_characters": (_batch_swap_characters, NoiseAugmenterConstants.DEFAULT_TYPO_PROB),
+    "punctuation": (_batch_switch_punctuation, NoiseAugmenterConstants.DEFAULT_TYPO_PROB),
+}
 
 
 class TextNoiseAugmenter(BaseAxisAugmenter):
@@ -34,14 +151,18 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
         super().__init__(n_augments=n_augments, seed=seed)
         self._rng = random.Random(self.seed)
 
-    def _add_white_spaces_to_single_text(self, value, placeholder_map=None):
+    def reset(self):
+        """Re-seed the internal RNG so a reused instance behaves like a new one."""
+        self._rng.seed(self.seed)
+
+    def _add_white_spaces_to_single_text(self, value, protected=None):
         """
         Add white spaces to the input text.
-        If placeholder_map is provided, placeholders are already protected.
+        If protected is provided, placeholders are already protected.
 
         Args:
             value: The input text to augment.
-            placeholder_map: Optional mapping of placeholder tokens to restore
+            protected: Optional ProtectedText whose placeholders should be restored
 
         Returns:
             Augmented text with added white spaces.
@@ -61,8 +182,8 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
                 new_value += word
         
         # Restore placeholders if provided
-        if placeholder_map:
-            new_value = restore_placeholders(new_value, placeholder_map)
+        if protected is not None:
+            new_value = protected.restore(new_value)
         
         return new_value
 
@@ -82,11 +203,11 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
         # Handle single text input
         if isinstance(inputs, str):
             # Protect placeholders
-            protected_text, placeholder_map = protect_placeholders(inputs)
+            protected = protect_text(inputs)
             
             augmented_input = []
             for i in range(max_outputs):
-                augmented_text = self._add_white_spaces_to_single_text(protected_text, placeholder_map)
+                augmented_text = self._add_white_spaces_to_single_text(protected.text, protected)
                 augmented_input.append(augmented_text)
             return augmented_input
 
@@ -94,12 +215,12 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
         augmented_texts = []
         for input_text in inputs:
             # Protect placeholders for each text
-            protected_text, placeholder_map = protect_placeholders(input_text)
+            protected = protect_text(input_text)
             
             augmented_input = []
             for i in range(max_outputs):
                 # Apply augmentation
-                cur_augmented_texts = self._add_white_spaces_to_single_text(protected_text, placeholder_map)
+                cur_augmented_texts = self._add_white_spaces_to_single_text(protected.text, protected)
                 augmented_input.append(cur_augmented_texts)
             augmented_texts.append(augmented_input)
         return augmented_texts
@@ -121,7 +242,7 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
             List of texts with typos.
         """
         # Protect placeholders
-        protected_text, placeholder_map = protect_placeholders(text)
+        protected = protect_text(text)
         
         rng = random.Random(self.seed + seed)
         key_approx = NoiseAugmenterConstants.QUERTY_KEYBOARD if keyboard == "querty" else {}
@@ -133,8 +254,8 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
         prob_of_typo = int(prob * 100)
         perturbed_texts = []
         for _ in itertools.repeat(None, max_outputs):
-            butter_text = ""
-            for letter in protected_text:
+            butter_chars = []
+            for letter in protected.text:
                 lcletter = letter.lower()
                 if lcletter not in key_approx.keys():
                     new_letter = lcletter
@@ -146,10 +267,10 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
                 # go back to original case
                 if not lcletter == letter:
                     new_letter = new_letter.upper()
-                butter_text += new_letter
+                butter_chars.append(new_letter)
             
             # Restore placeholders
-            restored_text = restore_placeholders(butter_text, placeholder_map)
+            restored_text = protected.restore("".join(butter_chars))
             perturbed_texts.append(restored_text)
         return perturbed_texts
 
@@ -169,13 +290,13 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
             List of texts with modified character cases.
         """
         # Protect placeholders
-        protected_text, placeholder_map = protect_placeholders(text)
+        protected = protect_text(text)
         
         rng = np.random.default_rng(self.seed + seed)
         results = []
         for _ in range(max_outputs):
             result = []
-            for c in protected_text:
+            for c in protected.text:
                 if c.isupper() and rng.random() < prob:
                     result.append(c.lower())
                 elif c.islower() and rng.random() < prob:
@@ -185,7 +306,7 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
             result = "".join(result)
             
             # Restore placeholders
-            restored_text = restore_placeholders(result, placeholder_map)
+            restored_text = protected.restore(result)
             results.append(restored_text)
         return results
 
@@ -204,26 +325,27 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
             (taken from the NL-Augmenter project)
         """
         # Protect placeholders
-        protected_text, placeholder_map = protect_placeholders(text)
+        protected = protect_text(text)
         
         results = []
         for _ in range(max_outputs):
             max_seed = 2 ** 32
             # seed with hash so each text of same length gets different treatment.
-            np.random.seed((self.seed + seed + sum([ord(c) for c in protected_text])) % max_seed)
+            # A local RandomState gives the same draws as seeding the global np.random, without the side effect
+            np_rng = np.random.RandomState((self.seed + seed + sum([ord(c) for c in protected.text])) % max_seed)
             # number of possible characters to swap.
-            num_pairs = len(protected_text) - 1
+            num_pairs = len(protected.text) - 1
             # if no pairs, do nothing
             if num_pairs < 1:
                 return [text]  # Return original text as list
             # get indices to swap.
             indices_to_swap = np.argwhere(
-                np.random.rand(num_pairs) < prob
+                np_rng.rand(num_pairs) < prob
             ).reshape(-1)
             # shuffle swapping order, may matter if there are adjacent swaps.
-            np.random.shuffle(indices_to_swap)
+            np_rng.shuffle(indices_to_swap)
             # convert to list.
-            text_list = list(protected_text)
+            text_list = list(protected.text)
             # swap.
             for index in indices_to_swap:
                 text_list[index], text_list[index + 1] = text_list[index + 1], text_list[index]
@@ -231,7 +353,7 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
             swapped_text = "".join(text_list)
             
             # Restore placeholders
-            restored_text = restore_placeholders(swapped_text, placeholder_map)
+            restored_text = protected.restore(swapped_text)
             results.append(restored_text)
         return results
 
@@ -248,22 +370,22 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
             max_outputs: Maximum number of augmented outputs.
         """
         # Protect placeholders
-        protected_text, placeholder_map = protect_placeholders(text)
+        protected = protect_text(text)
         
         results = []
         for _ in range(max_outputs):
-            np.random.seed(self.seed + seed)
-            text_chars = list(protected_text)
+            np_rng = np.random.RandomState(self.seed + seed)
+            text_chars = list(protected.text)
             for i in range(len(text_chars)):
-                if text_chars[i] in NoiseAugmenterConstants.PUNCTUATION_MARKS and np.random.rand() < prob:
+                if text_chars[i] in NoiseAugmenterConstants.PUNCTUATION_MARKS and np_rng.rand() < prob:
                     # Randomly select a different punctuation mark to switch with
-                    new_punctuation = np.random.choice([p for p in NoiseAugmenterConstants.PUNCTUATION_MARKS
+                    new_punctuation = np_rng.choice([p for p in NoiseAugmenterConstants.PUNCTUATION_MARKS
                                                         if p != text_chars[i]])
                     text_chars[i] = new_punctuation
             
             # Restore placeholders
             modified_text = "".join(text_chars)
-            restored_text = restore_placeholders(modified_text, placeholder_map)
+            restored_text = protected.restore(modified_text)
             results.append(restored_text)
         return results
 
@@ -281,7 +403,7 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
             List of augmented texts including the original text
         """
         # Protect placeholders before augmentation
-        protected_text, placeholder_map = protect_placeholders(text)
+        protected = protect_text(text)
         
         # Default sequence if none provided
         if techniques is None:
@@ -298,15 +420,70 @@ class TextNoiseAugmenter(BaseAxisAugmenter):
         transformations = [technique_map[name] for name in techniques if name in technique_map]
         
         variations = random_composed_augmentations(
-            protected_text,
+            protected.text,
             transformations,
             self.n_augments,
             self._rng
         )
         # Restore placeholders in all variations
-        restored_variations = [restore_placeholders(var, placeholder_map) for var in variations]
+        restored_variations = [protected.restore(var) for var in variations]
         return restored_variations
 
+    def augment_batch(self, texts: List[str], seed: Optional[int] = None,
+                      techniques: List[str] = None) -> List[List[str]]:
+        """
+        Apply text noise transformations to a batch of texts (e.g. a whole dataset column).
+
+        Each text is converted to a NumPy code-point array once and every technique is applied as
+        a vectorized mask over it, with the same per-character rates as augment(). Each text gets
+        its own Generator seeded from (seed, text content), so a text's variations do not depend on
+        the rest of the batch and repeated texts are only augmented once. Placeholders in format
+        {field_name} are never modified. Case changes and white space runs only apply to ASCII
+        characters. The random streams differ from augment(), so for the same seed the variations
+        are not the same as augment()'s; scripts/benchmarks/noise_batch_benchmark.py checks that
+        they are statistically equivalent.
+
+        Args:
+            texts: The texts to augment
+            seed: Random seed of the batch (default: the augmenter seed)
+            techniques: List of techniques to compose, as in augment(). If None, all are used.
+
+        Returns:
+            List with, for each input text, its variations including the original text
+        """
+        if seed is None:
+            seed = self.seed
+        if techniques is None:
+            techniques = ["typos", "capitalization", "spacing", "swap_characters", "punctuation"]
+        transformations = [_BATCH_TECHNIQUES[name] for name in techniques if name in _BATCH_TECHNIQUES]
+
+        augmented: Dict[str, List[str]] = {}
+        for text in texts:
+            if text not in augmented:
+                augmented[text] = self._augment_code_points(text, transformations, seed)
+        return [list(augmented[text]) for text in texts]
+
+    def _augment_code_points(self, text: str, transformations: list, seed: int) -> List[str]:
+        """Compose random subsets of batched transformations over a single text's code points."""
+        if not transformations:
+            return [text]
+        rng = np.random.default_rng([seed % (1 << 64), zlib.crc32(text.encode('utf-8'))])
+        codes, protected = _to_code_points(text)
+
+        # Same composition scheme as random_composed_augmentations
+        variations: Dict[str, None] = {text: None}
+        attempts = 0
+        max_attempts = self.n_augments * 5
+        while len(variations) < self.n_augments and attempts < max_attempts:
+            k = int(rng.integers(1, len(transformations) + 1))
+            var_codes, var_protected = codes, protected
+            for index in rng.permutation(len(transformations))[:k]:
+                transformation, prob = transformations[index]
+                var_codes, var_protected = transformation(var_codes, var_protected, rng, prob)
+            variations[_from_code_points(var_codes)] = None
+            attempts += 1
+        return list(variations)
+
 
 if __name__ == "__main__":
     # Create the augmenter
@@ -1,6 +1,7 @@
 from promptsuite.augmentations.base import BaseAxisAugmenter
 from typing import List, Optional
 import ast
+from promptsuite.shared.constants import GenerationDefaults
 from promptsuite.shared.model_client import get_completion
 from promptsuite.core.template_keys import PARAPHRASE_WITH_LLM
 
@@ -62,7 +63,8 @@ Output only a Python list of strings with the alternatives. Do not include any e
 
 Original instruction: '''{prompt}'''"""
 class Paraphrase(BaseAxisAugmenter):
-    def __init__(self, n_augments: int = 1, api_key: str = None, seed: Optional[int] = None):
+    def __init__(self, n_augments: int = 1, api_key: str = None, seed: Optional[int] = None,
+                 model_name: str = GenerationDefaults.MODEL_NAME, platform: str = GenerationDefaults.API_PLATFORM):
         """
         Initialize the paraphrse augmenter.
 
@@ -70,9 +72,13 @@ class Paraphrase(BaseAxisAugmenter):
             n_augments: number of paraphrase needed
             api_key: API key for the language model service
             seed: Random seed for reproducibility
+            model_name: Model that generates the paraphrases
+            platform: Platform serving the model
         """
         super().__init__(n_augments=n_augments, seed=seed)
         self.api_key = api_key
+        self.model_name = model_name
+        self.platform = platform
 
     def build_rephrasing_prompt(self, template: str, n_augments: int, prompt: str) -> str:
         return template.format(n_augments=n_augments, prompt=prompt)
@@ -88,7 +94,8 @@ class Paraphrase(BaseAxisAugmenter):
             List of paraphrased variations
         """
         rephrasing_prompt = self.build_rephrasing_prompt(instruction_template, self.n_augments, prompt)
-        response = get_completion(rephrasing_prompt, api_key=self.api_key)
+        response = get_completion(rephrasing_prompt, model_name=self.model_name, platform=self.platform,
+                                  api_key=self.api_key)
         return ast.literal_eval(response)
 
     def _generate_simple_paraphrases(self, prompt: str) -> List[str]:
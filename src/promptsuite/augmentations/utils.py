@@ -1,6 +1,63 @@
 import random
 import re
-from typing import Callable, List, Set, Tuple, Dict
+from functools import lru_cache
+from typing import Callable, List, Tuple, Dict
+
+
+PLACEHOLDER_PATTERN = re.compile(r'\{[^}]+\}')
+
+
+class ProtectedText:
+    """
+    A text with its {placeholders} swapped for numeric tokens, plus a compiled pattern to swap them back.
+
+    Instances are immutable and cached per text by protect_text, so a template string is tokenized
+    once and reused across every augmentation technique and variation applied to it.
+    """
+
+    __slots__ = ('original', 'text', 'placeholder_map', '_restore_pattern')
+
+    def __init__(self, original: str):
+        self.original = original
+        self.placeholder_map: Dict[str, str] = {}
+        token_by_placeholder: Dict[str, str] = {}
+        # Use a simple numeric token to minimize corruption; a repeated placeholder keeps its first token
+        for i, placeholder in enumerate(PLACEHOLDER_PATTERN.findall(original)):
+            token = f"9999{i}9999"
+            self.placeholder_map[token] = placeholder
+            token_by_placeholder.setdefault(placeholder, token)
+
+        if self.placeholder_map:
+            self.text = PLACEHOLDER_PATTERN.sub(lambda match: token_by_placeholder[match.group(0)], original)
+            self._restore_pattern = _compile_restore_pattern(tuple(self.placeholder_map))
+        else:
+            self.text = original
+            self._restore_pattern = None
+
+    def restore(self, text: str) -> str:
+        """Restore the original placeholders in (an augmented version of) the protected text."""
+        if self._restore_pattern is None:
+            return text
+        return self._restore_pattern.sub(lambda match: self.placeholder_map[match.group(0)], text)
+
+
+@lru_cache(maxsize=1024)
+def _compile_restore_pattern(tokens: Tuple[str, ...]) -> re.Pattern:
+    return re.compile('|'.join(re.escape(token) for token in tokens))
+
+
+@lru_cache(maxsize=4096)
+def protect_text(text: str) -> ProtectedText:
+    """
+    Get the (cached) ProtectedText for a text.
+
+    Args:
+        text: Text that may contain placeholders like {field_name}
+
+    Returns:
+        ProtectedText with the tokenized text and its placeholder map
+    """
+    return ProtectedText(text)
 
 
 def protect_placeholders(text: str) -> Tuple[str, Dict[str, str]]:
@@ -13,19 +70,8 @@ def protect_placeholders(text: str) -> Tuple[str, Dict[str, str]]:
     Returns:
         Tuple of (protected_text, placeholder_map)
     """
-    # Find all placeholders in format {field_name}
-    placeholders = re.findall(r'\{[^}]+\}', text)
-    placeholder_map = {}
-    protected_text = text
-
-    # Replace each placeholder with a simple number token that's unlikely to be corrupted
-    for i, placeholder in enumerate(placeholders):
-        # Use a simple numeric token to minimize corruption
-        token = f"9999{i}9999"
-        placeholder_map[token] = placeholder
-        protected_text = protected_text.replace(placeholder, token)
-
-    return protected_text, placeholder_map
+    protected = protect_text(text)
+    return protected.text, dict(protected.placeholder_map)
 
 
 def restore_placeholders(text: str, placeholder_map: Dict[str, str]) -> str:
@@ -39,10 +85,9 @@ def restore_placeholders(text: str, placeholder_map: Dict[str, str]) -> str:
     Returns:
         Text with original placeholders restored
     """
-    restored_text = text
-    for token, placeholder in placeholder_map.items():
-        restored_text = restored_text.replace(token, placeholder)
-    return restored_text
+    if not placeholder_map:
+        return text
+    return _compile_restore_pattern(tuple(placeholder_map)).sub(lambda match: placeholder_map[match.group(0)], text)
 
 
 def random_composed_augmentations(
@@ -62,8 +107,9 @@ def random_composed_augmentations(
     Returns:
         List of n_augments unique variations (including the original text)
     """
-    variations: Set[str] = set()
-    variations.add(text)
+    # Insertion-ordered (dict keys) rather than a set, so the result does not depend on
+    # the interpreter's hash seed and is reproducible across processes
+    variations: Dict[str, None] = {text: None}
     attempts = 0
     max_attempts = n_augments * 5
     while len(variations) < n_augments and attempts < max_attempts:
@@ -77,6 +123,6 @@ def random_composed_augmentations(
                 var = result[-1]
             else:
                 var = result
-        variations.add(var)
+        variations[var] = None
         attempts += 1
     return list(variations)[:n_augments]
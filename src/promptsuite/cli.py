@@ -18,12 +18,19 @@ from promptsuite.shared.constants import GenerationDefaults
 @click.option('--data', '-d', required=True, help='Input data file (CSV or JSON)')
 @click.option('--output', '-o', default='variations.json', help='Output file path')
 @click.option('--format', '-f', type=click.Choice(['json', 'csv', 'txt']), default='json', help='Output format')
-@click.option('--max-variations', '-m', default=100, help='Maximum number of variations per row (use 0 for unlimited)')
+@click.option('--max-variations', '-m', 'max_variations_per_row', default=100, help='Maximum number of variations per row (use 0 for unlimited)')
 @click.option('--variations-per-field', '-v', default=GenerationDefaults.VARIATIONS_PER_FIELD,
               help='Number of variations per field')
 @click.option('--api-key', '-k', envvar='TOGETHER_API_KEY', help='API key for paraphrase generation')
+@click.option('--num-workers', '-w', default=GenerationDefaults.NUM_WORKERS,
+              help='Number of worker processes to shard rows across (1 = no multiprocessing)')
+@click.option('--llm-concurrency', default=GenerationDefaults.LLM_CONCURRENCY,
+              help='Maximum concurrent LLM requests for paraphrase/context variations')
+@click.option('--batch-noise', is_flag=True, default=GenerationDefaults.BATCH_NOISE,
+              help='Generate typos/noise variations per column with the vectorized batch engine')
 @click.version_option(version=__version__)
-def main(template, data, output, format, max_variations_per_row, variations_per_field, api_key):
+def main(template, data, output, format, max_variations_per_row, variations_per_field, api_key, num_workers,
+         llm_concurrency, batch_noise):
     """PromptSuiteEngine - Generate prompt variations from templates."""
 
     click.echo(f"PromptSuiteEngine v{__version__}")
@@ -59,23 +66,34 @@ def main(template, data, output, format, max_variations_per_row, variations_per_
         # Initialize PromptSuiteEngine
         sp = PromptSuiteEngine(max_variations_per_row=effective_max_variations_per_row)
 
-        # Generate variations
+        # Generate variations lazily and stream them straight to the output file
         click.echo("Generating variations...")
-        variations = sp.generate_variations(
+        variations = sp.iter_variations(
             template=template_dict,
             data=df,
             variations_per_field=variations_per_field,
-            api_key=api_key
+            api_key=api_key,
+            num_workers=num_workers,
+            llm_concurrency=llm_concurrency,
+            batch_noise=batch_noise
         )
 
-        click.echo(f"Generated {len(variations)} variations")
+        # Only per-row counts are kept for the statistics, never the variations themselves
+        row_counts = {}
+
+        def track_rows(variation_iter):
+            for var in variation_iter:
+                row_idx = var.get('original_row_index', 0)
+                row_counts[row_idx] = row_counts.get(row_idx, 0) + 1
+                yield var
 
         # Save output
-        sp.save_variations(variations, output, format=format)
+        total = sp.save_variations(track_rows(variations), output, format=format)
+        click.echo(f"Generated {total} variations")
         click.echo(f"Saved to {output}")
 
         # Show statistics
-        stats = sp.get_stats(variations)
+        stats = sp.build_stats(row_counts, template_dict)
         click.echo("\nStatistics:")
         for key, value in stats.items():
             click.echo(f"  {key}: {value}")
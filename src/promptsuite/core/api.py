@@ -82,7 +82,10 @@ class PromptSuite:
             'random_seed': GenerationDefaults.RANDOM_SEED,
             'api_platform': GenerationDefaults.API_PLATFORM,
             'api_key': None,  # Will be set based on platform
-            'model_name': GenerationDefaults.MODEL_NAME
+            'model_name': GenerationDefaults.MODEL_NAME,
+            'num_workers': GenerationDefaults.NUM_WORKERS,
+            'llm_concurrency': GenerationDefaults.LLM_CONCURRENCY,
+            'batch_noise': GenerationDefaults.BATCH_NOISE
         }
         # Set API key based on default platform
         self.config['api_key'] = self._get_api_key_for_platform(self.config['api_platform'])
@@ -262,6 +265,10 @@ class PromptSuite:
             api_platform: AI platform ("TogetherAI" or "OpenAI") (default: "TogetherAI")
             api_key: API key for paraphrase variations (default: from environment based on platform)
             model_name: LLM model name (default: "meta-llama/Llama-3.3-70B-Instruct-Turbo-Free")
+            num_workers: Worker processes to shard rows across (default: 1 = no multiprocessing)
+            llm_concurrency: Maximum concurrent LLM requests for paraphrase/context variations (default: 8)
+            batch_noise: Generate typos/noise variations column by column with the vectorized
+                         TextNoiseAugmenter.augment_batch instead of per value (default: False)
         """
         # Handle platform change specially
         if 'api_platform' in kwargs:
@@ -368,7 +375,10 @@ class PromptSuite:
                 api_key=self.config['api_key'],
                 seed=self.config['random_seed'],
                 progress_callback=final_callback,
-                max_rows=self.config['max_rows']  # Pass max_rows to engine
+                max_rows=self.config['max_rows'],  # Pass max_rows to engine
+                num_workers=self.config['num_workers'],
+                llm_concurrency=self.config['llm_concurrency'],
+                batch_noise=self.config['batch_noise']
             )
 
             # Step 5: Compute statistics
@@ -10,9 +10,16 @@ IMPORTANT: PromptSuiteEngine assumes clean input data:
 If your data doesn't meet these requirements, clean it before passing to PromptSuiteEngine.
 """
 
+import csv
+import itertools
 import json
+import math
+import pickle
+import tempfile
 import time
-from typing import Dict, List, Any, Optional, Callable
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
 
 import pandas as pd
 from tqdm import tqdm
@@ -22,7 +29,7 @@ from promptsuite.core.exceptions import (
     UnsupportedFileFormatError, UnsupportedExportFormatError
 )
 from promptsuite.core.models import (
-    GoldFieldConfig, VariationConfig, VariationContext, FieldVariation
+    GoldFieldConfig, VariationConfig, VariationContext, FieldVariation, GenerationContext
 )
 from promptsuite.core.template_keys import (
     PROMPT_FORMAT, FEW_SHOT_KEY, INSTRUCTION_VARIATIONS, PROMPT_FORMAT_VARIATIONS
@@ -71,6 +78,9 @@ class PromptSuiteEngine:
             seed: Optional[int] = None,
             progress_callback: Optional[Callable] = None,
             max_rows: Optional[int] = None,
+            num_workers: int = GenerationDefaults.NUM_WORKERS,
+            llm_concurrency: int = GenerationDefaults.LLM_CONCURRENCY,
+            batch_noise: bool = GenerationDefaults.BATCH_NOISE,
             **kwargs
     ) -> List[Dict[str, Any]]:
         """
@@ -85,10 +95,72 @@ class PromptSuiteEngine:
             progress_callback: Optional callback function for progress updates
                               Should accept (row_idx, total_rows, variations_this_row, total_variations, eta)
             max_rows: Optional maximum number of rows to process
+            num_workers: Number of worker processes to shard rows across (1 = in-process).
+                         The output is identical to the serial run for the same seed.
+            llm_concurrency: Maximum concurrent LLM requests when pre-generating
+                             paraphrase / context variations (1 = sequential)
+            batch_noise: Noise whole columns at once with TextNoiseAugmenter.augment_batch
+                         (vectorized, one random stream per value) instead of augment() per value
         
         Returns:
             List of generated variations
         """
+        return list(self.iter_variations(
+            template,
+            data,
+            variations_per_field=variations_per_field,
+            api_key=api_key,
+            seed=seed,
+            progress_callback=progress_callback,
+            max_rows=max_rows,
+            num_workers=num_workers,
+            llm_concurrency=llm_concurrency,
+            batch_noise=batch_noise,
+            **kwargs
+        ))
+
+    def iter_variations(
+            self,
+            template: dict,
+            data: pd.DataFrame,
+            variations_per_field: int = GenerationDefaults.VARIATIONS_PER_FIELD,
+            api_key: str = None,
+            seed: Optional[int] = None,
+            progress_callback: Optional[Callable] = None,
+            max_rows: Optional[int] = None,
+            num_workers: int = GenerationDefaults.NUM_WORKERS,
+            llm_concurrency: int = GenerationDefaults.LLM_CONCURRENCY,
+            batch_noise: bool = GenerationDefaults.BATCH_NOISE,
+            **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate prompt variations lazily, yielding them row by row.
+
+        Takes the same arguments as generate_variations(). The template is validated and the
+        instruction / prompt format variations are pre-generated when this method is called;
+        row variations are only built as the returned iterator is consumed, so memory use
+        does not grow with the number of rows.
+
+        Returns:
+            Iterator over generated variations, in the same order as generate_variations()
+        """
+        context = self._prepare_generation_context(
+            template, data, variations_per_field, api_key, seed, max_rows, llm_concurrency, batch_noise
+        )
+        return self._iter_row_variations(context, progress_callback, num_workers)
+
+    def _prepare_generation_context(
+            self,
+            template: dict,
+            data: pd.DataFrame,
+            variations_per_field: int,
+            api_key: Optional[str],
+            seed: Optional[int],
+            max_rows: Optional[int],
+            llm_concurrency: int = GenerationDefaults.LLM_CONCURRENCY,
+            batch_noise: bool = GenerationDefaults.BATCH_NOISE
+    ) -> GenerationContext:
+        """Validate the template, load the data and pre-generate the shared variations."""
         # Validate template
         is_valid, errors = self.template_parser.validate_template(template)
         if not is_valid:
@@ -101,6 +173,10 @@ class PromptSuiteEngine:
             # Even for DataFrames passed directly, check for string lists
             data = self._convert_string_lists_to_lists(data)
 
+        # Augmenters and few-shot example banks are reused within a run only
+        self.variation_generator.augmenter_pool.clear()
+        self.few_shot_handler.few_shot_augmenter.clear_example_bank()
+
         # Parse template
         fields = self.template_parser.parse(template)
         variation_fields = self.template_parser.get_variation_fields()
@@ -113,7 +189,9 @@ class PromptSuiteEngine:
             variations_per_field=variations_per_field,
             api_key=api_key,
             max_variations_per_row=self.max_variations_per_row,
-            seed=seed
+            seed=seed,
+            llm_concurrency=llm_concurrency,
+            batch_noise=batch_noise
         )
         instruction = self.template_parser.get_instruction()
 
@@ -159,8 +237,6 @@ class PromptSuiteEngine:
                 FieldVariation(data=prompt_format, gold_update=None)
             ]
 
-        all_variations = []
-
         # Filter data by split if few-shot split is configured
         target_split = None
         if few_shot_fields:
@@ -174,50 +250,130 @@ class PromptSuiteEngine:
         if max_rows is not None and len(generation_data) > max_rows:
             generation_data = generation_data.iloc[:max_rows]
             print(f"📊 Limited to first {len(generation_data)} rows after split filtering")
-        
-        # For each data row (only from the target split)
+
+        # Noise variations of whole columns, looked up by value while building the rows
+        noised_values = {}
+        if batch_noise:
+            noised_values = self.variation_generator.generate_batch_noise_variations(
+                variation_fields, generation_data, variation_config
+            )
+
+        return GenerationContext(
+            template=template,
+            data=data,
+            generation_data=generation_data,
+            variation_fields=variation_fields,
+            gold_config=gold_config,
+            variation_config=variation_config,
+            pre_generated_variations=pre_generated_variations,
+            few_shot_field=few_shot_fields[0] if few_shot_fields else None,
+            noised_values=noised_values
+        )
+
+    def _generate_row(self, context: GenerationContext, row_idx, row: pd.Series) -> List[Dict[str, Any]]:
+        """Build all variations for a single data row."""
+        # Generate variations for row-specific fields only (not instruction/prompt format)
+        field_variations = self.variation_generator.generate_row_specific_field_variations(
+            context.variation_fields,
+            row,
+            context.variation_config,
+            context.gold_config,
+            context.pre_generated_variations,  # Pass pre-generated variations
+            context.template,  # Pass template for few-shot handling
+            context.noised_values
+        )
+
+        # Create variation context
+        variation_context = VariationContext(
+            row_data=row,
+            row_index=row_idx,
+            template=context.template,
+            field_variations=field_variations,
+            gold_config=context.gold_config,
+            variation_config=context.variation_config,
+            data=context.data  # Pass full data for few-shot examples
+        )
+
+        # Generate row variations with limit for efficiency
+        return self.few_shot_handler.create_row_variations(
+            variation_context,
+            context.few_shot_field,
+            self.max_variations_per_row,  # Pass the limit directly
+            self.prompt_builder
+        )
+
+    def _iter_rows_serial(self, context: GenerationContext) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+        """Yield (row_idx, row_variations) for every row, generated in this process."""
+        for row_idx, row in context.generation_data.iterrows():
+            yield row_idx, self._generate_row(context, row_idx, row)
+
+    def _iter_rows_parallel(
+            self,
+            context: GenerationContext,
+            num_workers: int
+    ) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+        """
+        Yield (row_idx, row_variations) for every row, generated by a pool of worker processes.
+
+        The generation context (data and pre-generated variations) is sent once to each worker
+        when it starts; tasks only carry row ranges. Chunks are yielded in row order and only
+        a bounded number of them are in flight, so output order and memory use match the
+        serial path.
+        """
+        total_rows = len(context.generation_data)
+        chunk_size = max(1, min(GenerationDefaults.PARALLEL_CHUNK_SIZE,
+                                math.ceil(total_rows / (num_workers * 4))))
+        chunks = iter([
+            (start, min(start + chunk_size, total_rows))
+            for start in range(0, total_rows, chunk_size)
+        ])
+
+        print(f"🚀 Sharding {total_rows} rows across {num_workers} worker processes (chunks of {chunk_size})")
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_generation_worker,
+            initargs=(self.max_variations_per_row, context)
+        )
+        try:
+            pending = deque(
+                executor.submit(_generate_row_chunk, start, stop)
+                for start, stop in itertools.islice(chunks, num_workers * 2)
+            )
+            while pending:
+                chunk_results = pending.popleft().result()
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(executor.submit(_generate_row_chunk, *next_chunk))
+
+                for row_idx, row_variations in chunk_results:
+                    # Workers strip the template to keep results small; share the caller's dict again
+                    for variation in row_variations:
+                        variation['template_config'] = context.template
+                    yield row_idx, row_variations
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_row_variations(
+            self,
+            context: GenerationContext,
+            progress_callback: Optional[Callable] = None,
+            num_workers: int = GenerationDefaults.NUM_WORKERS
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the variations of each row in order, reporting progress as rows complete."""
         start_time = time.time()
-        total_rows = len(generation_data)
+        total_rows = len(context.generation_data)
+        total_variations_so_far = 0
+
+        if num_workers > 1 and total_rows > 1:
+            rows = self._iter_rows_parallel(context, num_workers)
+        else:
+            rows = self._iter_rows_serial(context)
         
-        with tqdm(generation_data.iterrows(), desc="Generating variations", total=total_rows) as pbar:
-            for row_idx, row in pbar:
-                row_start_time = time.time()
-                
-                # Generate variations for row-specific fields only (not instruction/prompt format)
-                field_variations = self.variation_generator.generate_row_specific_field_variations(
-                    variation_fields,
-                    row,
-                    variation_config,
-                    gold_config,
-                    pre_generated_variations,  # Pass pre-generated variations
-                    template  # Pass template for few-shot handling
-                )
-
-                # Create variation context
-                variation_context = VariationContext(
-                    row_data=row,
-                    row_index=row_idx,
-                    template=template,
-                    field_variations=field_variations,
-                    gold_config=gold_config,
-                    variation_config=variation_config,
-                    data=data  # Pass full data for few-shot examples
-                )
-
-                # Generate row variations with limit for efficiency
-                row_variations = self.few_shot_handler.create_row_variations(
-                    variation_context,
-                    few_shot_fields[0] if few_shot_fields else None,
-                    self.max_variations_per_row,  # Pass the limit directly
-                    self.prompt_builder
-                )
-
-                all_variations.extend(row_variations)
-                
+        with tqdm(rows, desc="Generating variations", total=total_rows) as pbar:
+            for row_idx, row_variations in pbar:
                 # Update progress bar with detailed information
-                row_time = time.time() - row_start_time
                 variations_this_row = len(row_variations)
-                total_variations_so_far = len(all_variations)
+                total_variations_so_far += variations_this_row
                 avg_time_per_row = (time.time() - start_time) / (row_idx + 1)
                 eta = avg_time_per_row * (total_rows - row_idx - 1)
                 
@@ -232,7 +388,7 @@ class PromptSuiteEngine:
                 if progress_callback:
                     progress_callback(row_idx, total_rows, variations_this_row, total_variations_so_far, eta)
 
-        return all_variations
+                yield from row_variations
 
     def _load_data(self, data_path: str) -> pd.DataFrame:
         """Load data from file path and automatically convert string representations of lists."""
@@ -281,24 +437,39 @@ class PromptSuiteEngine:
 
         return df_copy
 
-    def get_stats(self, variations: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Get statistics about generated variations."""
-        if not variations:
-            return {}
-
+    def get_stats(self, variations: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get statistics about generated variations (a list or any single-pass iterable)."""
         row_counts = {}
+        template_config = None
         for var in variations:
+            if template_config is None:
+                template_config = var.get('template_config', {})
             row_idx = var.get('original_row_index', 0)
             row_counts[row_idx] = row_counts.get(row_idx, 0) + 1
 
+        if template_config is None:
+            return {}
+
+        return self.build_stats(row_counts, template_config)
+
+    @staticmethod
+    def build_stats(row_counts: Dict[Any, int], template_config: dict) -> Dict[str, Any]:
+        """
+        Build the statistics dictionary from per-row variation counts.
+
+        Lets streaming consumers (e.g. the CLI) count rows while writing variations out,
+        instead of keeping every variation around for get_stats().
+        """
+        if not row_counts:
+            return {}
+
         # Get field info from template config
-        template_config = variations[0].get('template_config', {})
         field_count = len([k for k in template_config.keys() if k not in [FEW_SHOT_KEY, PROMPT_FORMAT]])
         has_few_shot = FEW_SHOT_KEY in template_config
         has_custom_prompt_format = PROMPT_FORMAT in template_config
 
         return {
-            'total_variations': len(variations),
+            'total_variations': sum(row_counts.values()),
             'original_rows': len(row_counts),
             'avg_variations_per_row': sum(row_counts.values()) / len(row_counts) if row_counts else 0,
             'template_fields': field_count,
@@ -325,109 +496,139 @@ class PromptSuiteEngine:
         Returns:
             List of variations with conversation field added and extra fields removed
         """
-        enhanced_variations = []
-
-        for variation in variations:
-            # Create a new variation with reorganized structure
-            enhanced_var = {
-                'original_row_index': variation.get('original_row_index', 0),
-                'variation_count': variation.get('variation_count', 1),
-                'prompt': variation.get('prompt', ''),
-                'conversation': None,  # Will be set below
-                'gold_updates': variation.get('gold_updates'),
-                'configuration': {
-                    'template_config': variation.get('template_config', {}),
-                    'field_values': variation.get('field_values', {})
-                }
+        return [
+            PromptSuiteEngine._prepare_variation_for_conversation_export(variation)
+            for variation in variations
+        ]
+
+    @staticmethod
+    def _prepare_variation_for_conversation_export(variation: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a single variation to the conversation export format."""
+        # Create a new variation with reorganized structure
+        enhanced_var = {
+            'original_row_index': variation.get('original_row_index', 0),
+            'variation_count': variation.get('variation_count', 1),
+            'prompt': variation.get('prompt', ''),
+            'conversation': None,  # Will be set below
+            'gold_updates': variation.get('gold_updates'),
+            'configuration': {
+                'template_config': variation.get('template_config', {}),
+                'field_values': variation.get('field_values', {})
             }
+        }
+
+        # Add conversation field if not already present
+        if 'conversation' in variation and variation['conversation']:
+            enhanced_var['conversation'] = variation['conversation']
+        else:
+            # Build conversation from prompt
+            prompt = variation.get('prompt', '')
+
+            # Split prompt into conversation parts if it contains few-shot examples
+            parts = prompt.split('\n\n')
+            conversation = []
+
+            for i, part in enumerate(parts):
+                part = part.strip()
+                if not part:
+                    continue
+
+                # Check if this is the last part (incomplete question)
+                if i == len(parts) - 1:
+                    # Last part - this is the question without answer
+                    conversation.append({
+                        "role": "user",
+                        "content": part
+                    })
+                else:
+                    # This is a complete Q&A pair
+                    # Split by the last occurrence of newline to separate question and answer
+                    lines = part.split('\n')
+                    if len(lines) >= 2:
+                        # Assume the last line is the answer
+                        answer = lines[-1].strip()
+                        question = '\n'.join(lines[:-1]).strip()
 
-            # Add conversation field if not already present
-            if 'conversation' in variation and variation['conversation']:
-                enhanced_var['conversation'] = variation['conversation']
-            else:
-                # Build conversation from prompt
-                prompt = variation.get('prompt', '')
-
-                # Split prompt into conversation parts if it contains few-shot examples
-                parts = prompt.split('\n\n')
-                conversation = []
-
-                for i, part in enumerate(parts):
-                    part = part.strip()
-                    if not part:
-                        continue
-
-                    # Check if this is the last part (incomplete question)
-                    if i == len(parts) - 1:
-                        # Last part - this is the question without answer
                         conversation.append({
                             "role": "user",
-                            "content": part
+                            "content": question
+                        })
+                        conversation.append({
+                            "role": "assistant",
+                            "content": answer
                         })
                     else:
-                        # This is a complete Q&A pair
-                        # Split by the last occurrence of newline to separate question and answer
-                        lines = part.split('\n')
-                        if len(lines) >= 2:
-                            # Assume the last line is the answer
-                            answer = lines[-1].strip()
-                            question = '\n'.join(lines[:-1]).strip()
-
-                            conversation.append({
-                                "role": "user",
-                                "content": question
-                            })
-                            conversation.append({
-                                "role": "assistant",
-                                "content": answer
-                            })
-                        else:
-                            # Single line - treat as user message
-                            conversation.append({
-                                "role": "user",
-                                "content": part
-                            })
-
-                enhanced_var['conversation'] = conversation
-
-            enhanced_variations.append(enhanced_var)
-
-        return enhanced_variations
-
-    def save_variations(self, variations: List[Dict[str, Any]], output_path: str, format: str = "json"):
-        """Save variations to file."""
+                        # Single line - treat as user message
+                        conversation.append({
+                            "role": "user",
+                            "content": part
+                        })
+
+            enhanced_var['conversation'] = conversation
+
+        return enhanced_var
+
+    def save_variations(self, variations: Iterable[Dict[str, Any]], output_path: str, format: str = "json") -> int:
+        """
+        Save variations to file.
+
+        Variations are written one at a time, so a lazy iterator (e.g. from iter_variations())
+        is exported without ever holding the whole dataset in memory.
+
+        Returns:
+            Number of variations written
+        """
+        if format not in ["json", "csv", "txt"]:
+            raise UnsupportedExportFormatError(format, ["json", "csv", "txt"])
+
+        count = 0
         if format == "json":
-            # Prepare variations to conversation format before dumping to JSON
-            conversation_variations = PromptSuiteEngine._prepare_variations_for_conversation_export(variations)
+            # Same layout as json.dump(..., indent=2), written one element at a time
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(conversation_variations, f, indent=2, ensure_ascii=False)
+                f.write('[')
+                for var in variations:
+                    # Prepare variation to conversation format before dumping to JSON
+                    conversation_var = PromptSuiteEngine._prepare_variation_for_conversation_export(var)
+                    element = json.dumps(conversation_var, indent=2, ensure_ascii=False)
+                    f.write(',\n  ' if count else '\n  ')
+                    f.write(element.replace('\n', '\n  '))
+                    count += 1
+                f.write('\n]' if count else ']')
 
         elif format == "csv":
-            flattened = []
-            for var in variations:
-                flat_var = {
-                    'prompt': var['prompt'],
-                    'original_row_index': var.get('original_row_index', ''),
-                    'variation_count': var.get('variation_count', ''),
-                }
-                for key, value in var.get('field_values', {}).items():
-                    flat_var[f'field_{key}'] = value
-                flattened.append(flat_var)
-
-            df = pd.DataFrame(flattened)
-            df.to_csv(output_path, index=False, encoding='utf-8')
-
-        elif format == "txt":
+            # Variations may have different fields, so the header is the union of all keys (in order of
+            # first appearance). Rows are spilled to a temporary file while the header is collected.
+            fieldnames = {}
+            with tempfile.TemporaryFile() as spill:
+                for var in variations:
+                    flat_var = {
+                        'prompt': var['prompt'],
+                        'original_row_index': var.get('original_row_index', ''),
+                        'variation_count': var.get('variation_count', ''),
+                    }
+                    for key, value in var.get('field_values', {}).items():
+                        flat_var[f'field_{key}'] = value
+                    fieldnames.update(dict.fromkeys(flat_var))
+                    pickle.dump(flat_var, spill, protocol=pickle.HIGHEST_PROTOCOL)
+                    count += 1
+
+                spill.seek(0)
+                with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                    if count:
+                        writer = csv.DictWriter(f, fieldnames=list(fieldnames), restval='', lineterminator='\n')
+                        writer.writeheader()
+                        for _ in range(count):
+                            writer.writerow(pickle.load(spill))
+
+        else:
             with open(output_path, 'w', encoding='utf-8') as f:
-                for i, var in enumerate(variations):
-                    f.write(f"=== Variation {i + 1} ===\n")
+                for var in variations:
+                    count += 1
+                    f.write(f"=== Variation {count} ===\n")
                     f.write(var['prompt'])
                     f.write("\n\n")
 
-        else:
-            raise UnsupportedExportFormatError(format, ["json", "csv", "txt"])
-
-
+        return count
 
     def _filter_data_by_split(self, data: pd.DataFrame, target_split: Optional[str]) -> pd.DataFrame:
         """
@@ -451,3 +652,27 @@ class PromptSuiteEngine:
         print(f"📊 Filtered data: {len(filtered_data)} rows NOT from '{target_split}' split (out of {len(data)} total)")
         
         return filtered_data
+
+
+# Per-process state for parallel generation, set once per worker by _init_generation_worker
+_worker_engine: Optional[PromptSuiteEngine] = None
+_worker_context: Optional[GenerationContext] = None
+
+
+def _init_generation_worker(max_variations_per_row: Optional[int], context: GenerationContext) -> None:
+    """Process-pool initializer: receive the shared generation context once per worker."""
+    global _worker_engine, _worker_context
+    _worker_engine = PromptSuiteEngine(max_variations_per_row=max_variations_per_row)
+    _worker_context = context
+
+
+def _generate_row_chunk(start: int, stop: int) -> List[Tuple[Any, List[Dict[str, Any]]]]:
+    """Generate the variations of rows [start, stop) of the generation data inside a worker."""
+    results = []
+    for row_idx, row in _worker_context.generation_data.iloc[start:stop].iterrows():
+        row_variations = _worker_engine._generate_row(_worker_context, row_idx, row)
+        for variation in row_variations:
+            # The parent re-attaches its own template; avoid pickling a copy per variation
+            variation['template_config'] = None
+        results.append((row_idx, row_variations))
+    return results
@@ -2,7 +2,7 @@
 Data models for PromptSuiteEngine to manage parameters and context.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 
 import pandas as pd
@@ -41,6 +41,8 @@ class VariationConfig:
     api_key: Optional[str] = None
     max_variations_per_row: Optional[int] = GenerationDefaults.MAX_VARIATIONS_PER_ROW
     seed: Optional[int] = GenerationDefaults.RANDOM_SEED
+    llm_concurrency: int = GenerationDefaults.LLM_CONCURRENCY
+    batch_noise: bool = GenerationDefaults.BATCH_NOISE
 
 
 @dataclass
@@ -68,6 +70,20 @@ class VariationContext:
         return str(self.row_data[field_name])
 
 
+@dataclass
+class GenerationContext:
+    """Run-level state shared by every row of a single generation run."""
+    template: dict
+    data: pd.DataFrame  # Full dataset (few-shot examples are drawn from here)
+    generation_data: pd.DataFrame  # Rows to generate variations for
+    variation_fields: Dict[str, List[str]]
+    gold_config: GoldFieldConfig
+    variation_config: VariationConfig
+    pre_generated_variations: Dict[str, List[FieldVariation]]
+    few_shot_field: Any = None
+    noised_values: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)  # With batch_noise: field -> value -> variations
+
+
 @dataclass
 class FieldAugmentationData:
     """Data needed for generating variations on a specific field."""
@@ -2,7 +2,8 @@
 Few Shot Handler: Centralized handling of few-shot examples and row variation creation.
 """
 
-import itertools
+import math
+import random
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 
@@ -98,15 +99,6 @@ class FewShotHandler:
 
         return few_shot_config
 
-    def _filter_data_by_split(self, data: pd.DataFrame, split: str) -> pd.DataFrame:
-        """Filter data based on split configuration."""
-        if split == "train":
-            return data[data.get('split', 'train') == 'train']
-        elif split == "test":
-            return data[data.get('split', 'train') == 'test']
-        else:  # 'all'
-            return data
-
     def create_row_variations(
             self,
             variation_context: VariationContext,
@@ -121,21 +113,24 @@ class FewShotHandler:
         if not varying_fields:
             return variations
 
-        # Create all possible combinations of field variations
-        variation_combinations = self._create_variation_combinations(variation_context.field_variations)
-        
-        # Create a list of (combination, original_index) pairs to track original indices
-        indexed_combinations = [(combo, idx) for idx, combo in enumerate(variation_combinations)]
+        # Combinations are addressed by their position in itertools.product order
+        # (a mixed-radix number over the field variation lists) instead of being materialized,
+        # so the per-row cost scales with the number of variations kept, not the Cartesian space
+        field_lists = [variation_context.field_variations[field] for field in varying_fields]
+        total_combinations = math.prod(len(values) for values in field_lists)
+        combination_indices = range(total_combinations)
         
         # If we have a limit, sample deterministically based on seed
-        if max_variations_per_row is not None and len(indexed_combinations) > max_variations_per_row:
-            import random
+        if max_variations_per_row is not None and total_combinations > max_variations_per_row:
             # Create a new random instance with seed for consistent sampling
             seed = variation_context.variation_config.seed if variation_context.variation_config.seed is not None else 42
             rng = random.Random(seed)
-            indexed_combinations = rng.sample(indexed_combinations, max_variations_per_row)
+            # random.sample only draws positions, so sampling the range picks the same
+            # combinations as sampling the materialized product list
+            combination_indices = rng.sample(combination_indices, max_variations_per_row)
 
-        for combination, original_index in tqdm(indexed_combinations, desc="Creating row variations", unit="variation"):
+        for original_index in tqdm(combination_indices, desc="Creating row variations", unit="variation"):
+            combination = self._combination_at(field_lists, original_index)
 
             # Build a single variation using the original index
             variation = self._build_single_variation(
@@ -148,12 +143,19 @@ class FewShotHandler:
 
         return variations
 
-    def _create_variation_combinations(
-            self,
-            field_variations: Dict[str, List[FieldVariation]]
-    ) -> List[tuple]:
-        """Create all possible combinations of field variations."""
-        return list(itertools.product(*[field_variations[field] for field in field_variations.keys()]))
+    @staticmethod
+    def _combination_at(field_lists: List[List[FieldVariation]], index: int) -> tuple:
+        """
+        Return the combination at position `index` of itertools.product(*field_lists).
+
+        The last field varies fastest, so the index is decoded as a mixed-radix number
+        whose least significant digit selects from the last list.
+        """
+        combination = []
+        for values in reversed(field_lists):
+            index, digit = divmod(index, len(values))
+            combination.append(values[digit])
+        return tuple(reversed(combination))
 
     def _build_single_variation(
             self,
@@ -3,18 +3,20 @@ Variation Generator: Handles generation of field variations and prompt_format va
 """
 
 import random
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 import pandas as pd
 
-from promptsuite.augmentations.factory import AugmenterFactory
+from promptsuite.augmentations.factory import AugmenterFactory, AugmenterPool
 from promptsuite.core.models import (
     VariationConfig, FieldVariation, FieldAugmentationData
 )
 from promptsuite.core.template_keys import (
     PROMPT_FORMAT_VARIATIONS, SHUFFLE_VARIATION, ENUMERATE_VARIATION,
-    INSTRUCTION_VARIATIONS, FEW_SHOT_KEY
+    INSTRUCTION_VARIATIONS, FEW_SHOT_KEY, TYPOS_AND_NOISE_VARIATION
 )
+from promptsuite.shared.llm_cache import LLMResponseCache, get_default_llm_cache
 from promptsuite.utils.formatting import format_field_value, extract_gold_value
 
 
@@ -23,6 +25,98 @@ class VariationGenerator:
     Handles the generation of variations for fields and prompt_formats.
     """
 
+    def __init__(self):
+        # Row-level augmenters are reused across rows instead of being re-created per value
+        self.augmenter_pool = AugmenterPool()
+        # LLM-backed template variations (paraphrase, context) are cached on disk across runs
+        self.llm_cache = get_default_llm_cache()
+
+    def _augment_template_text(
+            self,
+            text: str,
+            variation_type: str,
+            variation_config: VariationConfig,
+            max_concurrency: Optional[int] = None
+    ) -> list:
+        """
+        Augment an instruction or prompt_format template with a single variation type.
+
+        Results of LLM-backed augmenters are served from / stored in the on-disk LLM cache.
+        max_concurrency caps the augmenter's own concurrent LLM requests (default: llm_concurrency).
+        """
+        augmenter = AugmenterFactory.create(
+            variation_type=variation_type,
+            n_augments=variation_config.variations_per_field,
+            api_key=variation_config.api_key,
+            seed=variation_config.seed,
+            max_concurrency=max_concurrency or variation_config.llm_concurrency
+        )
+
+        cache_key = None
+        if (self.llm_cache is not None and variation_config.api_key
+                and AugmenterFactory.requires_api_key(variation_type)):
+            # Keyed on the model the augmenter actually calls, so a different model never reuses these entries
+            cache_key = LLMResponseCache.make_key(
+                type(augmenter).__name__, f"{augmenter.platform}/{augmenter.model_name}",
+                text, augmenter.n_augments, augmenter.seed
+            )
+            cached_variations = self.llm_cache.get(cache_key)
+            if cached_variations is not None:
+                return cached_variations
+
+        # Use Factory to handle augmentation with special cases
+        variations = AugmenterFactory.augment_with_special_handling(
+            augmenter=augmenter,
+            text=text,
+            variation_type=variation_type
+        )
+
+        # The factory falls back to [text] on errors; only real LLM output is worth keeping
+        if cache_key is not None and variations and variations != [text]:
+            self.llm_cache.set(cache_key, variations)
+        return variations
+
+    def _augment_template_text_per_type(
+            self,
+            text: str,
+            variation_types: List[str],
+            variation_config: VariationConfig
+    ) -> list:
+        """
+        Augment a template with each variation type, issuing the LLM-backed types concurrently.
+
+        Local augmenters run in order on the calling thread (so seeded output is unchanged);
+        LLM-backed ones fan out over up to variation_config.llm_concurrency threads, which split that
+        budget between them so requests issued concurrently by an augmenter (e.g. ContextAugmenter)
+        never exceed llm_concurrency in total.
+
+        Returns:
+            For each variation type (in order), its augmentation result or the exception it raised
+        """
+        def augment(variation_type, max_concurrency=None):
+            try:
+                return self._augment_template_text(text, variation_type, variation_config, max_concurrency)
+            except Exception as e:
+                return e
+
+        llm_types = [
+            index for index, variation_type in enumerate(variation_types)
+            if variation_config.api_key and AugmenterFactory.requires_api_key(variation_type)
+        ]
+        if len(llm_types) < 2 or variation_config.llm_concurrency < 2:
+            return [augment(variation_type) for variation_type in variation_types]
+
+        max_workers = min(variation_config.llm_concurrency, len(llm_types))
+        per_type_concurrency = max(1, variation_config.llm_concurrency // max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {index: executor.submit(augment, variation_types[index], per_type_concurrency)
+                       for index in llm_types}
+            results = [None if index in futures else augment(variation_type)
+                       for index, variation_type in enumerate(variation_types)]
+            for index, future in futures.items():
+                results[index] = future.result()
+        return results
+
     def generate_prompt_format_variations(
             self,
             prompt_format: str,
@@ -38,22 +132,11 @@ class VariationGenerator:
         all_variations = []
 
         # Generate variations for each type
-        for variation_type in variation_types:
+        type_results = self._augment_template_text_per_type(prompt_format, variation_types, variation_config)
+        for variation_type, variations in zip(variation_types, type_results):
             try:
-                # Use Factory to create augmenter with proper configuration
-                augmenter = AugmenterFactory.create(
-                    variation_type=variation_type,
-                    n_augments=variation_config.variations_per_field,
-                    api_key=variation_config.api_key,
-                    seed=variation_config.seed
-                )
-
-                # Use Factory to handle augmentation with special cases
-                variations = AugmenterFactory.augment_with_special_handling(
-                    augmenter=augmenter,
-                    text=prompt_format,
-                    variation_type=variation_type
-                )
+                if isinstance(variations, Exception):
+                    raise variations
 
                 # Extract text from results using Factory method
                 string_variations = AugmenterFactory.extract_text_from_result(variations, variation_type)
@@ -88,19 +171,11 @@ class VariationGenerator:
             return [instruction]
         variation_types = variation_fields[INSTRUCTION_VARIATIONS]
         all_variations = []
-        for variation_type in variation_types:
+        type_results = self._augment_template_text_per_type(instruction, variation_types, variation_config)
+        for variation_type, variations in zip(variation_types, type_results):
             try:
-                augmenter = AugmenterFactory.create(
-                    variation_type=variation_type,
-                    n_augments=variation_config.variations_per_field,
-                    api_key=variation_config.api_key,
-                    seed=variation_config.seed
-                )
-                variations = AugmenterFactory.augment_with_special_handling(
-                    augmenter=augmenter,
-                    text=instruction,
-                    variation_type=variation_type
-                )
+                if isinstance(variations, Exception):
+                    raise variations
                 string_variations = AugmenterFactory.extract_text_from_result(variations, variation_type)
                 all_variations.extend(string_variations[:variation_config.variations_per_field])
             except Exception as e:
@@ -195,12 +270,14 @@ class VariationGenerator:
             variation_config: VariationConfig,
             gold_config,
             pre_generated_variations: Dict[str, List[FieldVariation]],
-            template: dict = None
+            template: dict = None,
+            noised_values: Optional[Dict[str, Dict[str, List[str]]]] = None
     ) -> Dict[str, List[FieldVariation]]:
         """
         Generate variations for row-specific fields only (excluding instruction and prompt format variations).
         This method uses pre-generated variations for instruction and prompt format to avoid
-        running the same augmenters multiple times.
+        running the same augmenters multiple times, and the column-level noise variations from
+        generate_batch_noise_variations when batch_noise is enabled.
         """
         field_variations = {}
 
@@ -238,22 +315,55 @@ class VariationGenerator:
                     row_data=row,
                     gold_config=gold_config
                 )
-                field_variations[field_name] = self.generate_field_variations(field_data)
+                field_variations[field_name] = self.generate_field_variations(
+                    field_data, (noised_values or {}).get(field_name)
+                )
             else:
                 # If field not in data, use empty variations
                 field_variations[field_name] = [FieldVariation(data='', gold_update=None)]
 
         return field_variations
 
+    def generate_batch_noise_variations(
+            self,
+            variation_fields: Dict[str, List[str]],
+            data: pd.DataFrame,
+            variation_config: VariationConfig
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Noise every text value of the columns with a typos/noise variation in one batch per column.
+
+        Returns:
+            For each such field, a mapping from each distinct text value to its noise variations
+        """
+        noised_values = {}
+        for field_name, variation_types in variation_fields.items():
+            if (field_name in [PROMPT_FORMAT_VARIATIONS, INSTRUCTION_VARIATIONS]
+                    or TYPOS_AND_NOISE_VARIATION not in variation_types or field_name not in data.columns):
+                continue
+            texts = list(dict.fromkeys(value for value in data[field_name] if isinstance(value, str)))
+            augmenter = self.augmenter_pool.get(
+                variation_type=TYPOS_AND_NOISE_VARIATION,
+                n_augments=variation_config.variations_per_field,
+                api_key=variation_config.api_key,
+                seed=variation_config.seed
+            )
+            noised_values[field_name] = dict(zip(texts, augmenter.augment_batch(texts)))
+            print(f"✅ Batch-noised {len(texts)} distinct values of '{field_name}'")
+        return noised_values
+
     def generate_field_variations(
             self,
-            field_data: FieldAugmentationData
+            field_data: FieldAugmentationData,
+            noised_values: Optional[Dict[str, List[str]]] = None
     ) -> List[FieldVariation]:
         """
         Generate chained variations for a specific field.
         If multiple augmenters are specified (e.g., shuffle and enumerate),
         apply them in a fixed order: shuffle first, then enumerate, regardless of their order in the template.
         Use deterministic sampling to select a subset of variations for consistency across rows.
+        With batch_noise, typos/noise variations come from noised_values (or augment_batch for
+        values that were not batched, e.g. ones produced by an earlier augmenter in the chain).
         """
         # If no variation types, return the original value (formatted)
         if not field_data.variation_types:
@@ -285,7 +395,7 @@ class VariationGenerator:
             next_variations = []
             next_gold_updates = []
             for idx, var in enumerate(current_variations):
-                augmenter = AugmenterFactory.create(
+                augmenter = self.augmenter_pool.get(
                     variation_type=variation_type,
                     n_augments=field_data.variation_config.variations_per_field,
                     api_key=field_data.variation_config.api_key,
@@ -350,11 +460,16 @@ class VariationGenerator:
                 else:
                     # For other augmenters, format the value first
                     formatted_var = format_field_value(var) if not isinstance(var, str) else var
-                    variations = AugmenterFactory.augment_with_special_handling(
-                        augmenter=augmenter,
-                        text=formatted_var,
-                        variation_type=variation_type
-                    )
+                    if variation_type == TYPOS_AND_NOISE_VARIATION and field_data.variation_config.batch_noise:
+                        variations = (noised_values or {}).get(formatted_var)
+                        if variations is None:
+                            variations = augmenter.augment_batch([formatted_var])[0]
+                    else:
+                        variations = AugmenterFactory.augment_with_special_handling(
+                            augmenter=augmenter,
+                            text=formatted_var,
+                            variation_type=variation_type
+                        )
                     if variations and isinstance(variations, list):
                         for v in variations:
                             next_variations.append(v)
@@ -114,6 +114,27 @@ class GenerationDefaults:
     MODEL_NAME = "meta-llama/Llama-3.3-70B-Instruct-Turbo-Free"
     API_PLATFORM = "TogetherAI"
     RANDOM_SEED = 42
+    NUM_WORKERS = 1  # Worker processes for row-parallel generation (1 = in-process)
+    PARALLEL_CHUNK_SIZE = 32  # Maximum rows sent to a worker process per task
+    LLM_CONCURRENCY = 8  # Maximum concurrent LLM requests per fan-out (paraphrase / context pre-generation)
+    BATCH_NOISE = False  # Noise whole columns with TextNoiseAugmenter.augment_batch instead of per value
+
+
+class ModelClientConstants:
+    """Connection pool settings for the shared LLM clients (see model_client.get_client)."""
+    MAX_CONNECTIONS = 100  # Maximum open connections per client
+    MAX_KEEPALIVE_CONNECTIONS = 20  # Idle connections kept open for reuse
+    KEEPALIVE_EXPIRY = 30.0  # Seconds an idle connection is kept open
+
+
+class LLMCacheConstants:
+    """Defaults for the on-disk cache of LLM-generated (paraphrase / context) variations."""
+    CACHE_DIR_ENV_VAR = "PROMPTSUITE_CACHE_DIR"  # Overrides DEFAULT_CACHE_DIR
+    DISABLE_ENV_VAR = "PROMPTSUITE_DISABLE_LLM_CACHE"  # Set to 1/true to bypass the cache
+    DEFAULT_CACHE_DIR = "~/.cache/promptsuite"
+    DB_FILENAME = "llm_variations.sqlite3"
+    MAX_SIZE_BYTES = 256 * 1024 * 1024  # Least recently used entries are evicted above this size
+    ACCESS_FLUSH_INTERVAL = 256  # Cache hits whose access times are buffered before being written in one transaction
 
 
 # Few-shot dynamic default (used in template builder UI)
@@ -0,0 +1,208 @@
+"""
+Persistent, content-addressed cache for LLM-generated variations.
+
+Paraphrase and context variations of the same template text are expensive to regenerate
+(latency and API cost), so their results are stored in a small SQLite database keyed by
+a hash of (augmenter, model, prompt text, n_augments, seed), with size-based LRU eviction.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from promptsuite.shared.constants import LLMCacheConstants
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of JSON-serializable values with least-recently-used eviction.
+
+    The database is opened lazily on first use and shared by all threads of the process.
+    The total size of the stored values is read once and then kept up to date in memory, so a set
+    only scans the table when it pushes the cache over its size limit. Access times of cache hits
+    are buffered and written in one transaction every ACCESS_FLUSH_INTERVAL hits, before eviction
+    and on close (buffered ones that are lost only affect the eviction order).
+    Any SQLite error, or an OS error creating the database directory, disables the cache for the rest of
+    the process instead of failing generation.
+    """
+
+    def __init__(self, path: str, max_size_bytes: int = LLMCacheConstants.MAX_SIZE_BYTES,
+                 access_flush_interval: int = LLMCacheConstants.ACCESS_FLUSH_INTERVAL):
+        """
+        Args:
+            path: Path of the SQLite database file (created if missing)
+            max_size_bytes: Total size of stored values above which old entries are evicted
+            access_flush_interval: Number of buffered access times that triggers writing them
+        """
+        self.path = str(path)
+        self.max_size_bytes = max_size_bytes
+        self.access_flush_interval = max(1, access_flush_interval)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+        self._total_size = 0
+        self._pending_access: Dict[str, float] = {}
+
+    @staticmethod
+    def make_key(augmenter: str, model: str, prompt: str, n_augments: int, seed: Optional[int]) -> str:
+        """Content address of an LLM augmentation request."""
+        payload = json.dumps([augmenter, model, prompt, n_augments, seed], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode this only risks the last commits on power loss, never corruption
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            self._total_size = self._stored_size(connection)
+            self._connection = connection
+            atexit.register(self.close)
+        return self._connection
+
+    @staticmethod
+    def _stored_size(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _disable(self, error: Exception):
+        print(f"⚠️ LLM cache at {self.path} disabled: {error}")
+        self._disabled = True
+        self._pending_access.clear()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key (marking it as recently used), or None on a miss."""
+        if self._disabled:
+            return None
+        with self._lock:
+            try:
+                connection = self._connect()
+                row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self._pending_access[key] = time.time()
+                if len(self._pending_access) >= self.access_flush_interval:
+                    self._flush_access_times(connection)
+                return json.loads(row[0])
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+                return None
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serializable value and evict least recently used entries if over the size limit."""
+        if self._disabled:
+            return
+        serialized = json.dumps(value, ensure_ascii=False)
+        size = len(serialized.encode('utf-8'))
+        with self._lock:
+            try:
+                connection = self._connect()
+                previous = connection.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, serialized, size, time.time())
+                )
+                self._pending_access.pop(key, None)
+                self._total_size += size - (previous[0] if previous else 0)
+                if self._total_size > self.max_size_bytes:
+                    self._evict(connection)
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+
+    def _flush_access_times(self, connection: sqlite3.Connection):
+        if not self._pending_access:
+            return
+        updates = [(accessed_at, key) for key, accessed_at in self._pending_access.items()]
+        self._pending_access.clear()
+        connection.execute("BEGIN")
+        try:
+            connection.executemany("UPDATE entries SET accessed_at = ? WHERE key = ?", updates)
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self, connection: sqlite3.Connection):
+        # Other processes may share the database, so the running total is re-read before evicting
+        self._flush_access_times(connection)
+        self._total_size = self._stored_size(connection)
+        if self._total_size <= self.max_size_bytes:
+            return
+        evicted = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if self._total_size <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            self._total_size -= size
+        connection.execute("BEGIN")
+        try:
+            connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+
+    def clear(self):
+        """Remove all entries."""
+        if self._disabled:
+            return
+        with self._lock:
+            try:
+                self._connect().execute("DELETE FROM entries")
+                self._pending_access.clear()
+                self._total_size = 0
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+
+    def __len__(self) -> int:
+        if self._disabled:
+            return 0
+        with self._lock:
+            try:
+                return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+                return 0
+
+    def close(self):
+        """Write buffered access times and close the database."""
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._flush_access_times(self._connection)
+                except sqlite3.Error:
+                    pass  # Only the eviction order of the buffered hits is lost
+                self._connection.close()
+                self._connection = None
+                atexit.unregister(self.close)
+
+
+_default_caches: Dict[str, LLMResponseCache] = {}
+_default_caches_lock = threading.Lock()
+
+
+def get_default_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide LLM variation cache, or None if disabled via PROMPTSUITE_DISABLE_LLM_CACHE.
+
+    The database lives in PROMPTSUITE_CACHE_DIR (default: ~/.cache/promptsuite).
+    """
+    if os.getenv(LLMCacheConstants.DISABLE_ENV_VAR, "").strip().lower() in ("1", "true", "yes"):
+        return None
+    cache_dir = os.getenv(LLMCacheConstants.CACHE_DIR_ENV_VAR) or LLMCacheConstants.DEFAULT_CACHE_DIR
+    path = os.path.join(os.path.expanduser(cache_dir), LLMCacheConstants.DB_FILENAME)
+    with _default_caches_lock:
+        if path not in _default_caches:
+            _default_caches[path] = LLMResponseCache(path)
+        return _default_caches[path]
@@ -1,13 +1,21 @@
 """
 Client for interacting with language models.
 """
+import asyncio
+import inspect
 import os
-from typing import List, Dict, Optional
-from together import Together
-from openai import OpenAI
+import threading
+import weakref
+from typing import Any, List, Dict, Optional, Tuple
+
+import httpx
+import openai
+import together
+from together import AsyncTogether, Together
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 
-from promptsuite.shared.constants import GenerationDefaults
+from promptsuite.shared.constants import GenerationDefaults, ModelClientConstants
 from promptsuite.core.exceptions import APIKeyMissingError
 
 # Load environment variables from .env file
@@ -27,6 +35,127 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 # if OPENAI_API_KEY:
 #     openai_client = OpenAI(api_key=OPENAI_API_KEY)
 
+# Clients are pooled per (platform, api_key) so their HTTP connections (and TLS sessions) are reused
+# across calls and threads instead of being set up again for every request
+_client_pool_settings = {
+    'max_connections': ModelClientConstants.MAX_CONNECTIONS,
+    'max_keepalive_connections': ModelClientConstants.MAX_KEEPALIVE_CONNECTIONS,
+    'keepalive_expiry': ModelClientConstants.KEEPALIVE_EXPIRY,
+}
+_clients: Dict[Tuple[str, str], Any] = {}
+_clients_lock = threading.Lock()
+# Async clients hold connections bound to the event loop that created them, so they are pooled per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], Any]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def configure_client_pool(max_connections: Optional[int] = None,
+                          max_keepalive_connections: Optional[int] = None,
+                          keepalive_expiry: Optional[float] = None) -> None:
+    """
+    Configure the HTTP connection pool used by the shared LLM clients.
+
+    Existing clients are closed so that the new settings apply to all subsequent requests.
+
+    Args:
+        max_connections: Maximum open connections per client (should be >= the number of parallel workers)
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+    """
+    with _clients_lock:
+        if max_connections is not None:
+            _client_pool_settings['max_connections'] = max_connections
+        if max_keepalive_connections is not None:
+            _client_pool_settings['max_keepalive_connections'] = max_keepalive_connections
+        if keepalive_expiry is not None:
+            _client_pool_settings['keepalive_expiry'] = keepalive_expiry
+    close_clients()
+
+
+def get_client_pool_settings() -> Dict[str, Any]:
+    """Return the current connection pool settings."""
+    return dict(_client_pool_settings)
+
+
+def get_client(platform: str, api_key: str):
+    """
+    Get the shared client for a platform and API key, creating it on first use.
+
+    Clients are thread-safe and keep a pool of keep-alive connections.
+    """
+    key = (platform, api_key)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _create_client(platform, api_key)
+                _clients[key] = client
+    return client
+
+
+def _create_client(platform: str, api_key: str):
+    limits = httpx.Limits(**_client_pool_settings)
+    if platform == "TogetherAI":
+        # Older Together SDKs manage their own session and do not accept an http_client
+        if hasattr(together, "DefaultHttpxClient"):
+            return Together(api_key=api_key, http_client=together.DefaultHttpxClient(limits=limits))
+        return Together(api_key=api_key)
+    elif platform == "OpenAI":
+        return OpenAI(api_key=api_key, http_client=openai.DefaultHttpxClient(limits=limits))
+    raise ValueError(f"Unsupported platform: {platform}. Supported platforms: TogetherAI, OpenAI")
+
+
+def get_async_client(platform: str, api_key: str):
+    """
+    Get the async client for a platform and API key on the running event loop, creating it on first use.
+
+    Call aclose_async_clients() before the loop finishes to release its connections.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get((platform, api_key))
+        if client is None:
+            client = _create_async_client(platform, api_key)
+            loop_clients[(platform, api_key)] = client
+    return client
+
+
+def _create_async_client(platform: str, api_key: str):
+    limits = httpx.Limits(**_client_pool_settings)
+    if platform == "TogetherAI":
+        if hasattr(together, "DefaultAsyncHttpxClient"):
+            return AsyncTogether(api_key=api_key, http_client=together.DefaultAsyncHttpxClient(limits=limits))
+        return AsyncTogether(api_key=api_key)
+    elif platform == "OpenAI":
+        return AsyncOpenAI(api_key=api_key, http_client=openai.DefaultAsyncHttpxClient(limits=limits))
+    raise ValueError(f"Unsupported platform: {platform}. Supported platforms: TogetherAI, OpenAI")
+
+
+async def aclose_async_clients() -> None:
+    """Close the async clients created on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        loop_clients = _async_clients.pop(loop, {})
+    for client in loop_clients.values():
+        close = getattr(client, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+
+def close_clients() -> None:
+    """Close and forget all pooled clients (they are re-created on next use)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if close is not None:
+            close()
+
 
 def get_model_response(messages: List[Dict[str, str]],
                        model_name: str = GenerationDefaults.MODEL_NAME,
@@ -63,7 +192,7 @@ def _get_together_response(messages: List[Dict[str, str]], model_name: str, max_
     if not current_api_key:
         raise APIKeyMissingError("TogetherAI")
 
-    client = Together(api_key=current_api_key)
+    client = get_client("TogetherAI", current_api_key)
 
     # Prepare parameters
     params = {
@@ -87,7 +216,7 @@ def _get_openai_response(messages: List[Dict[str, str]], model_name: str, max_to
     if not current_api_key:
         raise APIKeyMissingError("OpenAI")
 
-    client = OpenAI(api_key=current_api_key)
+    client = get_client("OpenAI", current_api_key)
 
     # Prepare parameters
     params = {
@@ -104,6 +233,52 @@ def _get_openai_response(messages: List[Dict[str, str]], model_name: str, max_to
     return response.choices[0].message.content
 
 
+async def get_model_response_async(messages: List[Dict[str, str]],
+                                   model_name: str = GenerationDefaults.MODEL_NAME,
+                                   max_tokens: Optional[int] = None,
+                                   platform: str = "TogetherAI",
+                                   temperature: float = 0.0,
+                                   api_key: Optional[str] = None) -> str:
+    """
+    Async version of get_model_response, using the pooled async client of the running event loop.
+
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys
+        model_name: Name of the model to use (defaults to the value in constants)
+        max_tokens: Maximum number of tokens for the response
+        platform: Platform to use ("TogetherAI" or "OpenAI")
+        temperature: Temperature for response generation (0.0 = deterministic, 1.0 = creative)
+        api_key: Optional API key to use for the platform
+
+    Returns:
+        The model's response text
+    """
+    if platform == "TogetherAI":
+        current_api_key = api_key if api_key is not None else TOGETHER_API_KEY
+    elif platform == "OpenAI":
+        current_api_key = api_key if api_key is not None else OPENAI_API_KEY
+    else:
+        raise ValueError(f"Unsupported platform: {platform}. Supported platforms: TogetherAI, OpenAI")
+    if not current_api_key:
+        raise APIKeyMissingError(platform)
+
+    client = get_async_client(platform, current_api_key)
+
+    # Prepare parameters
+    params = {
+        "model": model_name,
+        "messages": messages,
+        "temperature": temperature,
+    }
+
+    # Add max_tokens if provided
+    if max_tokens is not None:
+        params["max_tokens"] = max_tokens
+
+    response = await client.chat.completions.create(**params)
+    return response.choices[0].message.content
+
+
 def get_completion(prompt: str,
                    model_name: str = GenerationDefaults.MODEL_NAME,
                    max_tokens: Optional[int] = None,